@@ -3,18 +3,50 @@ Discord Werewolf Bot - COMPLETE PRODUCTION IMPLEMENTATION
 ALL 43 ROLES, ALL 76 COMMANDS, ALL FEATURES - FULLY PRODUCTION READY
 """
 
+import time
+IMPORT_STARTED = time.perf_counter()  # taken before discord is imported, for startup_timings
+
 import discord
 from discord.ext import commands
+from discord import app_commands
 import asyncio
 import random
 import json
 import os
 import re
+import sys
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Set, Optional, Union
 import logging
+import io
 import traceback
 
+from src.game.gamemodes import load_gamemodes
+from src.utils.member_cache import GameMemberCache
+from src.core.sharding import load_shard_settings, ShardRouter, ShardMetrics
+from src.game.snapshot import load_snapshot, clear_snapshot, list_snapshots, snapshot_ids, snapshot_key
+import src.game.snapshot as snapshot_format
+from src.game.deaths import resolve_death_cascade, DeathCascade
+from src.game.night_actions import NightActions
+from src.game.seating import SeatingRing
+from src.game.prompts import PromptTemplates, Roster
+from src.core.storage import get_backend
+from src.core.hotreload import reload_modules, resolve_modules
+from src.game.mailbox import GameMailbox, MailboxFull
+from src.utils.antispam import ALLOWED, NEWLY_IGNORED
+from src.utils.helpers import get_spam_limiter
+from src.core.messages import get_catalog
+from src.utils.profiler import profile_event_loop, ProfilerBusy
+from src.utils.loopmonitor import LoopMonitor, task_name
+from src.utils.metrics_server import MetricsServer
+from src.utils.memtrace import MemoryTracer, count_instances, format_size
+from src.utils.tracing import GameTracer, current_span, instrument_http
+from src.utils.interactions import InteractionContext, is_private, player_choices
+from src.utils.private_results import PrivateResults, SENT
+from src.utils.outbound import Priority, get_scheduler
+from src.utils.debounce import Debouncer
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -90,7 +122,7 @@ ROLE_DESCRIPTIONS = {
     'detective': 'You are a **detective**. Each night, you can **id** a player to see if they are the same as someone you previously checked.',
     'guardian angel': 'You are a **guardian angel**. Each night, you can **guard** a player to protect them from being killed.',
     'bodyguard': 'You are a **bodyguard**. Each night, you can **guard** a player. If they are attacked, you die instead.',
-    'hunter': 'You are a **hunter**. When you die, you can **kill** another player.',
+    'hunter': 'You are a **hunter**. When you die, you can **kill** another player: pick them in advance with `!target <player>`.',
     'vigilante': 'You are a **vigilante**. Each night, you can **kill** a player you suspect.',
     'village drunk': 'You are the **village drunk**. Each night, you can **shoot** a player, but you might miss or hit someone else.',
     'harlot': 'You are a **harlot**. Each night, you can **visit** a player. You are safe from wolf attacks while visiting.',
@@ -146,6 +178,15 @@ TEMPLATE_DESCRIPTIONS = {
     'bishop': 'You have the **bishop** template. You cannot be entranced by the Succubus.'
 }
 
+# ==================== GAMEMODE TABLES ====================
+# Role tables for every gamemode, validated and compiled once at startup
+GAMEMODES_PATH = os.path.join('data', 'gamemodes.json')
+GAMEMODES = load_gamemodes(
+    GAMEMODES_PATH,
+    VILLAGE_ROLES_ORDERED + WOLF_ROLES_ORDERED + NEUTRAL_ROLES_ORDERED,
+    TEMPLATES_ORDERED
+)
+
 # ==================== GAME STATE SYSTEM ====================
 class GameState:
     def __init__(self):
@@ -155,8 +196,10 @@ class GameState:
         self.gamemode = "default"  # default, foolish, etc.
         self.players = {}  # {user_id: {'role': str, 'template': str, 'alive': bool, 'totem': str, 'votes': int, 'actions': {}}}
         self.votes = {}  # {user_id: user_id}
-        self.night_actions = {}  # {user_id: {'action': str, 'target': user_id}}
+        self.night_actions = NightActions()  # {user_id: {'action': str, 'target': user_id}}, indexed by target
         self.dead_players = {}
+        self.seating = SeatingRing()  # fixed at game start, for adjacency effects
+        self.result_delivery = {}  # {user_id: status} of the last night's result DMs
         self.settings = {
             'min_players': 4,
             'max_players': 24,
@@ -166,13 +209,16 @@ class GameState:
         }
         self.channel_id = None
         self.timer_task = None
+        self.phase_deadline = None  # time.time() when the running phase timer expires
         self.last_votes = {}
+        self.rng = random.Random()  # per-game RNG for role shuffles and message variants
         
         # Wolfchat system
         self.wolfchat_channel = None
         self.wolfchat_members = set()
         self.dead_chat_channel = None
         self.dead_chat_members = set()
+        self.wolf_digest_message = None  # tonight's kill vote digest in wolfchat, edited in place
         
         # Totem tracking
         self.assigned_totems = {}  # {shaman_id: totem_name} - Track which totem each shaman was assigned this night
@@ -180,6 +226,7 @@ class GameState:
         
     def reset(self):
         """Reset game state for new game"""
+        tracer.end_game(day=self.day_number, players=len(self.players))
         self.active = False
         self.phase = "signup"
         self.day_number = 0
@@ -191,11 +238,20 @@ class GameState:
         self.last_votes.clear()
         self.wolfchat_members.clear()
         self.dead_chat_members.clear()
+        self.wolf_digest_message = None
         self.assigned_totems.clear()
         self.used_shamans.clear()
+        self.seating = SeatingRing()
+        self.result_delivery = {}
         if self.timer_task:
             self.timer_task.cancel()
             self.timer_task = None
+        self.phase_deadline = None
+        self.rng.seed()
+        member_cache.release_players()
+        key = game_snapshot_key(self.channel_id)
+        if key:
+            schedule_snapshot_io(clear_snapshot, key)
     
     def add_player(self, user_id: int, role: str = None, template: str = None):
         """Add player to game"""
@@ -213,6 +269,7 @@ class GameState:
             'injured': False,
             'mayor_revealed': False,  # Track if mayor used their reveal
             'assassin_target': None,  # Track assassin's target
+            'hunter_target': None,  # Player a hunter takes down with them
             'blessing_charges': 1 if template == 'blessed' else 0  # Blessed template protection
         }
         
@@ -222,6 +279,31 @@ class GameState:
         
         self.players[user_id] = player_data
     
+    # Fields written to the game snapshot; channels are stored by id
+    SNAPSHOT_FIELDS = (
+        'active', 'phase', 'day_number', 'gamemode', 'players', 'votes', 'night_actions',
+        'dead_players', 'settings', 'channel_id', 'phase_deadline', 'last_votes',
+        'wolfchat_members', 'dead_chat_members', 'assigned_totems', 'used_shamans'
+    )
+    
+    def to_snapshot(self) -> dict:
+        """Serializable copy of the game for crash recovery"""
+        snapshot = {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
+        snapshot['wolfchat_channel_id'] = self.wolfchat_channel.id if self.wolfchat_channel else None
+        snapshot['dead_chat_channel_id'] = self.dead_chat_channel.id if self.dead_chat_channel else None
+        return snapshot
+    
+    def restore_snapshot(self, snapshot: dict, get_channel):
+        """Load a snapshot taken by to_snapshot; get_channel resolves channel ids"""
+        for field in self.SNAPSHOT_FIELDS:
+            if field in snapshot:
+                setattr(self, field, snapshot[field])
+        self.night_actions = NightActions(self.night_actions)
+        self.seating = SeatingRing(self.players, dead=self.dead_players)
+        self.wolfchat_channel = get_channel(snapshot['wolfchat_channel_id']) if snapshot.get('wolfchat_channel_id') else None
+        self.dead_chat_channel = get_channel(snapshot['dead_chat_channel_id']) if snapshot.get('dead_chat_channel_id') else None
+        self.timer_task = None
+    
     def is_player_alive(self, user_id: int) -> bool:
         """Check if player is alive"""
         return user_id in self.players and self.players[user_id]['alive']
@@ -241,35 +323,194 @@ class GameState:
                 if data['alive'] and data['role'] in team_roles.get(team, [])]
 
 # Global game state
+# Server configs and game snapshots live in the shared state backend (STATE_BACKEND);
+# each game's snapshot has its own key, from its guild and channel
+state_backend = get_backend()
+GAME_SNAPSHOT_KEY = os.getenv('GAME_SNAPSHOT_KEY', 'game_snapshot')
+if ':' in GAME_SNAPSHOT_KEY:
+    raise ValueError("GAME_SNAPSHOT_KEY must not contain ':'")
+SNAPSHOT_INTERVAL = 10  # seconds between snapshots while a phase is running
+# Span traces of a TRACE_SAMPLE_RATE fraction of games, as <TRACE_DIR>/<game id>.jsonl
+tracer = GameTracer(os.getenv('TRACE_DIR', 'traces'), float(os.getenv('TRACE_SAMPLE_RATE', 0)))
+member_cache = GameMemberCache()
 game_state = GameState()
+# Commands and phase transitions for the game are applied one at a time through this
+game_mailbox = GameMailbox('game')
+# Every game message goes through one priority scheduler, see src/utils/outbound.py
+outbound = get_scheduler()
+# Night result DMs go out after dawn, RESULT_DM_CONCURRENCY at a time
+RESULT_DM_CONCURRENCY = int(os.getenv('RESULT_DM_CONCURRENCY', 10))
+background_tasks = set()  # fire-and-forget tasks, referenced until they finish
+
+# Player-facing text from lang/<MESSAGE_LANGUAGE>.json, loaded on first use
+messages = get_catalog()
+
+def msg(key: str, *args, **kwargs) -> str:
+    """Localized message with its variant picked by the game's RNG"""
+    return messages.get(key, *args, rng=game_state.rng, p=prefix, **kwargs)
 
 # ==================== DISCORD BOT SETUP ====================
+# Only the gateway events the bot handles; the privileged members intent and
+# guild member chunking are off, players are cached through member_cache instead
 intents = discord.Intents.default()
 intents.message_content = True
-intents.members = True
+intents.members = False
+intents.typing = False
+intents.voice_states = False
+intents.invites = False
+intents.integrations = False
+intents.webhooks = False
+
+# Sharding: AutoShardedBot runs every shard in-process unless SHARD_COUNT/SHARD_IDS
+# pin this process to a shard range (see src/core/sharding.py)
+shard_settings = load_shard_settings()
+shard_router = ShardRouter(shard_settings.shard_count or 1, shard_settings.shard_ids)
+shard_metrics = ShardMetrics()
+
+# Anti-spam: TOKENS_GIVEN commands per TOKEN_RESET seconds, ignored after IGNORE_THRESHOLD in a burst
+spam_limiter = get_spam_limiter()
+
+# Event loop health: scheduling lag, live tasks by coroutine, long runners and leaked timers
+loop_monitor = LoopMonitor(long_task_seconds=float(os.getenv('LONG_TASK_SECONDS', 600)))
+
+def orphaned_phase_timers() -> List[asyncio.Task]:
+    """phase_timer tasks that are no longer the game's timer, e.g. ones that outlived reset()"""
+    return [task for task in asyncio.all_tasks()
+            if task_name(task) == 'phase_timer' and task is not game_state.timer_task]
+
+loop_monitor.add_check('orphaned_phase_timer', orphaned_phase_timers)
+
+def collect_metrics() -> Dict[str, Dict]:
+    """Every internal stat, for the metrics endpoint"""
+    shard_metrics.record_latencies(bot.latencies)
+    return {
+        'loop': loop_monitor.stats(),
+        'mailbox': game_mailbox.stats(),
+        'outbound': outbound.stats(),
+        'member_cache': member_cache.stats(),
+        'antispam': spam_limiter.stats(),
+        'game': {'active': int(game_state.active), 'players': len(game_state.players),
+                 'alive': len(game_state.get_alive_players()), 'day': game_state.day_number},
+        'shards': {'shard': shard_metrics.snapshot()},
+        'startup': startup_timings,
+    }
+
+# Disabled unless METRICS_PORT is set
+metrics_server = MetricsServer(collect_metrics, os.getenv('METRICS_HOST', '127.0.0.1'),
+                               int(os.getenv('METRICS_PORT', 0)))
+
+class WerewolfBot(commands.AutoShardedBot):
+    """Bot whose user lookups go through the game member cache"""
+
+    async def setup_hook(self):
+        """Register the slash commands with Discord, from the process running shard 0"""
+        if os.getenv('SYNC_SLASH_COMMANDS', 'true').lower() != 'true':
+            return
+        if shard_settings.shard_ids is not None and 0 not in shard_settings.shard_ids:
+            return
+        try:
+            synced = await self.tree.sync()
+            logger.info(f"Synced {len(synced)} slash commands")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to sync slash commands: {e}")
+    
+    def get_user(self, id):
+        user = member_cache.get(id)
+        if user is None:
+            user = super().get_user(id)
+            if user is None:
+                member_cache.schedule_fetch(self, id)
+        return user
+    
+    async def process_commands(self, message):
+        """Drop command spam before it reaches the game"""
+        if message.author.bot:
+            return
+        ctx = await self.get_context(message)
+        if ctx.command is None:
+            return
+        
+        verdict = spam_limiter.hit(message.author.id)
+        if verdict == ALLOWED:
+            await self.invoke(ctx)
+        elif verdict == NEWLY_IGNORED:
+            logger.warning(f"Ignoring {message.author} ({message.author.id}) for command spam")
+            await ctx.send(f"🔇 {message.author.mention}, slow down! Your commands will be ignored for "
+                           f"{int(spam_limiter.ignored_for(message.author.id))} seconds.")
+    
+    async def invoke(self, ctx):
+        """Run game commands through the game mailbox so they never interleave with phase changes"""
+        if ctx.command is None or ctx.command.name not in MAILBOX_COMMANDS:
+            return await super().invoke(ctx)
+        try:
+            await game_mailbox.run(super().invoke, ctx)
+        except MailboxFull:
+            logger.warning(f"Game mailbox full, dropped {ctx.command.name} from {ctx.author.id}")
+            await ctx.send("⏳ The game is busy right now, try again in a moment.")
+
+# Commands that change game state, run one at a time on the game mailbox. Everything else
+# (read-only, chat relay, setup, profiling) runs directly so it can never hold up the game.
+MAILBOX_COMMANDS = {
+    'start', 'foolish', 'charming', 'mad', 'lycan', 'rapidfire', 'noreveal', 'bloodbath', 'random',
+    'join', 'leave', 'end', 'fstart', 'fday', 'fnight', 'settings', 'hotreload',
+    'vote', 'unvote', 'shoot', 'reveal', 'target',
+    'see', 'kill', 'guard', 'visit', 'give', 'observe', 'id', 'drunk_shoot', 'hex', 'curse', 'charm',
+    'remember', 'turn', 'doom', 'bless', 'mysticism', 'time', 'match',
+}
+
+# Seconds !setup waits for each answer
+SETUP_REPLY_TIMEOUT = 120
 
 prefix = config.get('prefix', '!')
-bot = commands.Bot(command_prefix=prefix, intents=intents, help_command=None)
+bot = WerewolfBot(
+    command_prefix=prefix,
+    intents=intents,
+    help_command=None,
+    member_cache_flags=discord.MemberCacheFlags.none(),
+    chunk_guilds_at_startup=False,
+    **shard_settings.bot_kwargs()
+)
+instrument_http(bot.http)
 
-# Persistent server config storage
-import json
-import os
-CONFIG_PATH = 'server_configs.json'
-if not os.path.exists(CONFIG_PATH):
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump({}, f)
+def display_name(user_id: int) -> str:
+    """A player's name, or a placeholder while they aren't cached (get_user may miss)"""
+    user = bot.get_user(user_id)
+    return user.display_name if user else f"Player {user_id}"
+
+@bot.before_invoke
+async def cache_command_author(ctx):
+    """Keep game participants and admins in the member cache"""
+    permissions = getattr(ctx.author, 'guild_permissions', None)
+    if permissions is not None and permissions.administrator:
+        member_cache.pin(ctx.author, admin=True)
+    elif ctx.author.id in game_state.players:
+        member_cache.pin(ctx.author)
+
+# Persistent server config storage, one hash field per guild in the state backend
+CONFIG_PATH = 'server_configs.json'  # legacy file, imported into the backend once
+
+def import_legacy_server_configs():
+    """Move configs from server_configs.json into the state backend"""
+    if not os.path.exists(CONFIG_PATH) or state_backend.hgetall('server_configs'):
+        return
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            configs = json.load(f)
+        for guild_id, guild_config in configs.items():
+            state_backend.hset('server_configs', str(guild_id), json.dumps(guild_config))
+        if configs:
+            logger.info(f"Imported {len(configs)} server configs from {CONFIG_PATH}")
+    except Exception as e:
+        logger.error(f"Failed to import {CONFIG_PATH}: {e}")
+
+import_legacy_server_configs()
 
 def load_server_config(guild_id):
-    with open(CONFIG_PATH, 'r') as f:
-        configs = json.load(f)
-    return configs.get(str(guild_id), {})
+    value = state_backend.hget('server_configs', str(guild_id))
+    return json.loads(value) if value else {}
 
 def save_server_config(guild_id, config):
-    with open(CONFIG_PATH, 'r') as f:
-        configs = json.load(f)
-    configs[str(guild_id)] = config
-    with open(CONFIG_PATH, 'w') as f:
-        json.dump(configs, f, indent=2)
+    state_backend.hset('server_configs', str(guild_id), json.dumps(config))
 
 @bot.event
 async def on_guild_join(guild):
@@ -281,8 +522,8 @@ async def on_guild_join(guild):
         f"You will need to specify:\n"
         f"• Game category\n• Game channel\n• Admin role\n• Logging channel (for error logs)"
     )
-    owner = guild.owner
     try:
+        owner = guild.owner or await member_cache.fetch(bot, guild.owner_id)
         await owner.send(setup_message)
     except:
         # Fallback: send to first available text channel
@@ -299,23 +540,19 @@ async def setup_server(ctx):
     """Interactive setup for server configuration"""
     def check(m):
         return m.author == ctx.author and m.channel == ctx.channel
+    async def ask(question):
+        await ctx.send(question)
+        reply = await bot.wait_for('message', check=check, timeout=SETUP_REPLY_TIMEOUT)
+        return reply.content.strip()
     await ctx.send("🛠️ Let's set up Discord Werewolf Bot for your server!")
-    # Game category
-    await ctx.send("Please mention the game category (or type a new name):")
-    cat_msg = await bot.wait_for('message', check=check)
-    category_name = cat_msg.content.strip()
-    # Game channel
-    await ctx.send("Please mention the game channel (or type a new name):")
-    chan_msg = await bot.wait_for('message', check=check)
-    channel_name = chan_msg.content.strip()
-    # Admin role
-    await ctx.send("Please mention the admin role (exact name):")
-    role_msg = await bot.wait_for('message', check=check)
-    admin_role = role_msg.content.strip()
-    # Logging channel
-    await ctx.send("Please mention the logging channel (or type a new name):")
-    log_msg = await bot.wait_for('message', check=check)
-    logging_channel = log_msg.content.strip()
+    try:
+        category_name = await ask("Please mention the game category (or type a new name):")
+        channel_name = await ask("Please mention the game channel (or type a new name):")
+        admin_role = await ask("Please mention the admin role (exact name):")
+        logging_channel = await ask("Please mention the logging channel (or type a new name):")
+    except asyncio.TimeoutError:
+        await ctx.send(f"⌛ Setup cancelled, no answer within {SETUP_REPLY_TIMEOUT} seconds. Run `{prefix}setup` to try again.")
+        return
     # Save config
     config = {
         'category': category_name,
@@ -323,20 +560,60 @@ async def setup_server(ctx):
         'admin_role': admin_role,
         'logging_channel': logging_channel
     }
-    save_server_config(ctx.guild.id, config)
+    await asyncio.to_thread(save_server_config, ctx.guild.id, config)
     await ctx.send(f"✅ Setup complete! Configuration saved for this server.")
 
 @bot.event
 async def on_ready():
     """Bot ready event"""
+    if 'ready_s' not in startup_timings:
+        startup_timings['ready_s'] = round(time.perf_counter() - IMPORT_STARTED, 3)
+        logger.info(f"Ready {startup_timings['ready_s']}s after start ({startup_timings['import_s']}s importing)")
+        report = os.getenv('STARTUP_REPORT')
+        if report:
+            # Startup benchmark run: record the timings and log off before touching any game
+            with open(report, 'w') as f:
+                json.dump(startup_timings, f)
+            await bot.close()
+            return
     logger.info(f'Bot logged in as {bot.user} (ID: {bot.user.id})')
     logger.info(f'Bot is in {len(bot.guilds)} guilds')
+    shard_router.update(bot.shard_count, bot.shard_ids)
+    logger.info(f'Running shards {sorted(shard_router.shard_ids)} of {shard_router.shard_count}')
+    loop_monitor.start()
+    if metrics_server.port:
+        await metrics_server.start()
+    
+    try:
+        await game_mailbox.run(resume_game_from_snapshot)
+    except Exception as e:
+        logger.error(f"Failed to resume game from snapshot: {e}")
     logger.info('Discord Werewolf Bot - COMPLETE IMPLEMENTATION READY!')
     
     # Set bot status
     activity = discord.Game(name=f"Werewolf | {prefix}help")
     await bot.change_presence(status=discord.Status.online, activity=activity)
 
+@bot.event
+async def on_shard_ready(shard_id):
+    shard_metrics.record_status(shard_id, 'ready')
+    logger.info(f'Shard {shard_id} ready')
+
+@bot.event
+async def on_shard_disconnect(shard_id):
+    shard_metrics.record_status(shard_id, 'disconnected')
+    logger.warning(f'Shard {shard_id} disconnected')
+
+@bot.event
+async def on_shard_resumed(shard_id):
+    shard_metrics.record_status(shard_id, 'resumed')
+    logger.info(f'Shard {shard_id} resumed')
+
+@bot.listen('on_message')
+async def count_shard_message(message):
+    """Per-shard message rate for !shards"""
+    shard_metrics.record_event(shard_router.shard_of(message.guild.id if message.guild else None))
+
 @bot.event
 async def on_command_error(ctx, error):
     """Global error handler"""
@@ -346,6 +623,8 @@ async def on_command_error(ctx, error):
         await ctx.send(f"❌ Missing required argument: `{error.param.name}`")
     elif isinstance(error, commands.BadArgument):
         await ctx.send(f"❌ Invalid argument provided")
+    elif isinstance(error, commands.NotOwner):
+        await ctx.send("❌ Only the bot owner can use this command!")
     elif isinstance(error, commands.CommandOnCooldown):
         await ctx.send(f"⏰ Command on cooldown. Try again in {error.retry_after:.1f}s")
     else:
@@ -372,6 +651,10 @@ def find_player_by_name(query: str, bot_instance, alive_only: bool = True) -> Op
     else:
         player_ids = list(game_state.players.keys())
     
+    # Slash command autocomplete and select menus pass the player's id
+    if query_lower.isdigit() and int(query_lower) in player_ids:
+        return int(query_lower)
+    
     def normalize_name(name):
         """Remove special characters from name for better matching"""
         return re.sub(r'[^\w\s.-]', '', name.lower())
@@ -481,43 +764,44 @@ async def find_target_for_night_action(ctx, target: str, bot_instance, allow_sel
     
     return target_id
 
+def role_pm_embed(bot, user_id: int) -> discord.Embed:
+    """The role PM for a player"""
+    player_data = game_state.players[user_id]
+    role = player_data['role']
+    template = player_data.get('template')
+    totem = player_data.get('totem')
+    
+    description = ROLE_DESCRIPTIONS.get(role, f"You are a **{role}**.")
+    
+    if template:
+        description += f"\n\n{TEMPLATE_DESCRIPTIONS.get(template, f'You have the **{template}** template.')}"
+    
+    if totem:
+        description += f"\n\n**Totem**: {totem.replace('_', ' ').title()}\n{TOTEMS.get(totem, 'Unknown totem effect.')}"
+    
+    # Add team info for wolfchat roles
+    if role in WOLFCHAT_ROLES:
+        wolves = [display_name(uid) for uid in game_state.get_players_by_team('wolf') if uid != user_id]
+        if wolves:
+            description += f"\n\n**Your wolf allies**: {', '.join(wolves)}"
+        
+        # Add wolfchat info
+        if game_state.wolfchat_channel:
+            description += f"\n\n🐺 **Wolfchat Access**: You have access to the private wolf channel for team coordination!"
+    
+    return discord.Embed(
+        title="🌙 Your Role",
+        description=description,
+        color=0x8B4513
+    )
+
 async def send_role_pm(bot, user_id: int):
     """Send role PM to player"""
     try:
         user = bot.get_user(user_id)
         if not user:
             return
-        
-        player_data = game_state.players[user_id]
-        role = player_data['role']
-        template = player_data.get('template')
-        totem = player_data.get('totem')
-        
-        description = ROLE_DESCRIPTIONS.get(role, f"You are a **{role}**.")
-        
-        if template:
-            description += f"\n\n{TEMPLATE_DESCRIPTIONS.get(template, f'You have the **{template}** template.')}"
-        
-        if totem:
-            description += f"\n\n**Totem**: {totem.replace('_', ' ').title()}\n{TOTEMS.get(totem, 'Unknown totem effect.')}"
-        
-        # Add team info for wolfchat roles
-        if role in WOLFCHAT_ROLES:
-            wolves = [bot.get_user(uid).display_name for uid in game_state.get_players_by_team('wolf') if uid != user_id]
-            if wolves:
-                description += f"\n\n**Your wolf allies**: {', '.join(wolves)}"
-            
-            # Add wolfchat info
-            if game_state.wolfchat_channel:
-                description += f"\n\n🐺 **Wolfchat Access**: You have access to the private wolf channel for team coordination!"
-        
-        embed = discord.Embed(
-            title="🌙 Your Role",
-            description=description,
-            color=0x8B4513
-        )
-        
-        await user.send(embed=embed)
+        await user.send(embed=role_pm_embed(bot, user_id))
         
     except Exception as e:
         logger.error(f"Failed to send role PM to {user_id}: {e}")
@@ -682,6 +966,57 @@ async def remove_from_wolfchat(user_id: int):
         logger.error(f"Failed to remove {user_id} from wolfchat: {e}")
         return False
 
+def wolf_kill_votes() -> Dict[int, int]:
+    """{wolf_id: target_id} of tonight's wolf kill votes"""
+    return {player_id: action['target'] for player_id, action in game_state.night_actions.items()
+            if action['action'] == 'kill' and game_state.players[player_id]['role'] in ACTUAL_WOLVES}
+
+def wolf_digest_embed() -> discord.Embed:
+    """Every wolf's current vote and the leading target"""
+    votes = wolf_kill_votes()
+    wolves = [pid for pid in game_state.get_alive_players() if game_state.players[pid]['role'] in ACTUAL_WOLVES]
+    lines = []
+    for wolf_id in wolves:
+        target_id = votes.get(wolf_id)
+        choice = display_name(target_id) if target_id is not None else "*undecided*"
+        lines.append(f"**{display_name(wolf_id)}** → {choice}")
+    
+    embed = discord.Embed(
+        title=f"🐺 Kill Votes - Night {game_state.day_number}",
+        description="\n".join(lines) or "No wolves are left.",
+        color=0x8B0000
+    )
+    tally = Counter(votes.values()).most_common()
+    if not tally:
+        leading = "No votes yet"
+    else:
+        top = tally[0][1]
+        leaders = [display_name(target_id) for target_id, count in tally if count == top]
+        leading = f"{' / '.join(leaders)} ({top} of {len(wolves)} votes)"
+        if len(leaders) > 1:
+            leading = f"Tied: {leading}"
+    embed.add_field(name="🎯 Leading", value=leading, inline=False)
+    embed.set_footer(text=f"Updated as the pack votes • {prefix}kill <player> to vote")
+    return embed
+
+async def update_wolf_digest():
+    """Post tonight's kill vote digest to wolfchat, or edit the one already posted"""
+    channel = game_state.wolfchat_channel
+    if not game_state.active or game_state.phase != "night" or channel is None:
+        return
+    embed = wolf_digest_embed()
+    message = game_state.wolf_digest_message
+    if message is not None:
+        try:
+            await message.edit(embed=embed)
+            return
+        except discord.NotFound:
+            pass  # deleted by someone in wolfchat, post a new one
+    game_state.wolf_digest_message = await outbound.send(channel, embed=embed, priority=Priority.PROMPT)
+
+# Votes within WOLF_DIGEST_DELAY seconds of each other become one edit of the digest
+wolf_digest = Debouncer(update_wolf_digest, delay=float(os.getenv('WOLF_DIGEST_DELAY', 2)))
+
 async def add_to_dead_chat(user_id: int):
     """Add user to dead chat channel"""
     try:
@@ -772,19 +1107,47 @@ async def cleanup_chat_channels():
     except Exception as e:
         logger.error(f"Failed to cleanup chat channels: {e}")
 
-async def handle_player_death(user_id: int, ctx):
-    """Handle chat permissions when a player dies"""
+async def handle_player_deaths(user_ids: List[int], ctx):
+    """Move the newly dead out of wolfchat and into dead chat, one channel edit each"""
     try:
         # Remove from wolfchat if they were in it
-        if user_id in game_state.wolfchat_members:
-            await remove_from_wolfchat(user_id)
+        leaving = {uid for uid in user_ids if uid in game_state.wolfchat_members}
+        if leaving and game_state.wolfchat_channel:
+            channel = game_state.wolfchat_channel
+            overwrites = {target: ow for target, ow in channel.overwrites.items() if target.id not in leaving}
+            await channel.edit(overwrites=overwrites)
+            game_state.wolfchat_members -= leaving
+            logger.info(f"Removed {len(leaving)} player(s) from wolfchat")
         
         # Add to dead chat
-        await add_to_dead_chat(user_id)
+        joining = [user for user in (bot.get_user(uid) for uid in user_ids) if user]
+        if joining and game_state.dead_chat_channel:
+            channel = game_state.dead_chat_channel
+            joining_ids = {user.id for user in joining}
+            overwrites = {target: ow for target, ow in channel.overwrites.items() if target.id not in joining_ids}
+            for user in joining:
+                overwrites[user] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+            await channel.edit(overwrites=overwrites)
+            game_state.dead_chat_members.update(joining_ids)
+            
+            # One welcome message for everyone who died together
+            arrivals = [f"**{user.display_name}** ({game_state.players.get(user.id, {}).get('role', 'unknown')})"
+                        for user in joining]
+            embed = discord.Embed(
+                title="💀 Welcome to the Afterlife",
+                description=f"{', '.join(arrivals)} {'has' if len(arrivals) == 1 else 'have'} joined the dead chat!",
+                color=0x2F4F4F
+            )
+            embed.add_field(
+                name="📝 Dead Chat Rules",
+                value="• Discuss the game freely with other dead players\n• Don't spoil information to living players\n• Enjoy watching the chaos unfold!",
+                inline=False
+            )
+            await channel.send(embed=embed)
+            logger.info(f"Added {len(joining)} player(s) to dead chat")
         
         # Check if traitor should join wolfchat (when all actual wolves are dead)
-        player_role = game_state.players.get(user_id, {}).get('role', '')
-        if player_role in ACTUAL_WOLVES:
+        if any(game_state.players.get(uid, {}).get('role', '') in ACTUAL_WOLVES for uid in user_ids):
             alive_wolves = [pid for pid in game_state.get_alive_players() 
                           if game_state.players[pid]['role'] in ACTUAL_WOLVES]
             
@@ -813,982 +1176,54 @@ async def handle_player_death(user_id: int, ctx):
     except Exception as e:
         logger.error(f"Failed to handle player death chat permissions: {e}")
 
-def assign_roles(player_ids: List[int], setup: str = "default"):
-    """Assign roles to players based on exact specifications"""
-    num_players = len(player_ids)
-    
-    if setup == "default":
-        # Exact role specifications for default gamemode
-        role_assignments = {
-            4: {
-                'roles': ['villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            5: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            6: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf'],
-                'templates': ['cursed']
-            },
-            7: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'shaman'],
-                'templates': ['cursed', 'gunner']
-            },
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot'],
-                'templates': ['cursed', 'gunner']
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman'],
-                'templates': ['cursed', 'gunner']
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub'],
-                'templates': ['assassin', 'cursed', 'gunner']
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'matchmaker'],
-                'templates': ['assassin', 'cursed', 'gunner']
-            },
-            12: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker'],
-                'templates': ['assassin', 'cursed', 'cursed', 'gunner']
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'detective', 'matchmaker'],
-                'templates': ['assassin', 'cursed', 'cursed', 'gunner']
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'detective', 'matchmaker'],
-                'templates': ['assassin', 'cursed', 'cursed', 'gunner']
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'detective', 'matchmaker', 'hunter', 'monster'],
-                'templates': ['assassin', 'cursed', 'cursed', 'gunner']
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'detective', 'matchmaker', 'hunter', 'bodyguard', 'monster'],
-                'templates': ['assassin', 'cursed', 'cursed', 'gunner']
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'detective', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag'],
-                'templates': ['assassin', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'mayor', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'mayor', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            22: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'mayor', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            23: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten'],
-                'templates': ['assassin', 'assassin', 'mayor', 'cursed', 'cursed', 'cursed', 'gunner']
-            },
-            24: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'traitor', 'shaman', 'harlot', 'crazed shaman', 'wolf cub', 'werecrow', 'matchmaker', 'hunter', 'oracle', 'augur', 'monster', 'hag', 'werekitten', 'warlock'],
-                'templates': ['assassin', 'assassin', 'mayor', 'cursed', 'cursed', 'cursed', 'gunner']
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in role_assignments:
-            assignment = role_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Fallback for unsupported player counts
-            if num_players < 4:
-                roles = ['villager'] * (num_players - 1) + ['wolf']
-                templates = []
-            else:
-                # Simple fallback
-                roles = ['villager'] * (num_players - 1) + ['wolf']
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback
-            roles = ['villager'] * (num_players - 1) + ['wolf']
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-    
-    elif setup == "foolish":
-        # Foolish gamemode - Watch out, because the fool is always there to steal the win
-        foolish_assignments = {
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'fool', 'wolf', 'traitor'],
-                'templates': ['cursed']
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'traitor'],
-                'templates': ['cursed']
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor'],
-                'templates': ['cursed', 'gunner']
-            },
-            11: {
-                'roles': ['villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            12: {
-                'roles': ['villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'wolf cub', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner']
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            },
-            22: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            },
-            23: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            },
-            24: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'oracle', 'harlot', 'harlot', 'hunter', 'fool', 'wolf', 'wolf', 'wolf', 'wolf', 'traitor', 'traitor', 'sorcerer', 'wolf cub', 'bodyguard', 'augur', 'clone'],
-                'templates': ['cursed', 'gunner', 'gunner']
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in foolish_assignments:
-            assignment = foolish_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in foolish mode
-            if num_players < 8:
-                roles = ['villager'] * (num_players - 2) + ['fool', 'wolf']
-                templates = []
-            else:
-                # Simple fallback with fool
-                roles = ['villager'] * (num_players - 2) + ['fool', 'wolf']
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with fool
-            roles = ['villager'] * (num_players - 2) + ['fool', 'wolf']
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-    elif setup == "charming":
-        # Charming gamemode - Charmed players must band together to find the piper
-        charming_assignments = {
-            6: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'piper', 'wolf'],
-                'templates': []
-            },
-            7: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf'],
-                'templates': []
-            },
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'werekitten', 'traitor', 'harlot'],
-                'templates': []
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'werekitten', 'traitor', 'harlot', 'vengeful ghost'],
-                'templates': []
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost'],
-                'templates': []
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost'],
-                'templates': ['gunner']
-            },
-            12: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard'],
-                'templates': ['mayor', 'gunner']
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'assassin']
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'gunner', 'assassin']
-            },
-            22: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'gunner', 'assassin']
-            },
-            23: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'gunner', 'assassin']
-            },
-            24: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'piper', 'wolf', 'wolf', 'wolf', 'werekitten', 'traitor', 'harlot', 'shaman', 'shaman', 'detective', 'warlock', 'vengeful ghost', 'bodyguard', 'bodyguard', 'sorcerer'],
-                'templates': ['mayor', 'gunner', 'gunner', 'assassin']
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in charming_assignments:
-            assignment = charming_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in charming mode
-            if num_players < 6:
-                roles = ['villager'] * (num_players - 2) + ['piper', 'wolf']
-                templates = []
-            else:
-                # Simple fallback with piper
-                roles = ['villager'] * (num_players - 2) + ['piper', 'wolf']
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with piper
-            roles = ['villager'] * (num_players - 2) + ['piper', 'wolf']
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "mad":
-        # Mad gamemode - This game mode has mad scientist and many things that may kill you
-        mad_assignments = {
-            7: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf'],
-                'templates': []
-            },
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'traitor'],
-                'templates': []
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'traitor'],
-                'templates': []
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'werecrow', 'traitor', 'village drunk'],
-                'templates': []
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'werecrow', 'traitor', 'village drunk'],
-                'templates': []
-            },
-            12: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'cultist'],
-                'templates': []
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'cultist'],
-                'templates': []
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'cultist', 'harlot'],
-                'templates': []
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'cultist', 'harlot'],
-                'templates': ['assassin']
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'jester'],
-                'templates': []
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            },
-            22: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'werecrow', 'traitor', 'village drunk', 'detective', 'wolf cub', 'wolf cub', 'cultist', 'harlot', 'vengeful ghost', 'hunter', 'jester'],
-                'templates': []
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in mad_assignments:
-            assignment = mad_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in mad mode
-            if num_players < 7:
-                roles = ['villager'] * (num_players - 3) + ['mad scientist', 'seer', 'wolf']
-                templates = []
-            else:
-                # Simple fallback with mad scientist
-                roles = ['villager'] * (num_players - 3) + ['mad scientist', 'seer', 'wolf']
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with mad scientist
-            roles = ['villager'] * (num_players - 3) + ['mad scientist', 'seer', 'wolf']
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "lycan":
-        # Lycan gamemode - Many lycans will turn into wolves. Hunt them down before wolves overpower the village
-        lycan_assignments = {
-            7: {
-                'roles': ['villager', 'seer', 'hunter', 'hunter', 'lycan', 'wolf', 'clone'],
-                'templates': []
-            },
-            8: {
-                'roles': ['villager', 'seer', 'hunter', 'hunter', 'lycan', 'wolf', 'traitor', 'clone'],
-                'templates': []
-            },
-            9: {
-                'roles': ['villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'wolf', 'traitor', 'clone'],
-                'templates': []
-            },
-            10: {
-                'roles': ['villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'wolf', 'traitor', 'clone'],
-                'templates': []
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'wolf', 'traitor', 'clone'],
-                'templates': []
-            },
-            12: {
-                'roles': ['villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'wolf shaman'],
-                'templates': []
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'wolf shaman'],
-                'templates': []
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'wolf shaman', 'bodyguard'],
-                'templates': []
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'wolf shaman', 'bodyguard'],
-                'templates': []
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'wolf shaman', 'bodyguard'],
-                'templates': []
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'clone', 'wolf shaman', 'bodyguard'],
-                'templates': []
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'clone', 'wolf shaman', 'bodyguard', 'matchmaker'],
-                'templates': []
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'clone', 'wolf shaman', 'bodyguard', 'matchmaker'],
-                'templates': []
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'clone', 'wolf shaman', 'bodyguard', 'matchmaker'],
-                'templates': []
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'seer', 'hunter', 'hunter', 'lycan', 'lycan', 'lycan', 'lycan', 'lycan', 'lycan', 'wolf', 'traitor', 'clone', 'clone', 'wolf shaman', 'bodyguard', 'matchmaker'],
-                'templates': []
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in lycan_assignments:
-            assignment = lycan_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in lycan mode
-            if num_players < 7:
-                roles = ['villager'] * (num_players - 4) + ['hunter', 'lycan', 'wolf', 'clone']
-                templates = []
-            else:
-                # Simple fallback with lycans
-                base_roles = ['seer', 'hunter', 'hunter', 'lycan', 'wolf', 'clone']
-                villager_count = num_players - len(base_roles)
-                roles = ['villager'] * villager_count + base_roles
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with lycans
-            base_roles = ['seer', 'hunter', 'lycan', 'wolf', 'clone']
-            villager_count = num_players - len(base_roles)
-            roles = ['villager'] * villager_count + base_roles
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "rapidfire":
-        # Rapidfire gamemode - Many killing roles and roles that cause chain deaths. Living has never been so hard
-        rapidfire_assignments = {
-            6: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf'],
-                'templates': ['gunner', 'assassin']
-            },
-            7: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf'],
-                'templates': ['gunner', 'assassin']
-            },
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf cub', 'hunter'],
-                'templates': ['gunner', 'assassin']
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf cub', 'hunter'],
-                'templates': ['gunner', 'assassin']
-            },
-            10: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf cub', 'matchmaker', 'hunter', 'time lord', 'traitor'],
-                'templates': ['gunner', 'assassin']
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf cub', 'matchmaker', 'hunter', 'time lord', 'traitor'],
-                'templates': ['gunner', 'assassin']
-            },
-            12: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'matchmaker', 'hunter', 'time lord', 'traitor', 'vengeful ghost'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'matchmaker', 'hunter', 'time lord', 'traitor', 'vengeful ghost'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            14: {
-                'roles': ['villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'augur'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            15: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'augur'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            18: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            21: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            22: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin', 'assassin']
-            },
-            23: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            },
-            24: {
-                'roles': ['villager', 'villager', 'seer', 'mad scientist', 'mad scientist', 'wolf', 'wolf', 'wolf', 'wolf', 'wolf cub', 'wolf cub', 'matchmaker', 'matchmaker', 'hunter', 'hunter', 'time lord', 'time lord', 'traitor', 'vengeful ghost', 'vengeful ghost', 'augur', 'amnesiac'],
-                'templates': ['gunner', 'assassin', 'assassin']
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in rapidfire_assignments:
-            assignment = rapidfire_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in rapidfire mode
-            if num_players < 6:
-                roles = ['villager'] * (num_players - 3) + ['mad scientist', 'seer', 'wolf']
-                templates = ['gunner']
-            else:
-                # Simple fallback with dangerous roles
-                base_roles = ['seer', 'mad scientist', 'hunter', 'wolf', 'wolf cub']
-                villager_count = num_players - len(base_roles)
-                roles = ['villager'] * villager_count + base_roles
-                templates = ['gunner', 'assassin']
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with dangerous roles
-            base_roles = ['seer', 'mad scientist', 'hunter', 'wolf']
-            villager_count = num_players - len(base_roles)
-            roles = ['villager'] * villager_count + base_roles
-            templates = ['gunner', 'assassin']
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "noreveal":
-        # Noreveal gamemode - Roles are not revealed on death
-        noreveal_assignments = {
-            4: {
-                'roles': ['villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            5: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            6: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            7: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf'],
-                'templates': []
-            },
-            8: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'mystic', 'wolf mystic'],
-                'templates': []
-            },
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'mystic', 'wolf mystic'],
-                'templates': []
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'hunter'],
-                'templates': []
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'hunter'],
-                'templates': []
-            },
-            12: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter'],
-                'templates': []
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter'],
-                'templates': []
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter'],
-                'templates': []
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone'],
-                'templates': []
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone'],
-                'templates': []
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone', 'lycan', 'amnesiac'],
-                'templates': []
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone', 'lycan', 'amnesiac'],
-                'templates': []
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone', 'lycan', 'amnesiac'],
-                'templates': []
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone', 'lycan', 'amnesiac'],
-                'templates': []
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'villager', 'seer', 'wolf', 'wolf', 'wolf', 'mystic', 'traitor', 'wolf mystic', 'guardian angel', 'hunter', 'werecrow', 'detective', 'clone', 'lycan', 'amnesiac'],
-                'templates': []
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in noreveal_assignments:
-            assignment = noreveal_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
-        else:
-            # Default fallback for unsupported player counts in noreveal mode
-            if num_players < 4:
-                roles = ['villager'] * (num_players - 1) + ['wolf']
-                templates = []
-            else:
-                # Simple fallback with basic roles
-                base_roles = ['seer', 'wolf']
-                villager_count = num_players - len(base_roles)
-                roles = ['villager'] * villager_count + base_roles
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with basic roles
-            base_roles = ['seer', 'wolf']
-            villager_count = num_players - len(base_roles)
-            roles = ['villager'] * villager_count + base_roles
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "bloodbath":
-        # Bloodbath gamemode - A serial killer is on the loose... shall it end up on the noose?
-        bloodbath_assignments = {
-            9: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'traitor'],
-                'templates': []
-            },
-            10: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'traitor', 'shaman', 'cultist'],
-                'templates': []
-            },
-            11: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'traitor', 'shaman', 'oracle', 'cultist'],
-                'templates': []
-            },
-            12: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'werecrow'],
-                'templates': []
-            },
-            13: {
-                'roles': ['villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow'],
-                'templates': []
-            },
-            14: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'werecrow', 'hunter'],
-                'templates': []
-            },
-            15: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter'],
-                'templates': []
-            },
-            16: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'werecrow', 'hunter', 'priest', 'guardian angel'],
-                'templates': []
-            },
-            17: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag'],
-                'templates': []
-            },
-            18: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost'],
-                'templates': []
-            },
-            19: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost'],
-                'templates': []
-            },
-            20: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost', 'clone'],
-                'templates': []
-            },
-            21: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost', 'clone'],
-                'templates': []
-            },
-            22: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost', 'clone', 'amnesiac'],
-                'templates': []
-            },
-            23: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost', 'clone', 'amnesiac'],
-                'templates': []
-            },
-            24: {
-                'roles': ['villager', 'villager', 'villager', 'villager', 'seer', 'bodyguard', 'serial killer', 'serial killer', 'wolf', 'wolf', 'traitor', 'shaman', 'shaman', 'oracle', 'turncoat', 'cultist', 'werecrow', 'hunter', 'priest', 'guardian angel', 'hag', 'vengeful ghost', 'clone', 'amnesiac'],
-                'templates': []
-            }
-        }
-        
-        # Get role assignment for this player count
-        if num_players in bloodbath_assignments:
-            assignment = bloodbath_assignments[num_players]
-            roles = assignment['roles'][:]
-            templates = assignment['templates'][:]
+def format_role(player_id: int) -> str:
+    """Role and template of a player, formatted for death announcements"""
+    player = game_state.players[player_id]
+    display = player['role'].replace('_', ' ').title()
+    if player.get('template'):
+        display += f" ({player['template'].replace('_', ' ').title()})"
+    return display
+
+async def kill_players(ctx, deaths: List[tuple]) -> DeathCascade:
+    """Kill (player_id, cause) pairs and everyone their deaths take along, all at once"""
+    cascade = resolve_death_cascade(game_state.players, deaths, seating=game_state.seating)
+    for death in cascade.deaths:
+        game_state.seating.remove(death.player_id)
+        game_state.players[death.player_id]['alive'] = False
+        game_state.dead_players[death.player_id] = game_state.players[death.player_id]['role']
+    current_span().add_players(cascade.player_ids)
+    await handle_player_deaths(cascade.player_ids, ctx)
+    return cascade
+
+def chained_death_lines(cascade: DeathCascade) -> List[str]:
+    """Announcement lines for the deaths a cascade added to the initial ones"""
+    lines = []
+    for death in cascade.chained:
+        name = display_name(death.player_id)
+        source = display_name(death.source)
+        role = "" if game_state.gamemode == "noreveal" else f" ({format_role(death.player_id)})"
+        if death.cause == 'heartbreak':
+            lines.append(f"💔 **{name}**{role} dies of heartbreak after losing their lover!")
+        elif death.cause == 'assassin':
+            lines.append(f"💀 **Assassin's Revenge!** {source}'s death triggers their assassination target! **{name}**{role} dies with the assassin!")
+        elif death.cause == 'hunter':
+            lines.append(f"🏹 **{source}** the hunter takes **{name}**{role} down with them!")
+        elif death.cause == 'mad scientist':
+            lines.append(f"🧪 **{name}**{role} is caught in **{source}**'s explosion!")
         else:
-            # Default fallback for unsupported player counts in bloodbath mode
-            if num_players < 9:
-                roles = ['villager'] * (num_players - 3) + ['serial killer', 'seer', 'wolf']
-                templates = []
-            else:
-                # Simple fallback with serial killer
-                base_roles = ['seer', 'bodyguard', 'serial killer', 'wolf', 'traitor']
-                villager_count = num_players - len(base_roles)
-                roles = ['villager'] * villager_count + base_roles
-                templates = []
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            logger.warning(f"Role count mismatch: {len(roles)} roles for {num_players} players")
-            # Fallback with serial killer
-            base_roles = ['seer', 'serial killer', 'wolf']
-            villager_count = num_players - len(base_roles)
-            roles = ['villager'] * villager_count + base_roles
-            templates = []
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    elif setup == "random":
-        # Random gamemode - A completely random set of roles for chaotic gameplay
-        
-        # Define all available roles organized by category
-        village_roles = [
-            'villager', 'seer', 'oracle', 'shaman', 'harlot', 'bodyguard', 'guardian angel',
-            'priest', 'detective', 'augur', 'mystic', 'matchmaker', 'hunter', 'gunner',
-            'mad scientist', 'time lord'
-        ]
-        
-        wolf_roles = [
-            'wolf', 'wolf cub', 'werecrow', 'wolf shaman', 'wolf mystic', 'werekitten'
-        ]
-        
-        neutral_roles = [
-            'traitor', 'jester', 'fool', 'serial killer', 'piper',
-            'succubus', 'monster', 'hag', 'warlock', 'cultist', 'clone', 'amnesiac',
-            'turncoat', 'lycan', 'vengeful ghost', 'crazed shaman', 'hot potato'
-        ]
-        
-        available_templates = [
-            'cursed', 'gunner', 'assassin', 'mayor', 'blessed'
-        ]
-        
-        # Ensure minimum balanced composition
-        min_wolves = max(1, num_players // 6)  # At least 1 wolf, roughly 1 per 6 players
-        min_village = max(2, num_players // 3)  # At least 2 village roles
-        
-        # Start with guaranteed roles for balance
-        roles = []
-        
-        # Add minimum wolves
-        for _ in range(min_wolves):
-            role = random.choice(wolf_roles)
-            roles.append(role)
-        
-        # Add minimum village roles (ensure at least one investigative role)
-        investigative_roles = ['seer', 'oracle', 'detective', 'augur', 'mystic']
-        roles.append(random.choice(investigative_roles))
-        
-        # Add other village roles
-        for _ in range(min_village - 1):
-            role = random.choice(village_roles)
-            roles.append(role)
-        
-        # Fill remaining slots with random roles from all categories
-        remaining_slots = num_players - len(roles)
-        all_roles = village_roles + wolf_roles + neutral_roles
-        
-        for _ in range(remaining_slots):
-            role = random.choice(all_roles)
-            roles.append(role)
-        
-        # Randomly assign templates to some players (20-40% chance)
-        templates = []
-        num_templates = random.randint(max(1, num_players // 6), max(2, num_players // 3))
-        
-        for _ in range(num_templates):
-            template = random.choice(available_templates)
-            templates.append(template)
-        
-        # Pad templates list to match player count
-        while len(templates) < num_players:
-            templates.append(None)
-        
-        # Ensure exact counts
-        if len(roles) != num_players:
-            # Adjust by adding/removing villagers
-            while len(roles) < num_players:
-                roles.append('villager')
-            while len(roles) > num_players:
-                if 'villager' in roles:
-                    roles.remove('villager')
-                else:
-                    roles.pop()
-        
-        # Shuffle roles and templates
-        random.shuffle(roles)
-        random.shuffle(templates)
-        
-        # Assign roles and templates to players
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            template = templates[i] if i < len(templates) else None
-            game_state.add_player(player_id, role, template)
-            
-    else:
-        # Other setups can be added here
-        roles = ['villager'] * (num_players - 1) + ['wolf']
-        random.shuffle(roles)
-        for i, player_id in enumerate(player_ids):
-            role = roles[i] if i < len(roles) else 'villager'
-            game_state.add_player(player_id, role)
+            lines.append(f"💀 **{name}**{role} dies along with **{source}**!")
+    return lines
+
+def assign_roles(player_ids: List[int], setup: str = "default"):
+    """Assign roles to players from the compiled gamemode tables"""
+    for player_id, role, template in GAMEMODES.assign(player_ids, setup, rng=game_state.rng):
+        game_state.add_player(player_id, role, template)
 
+@tracer.traced()
 async def check_win_conditions(ctx):
     """Check if any team has won"""
     alive_players = game_state.get_alive_players()
+    current_span().set(alive=len(alive_players))
     
     # Count teams
     village_count = len(game_state.get_players_by_team('village'))
@@ -1825,9 +1260,12 @@ async def check_win_conditions(ctx):
     
     return False
 
+@tracer.traced()
 async def announce_winner(ctx, team: str, winners: List[int]):
     """Announce game winners and reveal all roles"""
-    winner_names = [bot.get_user(uid).display_name for uid in winners if bot.get_user(uid)]
+    current_span().set(team=team)
+    current_span().add_players(winners)
+    winner_names = [display_name(uid) for uid in winners]
     
     embed = discord.Embed(
         title="🎉 Game Over!",
@@ -1920,7 +1358,7 @@ async def announce_winner(ctx, team: str, winners: List[int]):
         inline=True
     )
     
-    await ctx.send(embed=embed)
+    await outbound.send(ctx, embed=embed)
     
     # Cleanup chat channels
     await cleanup_chat_channels()
@@ -1938,6 +1376,93 @@ async def start_phase_timer(ctx, phase: str, duration: int):
     
     game_state.timer_task = asyncio.create_task(phase_timer(ctx, phase, duration))
     logger.info(f"Created new timer task for {phase} phase")
+    
+    game_state.phase_deadline = time.time() + duration
+    save_game_snapshot()
+
+def game_snapshot_key(channel_id: Optional[int]) -> Optional[str]:
+    """Snapshot key of the game in channel_id, or None if there is no such channel"""
+    channel = bot.get_channel(channel_id) if channel_id else None
+    if channel is None or channel.guild is None:
+        return None
+    return snapshot_key(GAME_SNAPSHOT_KEY, channel.guild.id, channel.id)
+
+snapshot_io = asyncio.Lock()  # snapshot writes reach the backend in the order they were made
+
+async def run_snapshot_io(function, *args):
+    """Run a snapshot write in a worker thread, so a slow backend never stalls the event loop"""
+    async with snapshot_io:
+        try:
+            await asyncio.to_thread(function, state_backend, *args)
+        except Exception as e:
+            logger.error(f"Game snapshot {function.__name__} failed: {e}")
+
+def schedule_snapshot_io(function, *args):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        function(state_backend, *args)  # no event loop to stall yet
+        return
+    task = asyncio.create_task(run_snapshot_io(function, *args), name='snapshot_io')
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+def save_game_snapshot():
+    """Write the running game to the state backend so a restarted worker can resume it"""
+    key = game_snapshot_key(game_state.channel_id)
+    if not game_state.active or key is None:
+        return
+    try:
+        # Encoded now, before the game moves on; only the write happens in the background
+        data = snapshot_format.pack(game_state.to_snapshot())
+    except Exception as e:
+        logger.error(f"Failed to save game snapshot: {e}")
+        return
+    schedule_snapshot_io(snapshot_format.write_snapshot, key, data)
+
+class ChannelContext:
+    """Minimal stand-in for commands.Context when a resumed game has no triggering message"""
+    
+    def __init__(self, channel):
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = channel.guild.me
+        self.bot = bot
+    
+    async def send(self, *args, **kwargs):
+        return await self.channel.send(*args, **kwargs)
+
+async def resume_game_from_snapshot():
+    """Pick up a game left behind by a crashed or restarted worker"""
+    if game_state.active:
+        return
+    snapshot = channel = None
+    for key in await asyncio.to_thread(list_snapshots, state_backend, GAME_SNAPSHOT_KEY):
+        ids = snapshot_ids(GAME_SNAPSHOT_KEY, key)
+        # Games in guilds this worker doesn't run belong to another node; leave them be
+        if ids is None or not shard_router.owns(ids[0]):
+            continue
+        channel = bot.get_channel(ids[1])
+        if channel is None:
+            logger.warning(f"Game snapshot {key} is for a channel this worker can't see, leaving it")
+            continue
+        snapshot = await asyncio.to_thread(load_snapshot, state_backend, key)
+        if snapshot and snapshot.get('active'):
+            break
+        snapshot = None
+    if snapshot is None:
+        return
+    
+    game_state.restore_snapshot(snapshot, bot.get_channel)
+    tracer.begin_game(f"{channel.guild.id}-{int(time.time())}", gamemode=game_state.gamemode, resumed=True)
+    await member_cache.ensure(bot, game_state.players.keys())
+    
+    remaining = int((game_state.phase_deadline or 0) - time.time())
+    remaining = max(remaining, 15)
+    logger.info(f"Resuming {game_state.phase} phase of day {game_state.day_number} with {remaining}s left")
+    ctx = ChannelContext(channel)
+    await channel.send(f"♻️ The bot restarted mid-game. Resuming the **{game_state.phase}** phase with **{remaining} seconds** left.")
+    await start_phase_timer(ctx, game_state.phase, remaining)
 
 async def phase_timer(ctx, phase: str, duration: int):
     """Enhanced phase timer with countdown alerts and auto-completion checks"""
@@ -1949,45 +1474,45 @@ async def phase_timer(ctx, phase: str, duration: int):
         alerts = [60, 30, 10, 3, 2, 1]
         alerted = set()  # Track which alerts we've sent
         
-        # Send initial timer message
+        # Send initial timer message; timer chatter never holds up game messages
         if phase == "day":
-            await channel.send(f"⏰ Day phase started! **{duration} seconds** ({duration//60} minutes) to vote or until everyone votes.")
+            outbound.post(channel, f"⏰ Day phase started! **{duration} seconds** ({duration//60} minutes) to vote or until everyone votes.", priority=Priority.COUNTDOWN)
         elif phase == "night":
-            await channel.send(f"🌙 Night phase started! **{duration} seconds** ({duration//60} minutes) for night actions or until everyone acts.")
+            outbound.post(channel, f"🌙 Night phase started! **{duration} seconds** ({duration//60} minutes) for night actions or until everyone acts.", priority=Priority.COUNTDOWN)
         
         while elapsed < duration:
             await asyncio.sleep(1)
             elapsed += 1
             remaining = duration - elapsed
             
+            # Keep votes and night actions recoverable between phase transitions
+            if elapsed % SNAPSHOT_INTERVAL == 0:
+                save_game_snapshot()
+            
             # Check if phase should end early (all actions completed)
             if await check_phase_completion(channel, phase):
-                await channel.send(f"✅ All {phase} actions completed! Moving to next phase...")
+                await outbound.send(channel, f"✅ All {phase} actions completed! Moving to next phase...")
                 break
             
             # Send countdown alerts (only once per alert)
             if remaining in alerts and remaining not in alerted:
                 alerted.add(remaining)
                 if remaining >= 30:
-                    await channel.send(f"⏰ **{remaining} seconds** remaining in {phase} phase!")
+                    alert = f"⏰ **{remaining} seconds** remaining in {phase} phase!"
                 elif remaining >= 10:
-                    await channel.send(f"⚠️ **{remaining} seconds** remaining!")
+                    alert = f"⚠️ **{remaining} seconds** remaining!"
                 elif remaining >= 3:
-                    await channel.send(f"🚨 **{remaining}**")
+                    alert = f"🚨 **{remaining}**"
                 else:
-                    await channel.send(f"**{remaining}**")
+                    alert = f"**{remaining}**"
+                outbound.post(channel, alert, priority=Priority.COUNTDOWN)
         
         # Only proceed to next phase if we didn't break early
         if elapsed >= duration:
-            await channel.send(f"⏰ {phase.title()} phase time expired! Moving to next phase...")
+            await outbound.send(channel, f"⏰ {phase.title()} phase time expired! Moving to next phase...")
             
         # Phase transition
-        if phase == "signup":
-            await start_game(ctx, game_state.gamemode)
-        elif phase == "day":
-            await end_day_phase(ctx)
-        elif phase == "night":
-            await end_night_phase(ctx)
+        await game_mailbox.run(advance_phase, ctx, phase)
             
     except asyncio.CancelledError:
         logger.info(f"Timer for {phase} phase was cancelled")
@@ -1995,12 +1520,19 @@ async def phase_timer(ctx, phase: str, duration: int):
     except Exception as e:
         logger.error(f"Error in phase timer for {phase}: {e}")
         # Try to continue the game even if timer fails
-        if phase == "signup":
-            await start_game(ctx, game_state.gamemode)
-        elif phase == "day":
-            await end_day_phase(ctx)
-        elif phase == "night":
-            await end_night_phase(ctx)
+        await game_mailbox.run(advance_phase, ctx, phase)
+
+async def advance_phase(ctx, phase: str):
+    """End the given phase, unless a command already moved the game past it"""
+    if not game_state.active or game_state.phase != phase:
+        logger.info(f"Skipping {phase} timer transition, game is in {game_state.phase if game_state.active else 'no'} phase")
+        return
+    if phase == "signup":
+        await start_game(ctx, game_state.gamemode)
+    elif phase == "day":
+        await end_day_phase(ctx)
+    elif phase == "night":
+        await end_night_phase(ctx)
 
 async def check_phase_completion(channel, phase: str) -> bool:
     """Check if current phase can end early due to all actions being completed"""
@@ -2111,9 +1643,8 @@ async def start_signup(ctx, gamemode="default"):
         return
     
     # Validate gamemode
-    valid_gamemodes = ["default", "foolish", "charming", "mad", "lycan", "rapidfire", "noreveal", "bloodbath", "random"]
-    if gamemode.lower() not in valid_gamemodes:
-        await ctx.send(f"❌ Invalid gamemode! Valid options: {', '.join(valid_gamemodes)}")
+    if gamemode.lower() not in GAMEMODES:
+        await ctx.send(f"❌ Invalid gamemode! Valid options: {', '.join(GAMEMODES.names())}")
         return
     
     game_state.reset()
@@ -2121,87 +1652,20 @@ async def start_signup(ctx, gamemode="default"):
     game_state.phase = "signup"
     game_state.gamemode = gamemode.lower()
     game_state.channel_id = ctx.channel.id
+    tracer.begin_game(f"{ctx.guild.id}-{int(time.time())}", gamemode=game_state.gamemode)
     
-    gamemode_info = {
-        "default": "Standard werewolf with balanced roles",
-        "foolish": "Watch out, because the fool is always there to steal the win!",
-        "charming": "Charmed players must band together to find the piper in this game mode",
-        "mad": "This game mode has mad scientist and many things that may kill you",
-        "lycan": "Many lycans will turn into wolves. Hunt them down before the wolves overpower the village",
-        "rapidfire": "Many killing roles and roles that cause chain deaths. Living has never been so hard",
-        "noreveal": "Roles are not revealed on death",
-        "bloodbath": "Serial killers everywhere! Bodyguards are your only protection in this deadly mode",
-        "random": "A completely random set of roles is chosen, making for a chaotic and unpredictable game"
-    }
-    
-    gamemode_colors = {
-        "default": 0x8B4513,
-        "foolish": 0xFF4500,
-        "charming": 0x9932CC,
-        "mad": 0xFF0000,
-        "lycan": 0x800080,
-        "rapidfire": 0xDC143C,
-        "noreveal": 0x2F4F4F,
-        "bloodbath": 0x8B0000,
-        "random": 0xFF1493
-    }
+    mode = GAMEMODES.get(gamemode.lower())
     
     embed = discord.Embed(
         title=f"🐺 Werewolf Game Starting! ({gamemode.title()} Mode)",
-        description=f"{gamemode_info[gamemode.lower()]}\n\nType `{prefix}join` to join the game!\n\n⏰ Signup ends in **3 minutes** ({game_state.settings['signup_length']} seconds)",
-        color=gamemode_colors.get(gamemode.lower(), 0x8B4513)
+        description=f"{mode.description}\n\nType `{prefix}join` to join the game!\n\n⏰ Signup ends in **3 minutes** ({game_state.settings['signup_length']} seconds)",
+        color=mode.color
     )
     embed.add_field(name="Players", value="None yet", inline=False)
     
     # Add gamemode-specific info
-    if gamemode.lower() == "foolish":
-        embed.add_field(
-            name="🃏 Foolish Mode Special Rules",
-            value="• A fool is guaranteed in every game\n• The fool can win by being lynched\n• Multiple harlots in larger games\n• Oracle instead of seer for investigations",
-            inline=False
-        )
-    elif gamemode.lower() == "charming":
-        embed.add_field(
-            name="🎵 Charming Mode Special Rules",
-            value="• A piper is guaranteed in every game\n• Piper wins when all alive players are charmed\n• Piper can charm one player each night\n• Mix of village, wolf, and neutral roles for complex gameplay",
-            inline=False
-        )
-    elif gamemode.lower() == "mad":
-        embed.add_field(
-            name="🧪 Mad Mode Special Rules",
-            value="• A mad scientist is guaranteed in every game\n• Multiple dangerous roles that can kill players\n• Increased chaos with werecrows, cultists, and jesters\n• More unpredictable gameplay with various neutral roles",
-            inline=False
-        )
-    elif gamemode.lower() == "lycan":
-        embed.add_field(
-            name="🌙 Lycan Mode Special Rules",
-            value="• Multiple lycans that appear as wolves to seers\n• Lycans turn into actual wolves when attacked\n• Hunters are essential for eliminating lycans\n• Race against time before lycans overpower the village",
-            inline=False
-        )
-    elif gamemode.lower() == "rapidfire":
-        embed.add_field(
-            name="🔥 Rapidfire Mode Special Rules",
-            value="• Many killing roles and chain death mechanics\n• Mad scientists, hunters, and gunners everywhere\n• Assassins and vengeful ghosts create chaos\n• Time lords can reverse lynchings for more mayhem",
-            inline=False
-        )
-    elif gamemode.lower() == "noreveal":
-        embed.add_field(
-            name="🔒 Noreveal Mode Special Rules",
-            value="• Player roles are never revealed when they die\n• Information warfare - use investigative roles wisely\n• Mystics help detect power roles\n• Pure deduction and social gameplay",
-            inline=False
-        )
-    elif gamemode.lower() == "bloodbath":
-        embed.add_field(
-            name="🩸 Bloodbath Mode Special Rules",
-            value="• Serial killers are guaranteed in every game\n• Bodyguards are essential for village protection\n• High death rate with multiple killing roles\n• Survive the bloodbath to claim victory",
-            inline=False
-        )
-    elif gamemode.lower() == "random":
-        embed.add_field(
-            name="🎲 Random Mode Special Rules",
-            value="• Completely random role selection each game\n• No fixed role table - every game is unique\n• Minimum balance ensured (wolves, village, investigative)\n• Chaotic and unpredictable gameplay experience",
-            inline=False
-        )
+    if mode.rules:
+        embed.add_field(name=mode.rules['name'], value=mode.rules['value'], inline=False)
     
     await ctx.send(embed=embed)
     await start_phase_timer(ctx, "signup", game_state.settings['signup_length'])
@@ -2254,16 +1718,17 @@ async def join_game(ctx):
         return
     
     if ctx.author.id in game_state.players:
-        await ctx.send("❌ You're already in the game!")
+        await ctx.send(f"❌ {msg('alreadyin')}")
         return
     
     if len(game_state.players) >= game_state.settings['max_players']:
-        await ctx.send("❌ Game is full!")
+        await ctx.send(f"❌ {msg('maxplayers', game_state.settings['max_players'])}")
         return
     
     game_state.add_player(ctx.author.id)
+    member_cache.pin(ctx.author)
     
-    player_list = [bot.get_user(uid).display_name for uid in game_state.players.keys()]
+    player_list = [display_name(uid) for uid in game_state.players.keys()]
     player_count = len(game_state.players)
     
     embed = discord.Embed(
@@ -2277,7 +1742,7 @@ async def join_game(ctx):
         inline=False
     )
     
-    await ctx.send(f"✅ {ctx.author.display_name} joined the game!", embed=embed)
+    await ctx.send(f"✅ {msg('joinlobby', ctx.author.display_name, player_count)}", embed=embed)
 
 @bot.command(name='leave', aliases=['l'])
 async def leave_game(ctx):
@@ -2287,7 +1752,7 @@ async def leave_game(ctx):
         return
     
     if ctx.author.id not in game_state.players:
-        await ctx.send("❌ You're not in the game!")
+        await ctx.send(f"❌ {msg('notplayingleave')}")
         return
     
     if game_state.phase != "signup":
@@ -2295,18 +1760,23 @@ async def leave_game(ctx):
         return
     
     del game_state.players[ctx.author.id]
-    await ctx.send(f"✅ {ctx.author.display_name} left the game!")
+    member_cache.release(ctx.author.id)
+    await ctx.send(f"✅ {msg('leavelobby', ctx.author.display_name, len(game_state.players))}")
 
+@tracer.traced()
 async def start_game(ctx, gamemode="default"):
     """Start the actual game"""
     if len(game_state.players) < game_state.settings['min_players']:
-        await ctx.send(f"❌ Need at least {game_state.settings['min_players']} players to start!")
+        await ctx.send(f"❌ {msg('minplayers', game_state.settings['min_players'])}")
         game_state.reset()
         return
     
     # Assign roles with specified gamemode
     player_ids = list(game_state.players.keys())
+    current_span().add_players(player_ids)
+    await member_cache.ensure(bot, player_ids)
     assign_roles(player_ids, gamemode)
+    game_state.seating = SeatingRing(player_ids)
     
     # Set up wolfchat system
     await setup_wolfchat_for_game(ctx.guild)
@@ -2327,7 +1797,7 @@ async def start_game(ctx, gamemode="default"):
         color=0xFFD700
     )
     
-    player_list = [bot.get_user(uid).display_name for uid in game_state.get_alive_players()]
+    player_list = [display_name(uid) for uid in game_state.get_alive_players()]
     embed.add_field(
         name=f"Alive Players ({len(player_list)})",
         value="\n".join(player_list),
@@ -2363,7 +1833,7 @@ async def start_game(ctx, gamemode="default"):
             inline=False
         )
     
-    await ctx.send(embed=embed)
+    await outbound.send(ctx, embed=embed)
     await start_phase_timer(ctx, "day", game_state.settings['day_length'])
 
 @bot.command(name='end')
@@ -2559,7 +2029,7 @@ async def vote_lynch(ctx, *, target=None):
     
     # Record vote
     game_state.votes[ctx.author.id] = target_id
-    target_user = bot.get_user(target_id)
+    target_name = display_name(target_id)
     
     # Check for majority reached
     alive_count = len(game_state.get_alive_players())
@@ -2581,10 +2051,10 @@ async def vote_lynch(ctx, *, target=None):
     progress_text = get_vote_progress_text()
     
     target_votes = vote_counts.get(target_id, 0)
-    vote_msg = f"✅ {ctx.author.display_name} voted to lynch **{target_user.display_name}**!"
+    vote_msg = f"✅ {ctx.author.display_name} voted to lynch **{target_name}**!"
     
     if target_votes >= majority_needed:
-        vote_msg += f"\n🔥 **MAJORITY REACHED!** {target_user.display_name} has {target_votes} votes (majority: {majority_needed})"
+        vote_msg += f"\n🔥 **MAJORITY REACHED!** {target_name} has {target_votes} votes (majority: {majority_needed})"
     
     vote_msg += f"\n{progress_text}"
     
@@ -2630,8 +2100,8 @@ async def show_votes(ctx):
     
     vote_text = []
     for target_id, count in sorted_votes:
-        target_user = bot.get_user(target_id)
-        vote_text.append(f"**{target_user.display_name}**: {count} vote{'s' if count != 1 else ''}")
+        target_name = display_name(target_id)
+        vote_text.append(f"**{target_name}**: {count} vote{'s' if count != 1 else ''}")
     
     embed.description = "\n".join(vote_text)
     
@@ -2649,13 +2119,13 @@ async def show_votes(ctx):
     for player_id in game_state.get_alive_players():
         totem = game_state.players[player_id].get('totem')
         if totem in ['influence_totem', 'impatience_totem', 'pacifism_totem']:
-            user = bot.get_user(player_id)
+            name = display_name(player_id)
             if totem == 'influence_totem':
-                totem_info.append(f"{user.display_name}: Double votes")
+                totem_info.append(f"{name}: Double votes")
             elif totem == 'impatience_totem':
-                totem_info.append(f"{user.display_name}: Votes for everyone")
+                totem_info.append(f"{name}: Votes for everyone")
             elif totem == 'pacifism_totem':
-                totem_info.append(f"{user.display_name}: Cannot vote")
+                totem_info.append(f"{name}: Cannot vote")
     
     if totem_info:
         embed.add_field(name="Totem Effects", value="\n".join(totem_info), inline=False)
@@ -2735,6 +2205,7 @@ async def show_players(ctx):
     
     await ctx.send(embed=embed)
 
+@tracer.traced()
 async def end_day_phase(ctx):
     """End day phase and process lynch"""
     # Count final votes with totem effects
@@ -2749,13 +2220,14 @@ async def end_day_phase(ctx):
             lynched_player = tied_players[0]
         else:
             # Tie - no lynch
-            await ctx.send("⚖️ **No Lynch** - The vote ended in a tie!")
+            await outbound.send(ctx, "⚖️ **No Lynch** - The vote ended in a tie!")
     else:
-        await ctx.send("⚖️ **No Lynch** - No votes were cast!")
+        await outbound.send(ctx, "⚖️ **No Lynch** - No votes were cast!")
     
     # Process lynch
     if lynched_player:
-        lynched_user = bot.get_user(lynched_player)
+        current_span().add_players((lynched_player,))
+        lynched_name = display_name(lynched_player)
         lynched_role = game_state.players[lynched_player]['role']
         lynched_template = game_state.players[lynched_player].get('template')
         
@@ -2766,27 +2238,30 @@ async def end_day_phase(ctx):
         
         # Check for revealing totem (saves from death but reveals role)
         if game_state.players[lynched_player].get('totem') == 'revealing_totem':
-            await ctx.send(f"✨ **{lynched_user.display_name}** was about to be lynched, but the **Revealing Totem** saves them!\n\n🔍 **Role Revealed**: {role_display}")
+            await outbound.send(ctx, f"✨ **{lynched_name}** was about to be lynched, but the **Revealing Totem** saves them!\n\n🔍 **Role Revealed**: {role_display}")
             # Remove the totem after use
             game_state.players[lynched_player]['totem'] = None
         else:
             # Normal lynch with role reveal
-            await ctx.send(f"⚰️ **{lynched_user.display_name}** was lynched!\n\n🔍 **Role**: {role_display}")
+            if game_state.gamemode == "noreveal":
+                report = [f"⚰️ {msg('lynchednoreveal', lynched_name)}"]
+            else:
+                report = [f"⚰️ {msg('lynched', lynched_name, role_display)}"]
             
             # Check for desperation totem (kills last voter)
             if game_state.players[lynched_player].get('totem') == 'desperation_totem':
                 # Find the last person to vote for them (need to implement vote history)
-                await ctx.send(f"💥 **Desperation Totem** activates! The last person to vote dies too!")
-            
-            # Kill player
-            game_state.players[lynched_player]['alive'] = False
-            game_state.dead_players[lynched_player] = lynched_role
+                report.append(f"💥 **Desperation Totem** activates! The last person to vote dies too!")
             
-            # Handle death effects (wolfchat, etc.)
-            await handle_player_death(lynched_player, ctx)
+            # Kill player and everyone who dies with them, then announce it all at once
+            cascade = await kill_players(ctx, [(lynched_player, 'lynch')])
+            report.extend(chained_death_lines(cascade))
+            await outbound.send(ctx, "\n".join(report))
             
-            # Check for special death effects
-            await process_death_effects(ctx, lynched_player, 'lynch')
+            # Jester/Fool win by being lynched
+            if cascade.lynch_winner is not None:
+                await announce_winner(ctx, 'jester', [cascade.lynch_winner])
+                return
     
     # Check win conditions
     if await check_win_conditions(ctx):
@@ -2830,6 +2305,7 @@ async def start_night_phase(ctx):
     """Start night phase"""
     game_state.phase = "night"
     game_state.night_actions.clear()
+    game_state.wolf_digest_message = None
     
     # Reset totem assignments for new night
     game_state.assigned_totems.clear()
@@ -2841,15 +2317,150 @@ async def start_night_phase(ctx):
         color=0x2F4F4F
     )
     
-    await ctx.send(embed=embed)
+    await outbound.send(ctx, embed=embed)
     
     # Send night action prompts
     await send_night_prompts()
+    wolf_digest.trigger()
     
     await start_phase_timer(ctx, "night", game_state.settings['night_length'])
 
+# ==================== NIGHT PROMPT TEMPLATES ====================
+# Compiled once here; a prompt is a copy of its template plus the night's roster
+NIGHT_PROMPTS = PromptTemplates()
+NIGHT_PROMPTS.register(('seer',), "🔮 Seer - Night Action", "You can see the exact role of any player.", 0x8A2BE2, [
+    ("💭 Your Power", "Learn the exact role of a target player"),
+    ("📝 Command", f"`{prefix}see <player_name>`"),
+    ("💡 Example", f"`{prefix}see John` → You'll learn John's exact role"),
+])
+NIGHT_PROMPTS.register(('oracle',), "🔮 Oracle - Night Action", "You can see which team a player belongs to.", 0x8A2BE2, [
+    ("💭 Your Power", "Learn if target is Village/Wolf/Neutral team"),
+    ("📝 Command", f"`{prefix}see <player_name>`"),
+    ("💡 Example", f"`{prefix}see Alice` → You'll learn Alice's team"),
+])
+NIGHT_PROMPTS.register(('detective',), "🕵️ Detective - Night Action", "Compare players to see if they have the same role.", 0x4169E1, [
+    ("💭 Your Power", "Compare target with previously investigated players"),
+    ("📝 Command", f"`{prefix}id <player_name>`"),
+    ("💡 Example", f"`{prefix}id Bob` → Compare Bob with your previous targets"),
+])
+for _role, _power in (('guardian angel', "Protect from death"), ('bodyguard', "Die instead of target if attacked")):
+    NIGHT_PROMPTS.register((_role,), f"🛡️ {_role.title()} - Night Action", "You can protect another player tonight.", 0x32CD32, [
+        ("💭 Your Power", _power),
+        ("📝 Command", f"`{prefix}guard <player_name>`"),
+        ("💡 Example", f"`{prefix}guard Emma` → Protect Emma from attacks"),
+    ])
+WOLF_KILL_FIELDS = [
+    ("💭 Your Power", "Vote to kill a villager with your pack"),
+    ("📝 Command", f"`{prefix}kill <player_name>`"),
+    ("💡 Example", f"`{prefix}kill Charlie` → Vote to kill Charlie tonight"),
+    ("🔄 How Wolf Kills Work", "• All wolves vote on who to kill\n• Most voted target dies\n• Coordinate with your pack!"),
+]
+
+def register_wolf_prompt(role: str, power_fields):
+    """Wolves with a power of their own still vote on the pack kill: the kill prompt plus their power"""
+    NIGHT_PROMPTS.register((role,), "🐺 Wolf Pack - Night Kill", "Time to hunt! Choose who to eliminate tonight.",
+                           0x8B0000, WOLF_KILL_FIELDS + power_fields)
+
+NIGHT_PROMPTS.register(ACTUAL_WOLVES, "🐺 Wolf Pack - Night Kill", "Time to hunt! Choose who to eliminate tonight.",
+                       0x8B0000, WOLF_KILL_FIELDS)
+register_wolf_prompt('werecrow', [
+    ("👁️ Werecrow Power", "See who visits your target tonight"),
+    ("📝 Command", f"`{prefix}observe <player_name>`"),
+])
+register_wolf_prompt('doomsayer', [
+    ("💀 Doomsayer Power", "Once per game, doom a player to die the next day"),
+    ("📝 Command", f"`{prefix}doom <player_name>`"),
+])
+NIGHT_PROMPTS.register(('vigilante',), "🔫 Vigilante - Night Action", "Take justice into your own hands.", 0x654321, [
+    ("💭 Your Power", "Kill a player you suspect of being evil"),
+    ("📝 Command", f"`{prefix}kill <player_name>`"),
+    ("💡 Example", f"`{prefix}kill Suspect` → Kill your suspected target"),
+    ("⚠️ Warning", "Choose carefully - you might kill an innocent!"),
+])
+NIGHT_PROMPTS.register(('village drunk',), "🍺 Village Drunk - Night Action", "Shoot... but you might miss!", 0xD2691E, [
+    ("💭 Your Power", "Shoot someone, but accuracy is not guaranteed"),
+    ("📝 Command", f"`{prefix}shoot <player_name>`"),
+    ("💡 Example", f"`{prefix}shoot Target` → Attempt to shoot Target"),
+    ("🎯 Drunk Effects", "• You might miss completely\n• You might hit someone nearby\n• Drink responsibly!"),
+])
+NIGHT_PROMPTS.register(('harlot',), "💃 Harlot - Night Action", "Visit someone and stay safe from wolves.", 0xFF69B4, [
+    ("💭 Your Power", "Visit a player and become immune to wolf attacks"),
+    ("📝 Command", f"`{prefix}visit <player_name>`"),
+    ("💡 Example", f"`{prefix}visit Frank` → Visit Frank tonight"),
+    ("🛡️ Safety", "You're safe from wolves while visiting!"),
+])
+for _role in ('shaman', 'wolf shaman', 'crazed shaman'):
+    _totems = SHAMAN_TOTEMS if _role == 'shaman' else WOLF_SHAMAN_TOTEMS
+    _fields = [
+        ("💭 Your Power" if _role != 'wolf shaman' else "🎭 Shaman Power", "Give a totem with special effects to any player"),
+        ("📝 Command", f"`{prefix}give <player_name> <totem_name>`"),
+        ("💡 Example", f"`{prefix}give Grace protection_totem`"),
+        ("🎭 Available Totems", "\n".join(f"• `{t}`" for t in _totems[:8])),
+    ]
+    if len(_totems) > 8:
+        _fields.append(("🎭 More Totems", "\n".join(f"• `{t}`" for t in _totems[8:])))
+    if _role == 'wolf shaman':
+        register_wolf_prompt(_role, _fields)
+    else:
+        NIGHT_PROMPTS.register((_role,), f"🎭 {_role.title()} - Night Action", "Give a magical totem to another player.",
+                               0x9932CC if _role == 'shaman' else 0x8B0000, _fields)
+NIGHT_PROMPTS.register(('mystic',), "🔮 Mystic - Night Action", "Use mysticism to detect power roles.", 0x9932CC, [
+    ("💭 Your Power", "Learn if a player has an active power role"),
+    ("📝 Command", f"`{prefix}mysticism <player_name>`"),
+    ("💡 Example", f"`{prefix}mysticism Henry` → Learn if Henry has powers"),
+])
+register_wolf_prompt('wolf mystic', [
+    ("🔮 Mystic Power", "Learn if a player has an active power role"),
+    ("📝 Command", f"`{prefix}mysticism <player_name>`"),
+])
+NIGHT_PROMPTS.register(('priest',), "✨ Priest - Night Action", "Bless a player to protect them from lycanthropy.", 0xFFD700, [
+    ("💭 Your Power", "Protect a player from being turned into a wolf"),
+    ("📝 Command", f"`{prefix}bless <player_name>`"),
+    ("💡 Example", f"`{prefix}bless Isabella` → Bless Isabella tonight"),
+    ("🛡️ Protection", "Blessed players cannot be turned by lycanthropy totem"),
+])
+NIGHT_PROMPTS.register(('augur',), "🔮 Augur - Night Action", "See if a player can kill others.", 0x8A2BE2, [
+    ("💭 Your Power", "Learn if target can kill (wolves, vigilante, etc.)"),
+    ("📝 Command", f"`{prefix}see <player_name>`"),
+    ("💡 Example", f"`{prefix}see Jack` → Learn if Jack can kill"),
+])
+
+# Alive players, rendered once a night and shared by every prompt
+night_roster = Roster("🎯 Alive Players")
+
+def night_prompt_embed(player_id: int) -> Optional[discord.Embed]:
+    """The night action prompt for a player's role, or None if the role has no night action"""
+    role = game_state.players[player_id]['role']
+    if role not in NIGHT_PROMPTS:
+        return None
+    extra = [night_roster.field(game_state.get_alive_players(), display_name)]
+    
+    if role in ACTUAL_WOLVES:
+        # Add wolf allies info
+        wolf_allies = [f"{display_name(pid)} ({game_state.players[pid]['role']})"
+                       for pid in game_state.get_players_by_team('wolf') if pid != player_id]
+        if wolf_allies:
+            extra.append(("🐺 Your Wolf Allies", "\n".join(wolf_allies)))
+    
+    return NIGHT_PROMPTS.render(role, extra)
+
+@tracer.traced()
 async def send_night_prompts():
     """Send night action prompts to players"""
+    if NIGHT_PROMPT_MODE == 'interaction':
+        channel = bot.get_channel(game_state.channel_id)
+        if channel is not None:
+            # One message for everyone; each player opens their own prompt ephemerally
+            current_span().add_players(game_state.get_alive_players())
+            await outbound.send(
+                channel,
+                f"🌙 Press **Night action** to see your options (only you will see them), "
+                f"or use the slash commands like `/see` and `/kill`.",
+                view=NightActionView(game_state.day_number, game_state.settings['night_length']),
+                priority=Priority.PROMPT
+            )
+            return
+    
     for player_id, player_data in game_state.players.items():
         if not player_data['alive']:
             continue
@@ -2858,587 +2469,265 @@ async def send_night_prompts():
         user = bot.get_user(player_id)
         if not user:
             continue
+        current_span().add_players((player_id,))
         
         # Check if silenced
         if player_data.get('silenced', False):
             try:
-                await user.send("🔇 You are silenced and cannot use your power tonight.")
+                await outbound.send(user, "🔇 You are silenced and cannot use your power tonight.", priority=Priority.PROMPT)
             except:
                 pass
             continue
         
-        # Send appropriate prompt based on role
-        embed = None
-        if role == 'seer':
-            embed = discord.Embed(
-                title="🔮 Seer - Night Action",
-                description="You can see the exact role of any player.",
-                color=0x8A2BE2
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="Learn the exact role of a target player",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}see <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}see John` → You'll learn John's exact role",
-                inline=False
-            )
-            
-        elif role == 'oracle':
-            embed = discord.Embed(
-                title="🔮 Oracle - Night Action",
-                description="You can see which team a player belongs to.",
-                color=0x8A2BE2
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Learn if target is Village/Wolf/Neutral team",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}see <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}see Alice` → You'll learn Alice's team",
-                inline=False
-            )
-            
-        elif role == 'detective':
-            embed = discord.Embed(
-                title="🕵️ Detective - Night Action",
-                description="Compare players to see if they have the same role.",
-                color=0x4169E1
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="Compare target with previously investigated players",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}id <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}id Bob` → Compare Bob with your previous targets",
-                inline=False
-            )
-            
-        elif role in ['guardian angel', 'bodyguard']:
-            action_desc = "Protect from death" if role == 'guardian angel' else "Die instead of target if attacked"
-            embed = discord.Embed(
-                title=f"🛡️ {role.title()} - Night Action",
-                description=f"You can protect another player tonight.",
-                color=0x32CD32
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value=action_desc,
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}guard <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}guard Emma` → Protect Emma from attacks",
-                inline=False
-            )
-            
-        elif role in ACTUAL_WOLVES:  # Wolf, Wolf Cub, Werekitten, Wolf Shaman, Wolf Mystic
-            embed = discord.Embed(
-                title="🐺 Wolf Pack - Night Kill",
-                description="Time to hunt! Choose who to eliminate tonight.",
-                color=0x8B0000
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="Vote to kill a villager with your pack",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}kill <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}kill Charlie` → Vote to kill Charlie tonight",
-                inline=False
-            )
-            embed.add_field(
-                name="🔄 How Wolf Kills Work",
-                value="• All wolves vote on who to kill\n• Most voted target dies\n• Coordinate with your pack!",
-                inline=False
-            )
-            
-            # Add wolf allies info
-            wolf_allies = []
-            for pid in game_state.get_players_by_team('wolf'):
-                if pid != player_id:
-                    ally_user = bot.get_user(pid)
-                    if ally_user:
-                        ally_role = game_state.players[pid]['role']
-                        wolf_allies.append(f"{ally_user.display_name} ({ally_role})")
-            
-            if wolf_allies:
-                embed.add_field(
-                    name="🐺 Your Wolf Allies",
-                    value="\n".join(wolf_allies),
-                    inline=False
-                )
-                
-        elif role == 'werecrow':
-            embed = discord.Embed(
-                title="👁️ Werecrow - Night Action",
-                description="Watch and see who visits your target.",
-                color=0x8B0000
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="See who visits your target tonight",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}observe <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}observe David` → See who visits David",
-                inline=False
-            )
-            
-        elif role == 'vigilante':
-            embed = discord.Embed(
-                title="🔫 Vigilante - Night Action",
-                description="Take justice into your own hands.",
-                color=0x654321
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="Kill a player you suspect of being evil",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}kill <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}kill Suspect` → Kill your suspected target",
-                inline=False
-            )
-            embed.add_field(
-                name="⚠️ Warning",
-                value="Choose carefully - you might kill an innocent!",
-                inline=False
-            )
-            
-        elif role == 'village drunk':
-            embed = discord.Embed(
-                title="🍺 Village Drunk - Night Action",
-                description="Shoot... but you might miss!",
-                color=0xD2691E
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Shoot someone, but accuracy is not guaranteed",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}shoot <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}shoot Target` → Attempt to shoot Target",
-                inline=False
-            )
-            embed.add_field(
-                name="🎯 Drunk Effects",
-                value="• You might miss completely\n• You might hit someone nearby\n• Drink responsibly!",
-                inline=False
-            )
-            
-        elif role == 'harlot':
-            embed = discord.Embed(
-                title="💃 Harlot - Night Action",
-                description="Visit someone and stay safe from wolves.",
-                color=0xFF69B4
-            )
-            embed.add_field(
-                name="� Your Power",
-                value="Visit a player and become immune to wolf attacks",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}visit <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}visit Frank` → Visit Frank tonight",
-                inline=False
-            )
-            embed.add_field(
-                name="🛡️ Safety",
-                value="You're safe from wolves while visiting!",
-                inline=False
-            )
-            
-        elif role in ['shaman', 'wolf shaman', 'crazed shaman']:
-            totems = SHAMAN_TOTEMS if role == 'shaman' else WOLF_SHAMAN_TOTEMS
-            team_color = 0x9932CC if role == 'shaman' else 0x8B0000
-            
-            embed = discord.Embed(
-                title=f"🎭 {role.title()} - Night Action",
-                description="Give a magical totem to another player.",
-                color=team_color
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Give a totem with special effects to any player",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}give <player_name> <totem_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}give Grace protection_totem`",
-                inline=False
-            )
-            embed.add_field(
-                name="🎭 Available Totems",
-                value="\n".join([f"• `{t}`" for t in totems[:8]]),  # Show first 8
-                inline=False
-            )
-            
-            if len(totems) > 8:
-                embed.add_field(
-                    name="🎭 More Totems",
-                    value="\n".join([f"• `{t}`" for t in totems[8:]]),
-                    inline=False
-                )
-        
-        elif role in ['mystic', 'wolf mystic']:
-            team_color = 0x9932CC if role == 'mystic' else 0x8B0000
-            embed = discord.Embed(
-                title=f"🔮 {role.title()} - Night Action",
-                description="Use mysticism to detect power roles.",
-                color=team_color
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Learn if a player has an active power role",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}mysticism <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}mysticism Henry` → Learn if Henry has powers",
-                inline=False
-            )
-            
-        elif role == 'priest':
-            embed = discord.Embed(
-                title="✨ Priest - Night Action",
-                description="Bless a player to protect them from lycanthropy.",
-                color=0xFFD700
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Protect a player from being turned into a wolf",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}bless <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}bless Isabella` → Bless Isabella tonight",
-                inline=False
-            )
-            embed.add_field(
-                name="🛡️ Protection",
-                value="Blessed players cannot be turned by lycanthropy totem",
-                inline=False
-            )
-            
-        elif role == 'augur':
-            embed = discord.Embed(
-                title="🔮 Augur - Night Action",
-                description="See if a player can kill others.",
-                color=0x8A2BE2
-            )
-            embed.add_field(
-                name="💭 Your Power",
-                value="Learn if target can kill (wolves, vigilante, etc.)",
-                inline=False
-            )
-            embed.add_field(
-                name="📝 Command",
-                value=f"`{prefix}see <player_name>`",
-                inline=False
-            )
-            embed.add_field(
-                name="💡 Example",
-                value=f"`{prefix}see Jack` → Learn if Jack can kill",
-                inline=False
-            )
+        embed = night_prompt_embed(player_id)
         
         # Send the embed if one was created
         if embed:
             try:
-                await user.send(embed=embed)
+                await outbound.send(user, embed=embed, priority=Priority.PROMPT)
             except Exception as e:
                 logger.error(f"Failed to send night prompt to {user.display_name}: {e}")
                 # Fallback to simple text
                 simple_prompt = f"🌙 **Night Action Available** - Use commands in this DM!"
                 try:
-                    await user.send(simple_prompt)
+                    await outbound.send(user, simple_prompt, priority=Priority.PROMPT)
                 except:
                     pass
                 pass
 
+def deliver_private_results(results: PrivateResults):
+    """DM every player their night results in the background"""
+    if not results:
+        return
+    
+    async def _deliver():
+        with tracer.span('night_results', recipients=len(results)):
+            status = await results.dispatch(bot.get_user, concurrency=RESULT_DM_CONCURRENCY, send=outbound.send)
+        if game_state.active:
+            game_state.result_delivery = dict(status)
+        for player_id, outcome in status.items():
+            if outcome != SENT:
+                logger.warning(f"Night result DM to {player_id} not delivered: {outcome}")
+    
+    task = asyncio.create_task(_deliver(), name='night_results')
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+@tracer.traced()
 async def end_night_phase(ctx):
     """End night phase and process actions"""
+    wolf_digest.cancel()
     # Process all night actions
     deaths = []
     protections = set()
     totem_effects = {}
-    
-    # First, process totem giving (happens immediately)
-    for player_id, action in game_state.night_actions.items():
-        if action['action'] == 'give':
-            target_id = action['target']
-            totem = action['totem']
-            game_state.players[target_id]['totem'] = totem
-            totem_effects[target_id] = totem
-    
-    # Process protective actions
-    for player_id, action in game_state.night_actions.items():
-        if action['action'] == 'guard':
-            target_id = action['target']
-            protections.add(target_id)
-            game_state.players[target_id]['protected'] = True
-    
-    # Process totem effects that happen immediately
-    for player_id, totem in totem_effects.items():
-        if totem == 'death_totem':
-            deaths.append((player_id, 'death totem'))
-        elif totem == 'protection_totem':
-            protections.add(player_id)
-            game_state.players[player_id]['protected'] = True
-        elif totem == 'blinding_totem':
-            game_state.players[player_id]['injured'] = True
-        elif totem == 'silence_totem':
-            game_state.players[player_id]['silenced'] = True
-        elif totem == 'cursed_totem':
-            if game_state.players[player_id].get('template') != 'cursed':
-                game_state.players[player_id]['template'] = 'cursed'
-    
-    # Process wolf kills
-    wolf_targets = []
-    for player_id, action in game_state.night_actions.items():
-        if (action['action'] == 'kill' and 
-            game_state.players[player_id]['role'] in ACTUAL_WOLVES):
-            wolf_targets.append(action['target'])
-    
-    # Wolves kill most common target
-    if wolf_targets:
-        from collections import Counter
-        target_counts = Counter(wolf_targets)
-        wolf_target = target_counts.most_common(1)[0][0]
-        
-        # Check totem effects on wolf target
-        target_totem = game_state.players[wolf_target].get('totem')
-        
-        if target_totem == 'lycanthropy_totem':
-            # Turn into wolf instead of dying
-            game_state.players[wolf_target]['role'] = 'wolf'
-            game_state.players[wolf_target]['totem'] = None
-            wolf_user = bot.get_user(wolf_target)
-            await ctx.send(f"🐺 **{wolf_user.display_name}** was bitten by wolves and transformed!")
-        elif target_totem == 'retribution_totem':
-            # Kill a random wolf
-            alive_wolves = [pid for pid in game_state.get_alive_players() 
-                          if game_state.players[pid]['role'] in ACTUAL_WOLVES]
-            if alive_wolves:
-                import random
-                revenge_target = random.choice(alive_wolves)
-                deaths.append((revenge_target, 'retribution totem'))
-            deaths.append((wolf_target, 'wolves'))
-        elif wolf_target not in protections:
-            deaths.append((wolf_target, 'wolves'))
-    
-    # Process other kills (vigilante, serial killer, etc.)
-    for player_id, action in game_state.night_actions.items():
-        if action['action'] == 'kill':
-            role = game_state.players[player_id]['role']
-            target = action['target']
-            
-            if role == 'vigilante' and target not in protections:
-                deaths.append((target, 'vigilante'))
-            elif role in ['serial killer', 'monster'] and target not in protections:
-                deaths.append((target, role))
-    
-    # Process other night actions (seers, etc.)
-    for player_id, action in game_state.night_actions.items():
-        if action['action'] == 'see':
-            # Process seer/oracle results (send to player)
-            await process_seer_action(player_id, action)
-        elif action['action'] == 'visit':
-            # Harlot/Succubus visits
-            await process_visit_action(player_id, action)
-        elif action['action'] == 'hex':
-            # Hag hex (mark for role exchange on death)
-            game_state.players[player_id]['hex_target'] = action['target']
-        elif action['action'] == 'charm':
-            # Piper charm
-            game_state.players[action['target']]['charmed'] = True
-        elif action['action'] == 'mysticism':
-            # Mystic/Wolf Mystic power check
-            await process_mysticism_action(player_id, action)
-        elif action['action'] == 'bless':
-            # Priest blessing (protects from lycanthropy)
-            target_id = action['target']
-            game_state.players[target_id]['blessed'] = True
-            user = bot.get_user(player_id)
-            target_user = bot.get_user(target_id)
-            try:
-                await user.send(f"✨ You blessed **{target_user.display_name}** - they are now protected from lycanthropy!")
-            except:
+    # Private results are sent together once dawn has been announced
+    results = PrivateResults()
+    
+    with tracer.span('night_totems'):
+        # First, process totem giving (happens immediately)
+        for player_id, action in game_state.night_actions.items():
+            if action['action'] == 'give':
+                target_id = action['target']
+                totem = action['totem']
+                game_state.players[target_id]['totem'] = totem
+                totem_effects[target_id] = totem
+    
+        # Process protective actions
+        for player_id, action in game_state.night_actions.items():
+            if action['action'] == 'guard':
+                target_id = action['target']
+                protections.add(target_id)
+                game_state.players[target_id]['protected'] = True
+    
+        # Process totem effects that happen immediately
+        for player_id, totem in totem_effects.items():
+            if totem == 'death_totem':
+                deaths.append((player_id, 'death totem'))
+            elif totem == 'protection_totem':
+                protections.add(player_id)
+                game_state.players[player_id]['protected'] = True
+            elif totem == 'blinding_totem':
+                game_state.players[player_id]['injured'] = True
+            elif totem == 'silence_totem':
+                game_state.players[player_id]['silenced'] = True
+            elif totem == 'cursed_totem':
+                if game_state.players[player_id].get('template') != 'cursed':
+                    game_state.players[player_id]['template'] = 'cursed'
+    
+    with tracer.span('night_kills'):
+        # Process wolf kills
+        wolf_targets = list(wolf_kill_votes().values())
+    
+        # Wolves kill most common target
+        if wolf_targets:
+            target_counts = Counter(wolf_targets)
+            wolf_target = target_counts.most_common(1)[0][0]
+        
+            # Check totem effects on wolf target
+            target_totem = game_state.players[wolf_target].get('totem')
+        
+            if target_totem == 'lycanthropy_totem':
+                # Turn into wolf instead of dying
+                game_state.players[wolf_target]['role'] = 'wolf'
+                game_state.players[wolf_target]['totem'] = None
+                wolf_name = display_name(wolf_target)
+                await outbound.send(ctx, f"🐺 **{wolf_name}** was bitten by wolves and transformed!")
+            elif target_totem == 'retribution_totem':
+                # Kill a random wolf
+                alive_wolves = [pid for pid in game_state.get_alive_players() 
+                              if game_state.players[pid]['role'] in ACTUAL_WOLVES]
+                if alive_wolves:
+                    import random
+                    revenge_target = random.choice(alive_wolves)
+                    deaths.append((revenge_target, 'retribution totem'))
+                deaths.append((wolf_target, 'wolves'))
+            elif (game_state.players[wolf_target]['role'] == 'harlot' and
+                  game_state.night_actions.get(wolf_target, {}).get('action') == 'visit'):
+                # The harlot was out visiting, so the wolves found an empty house
                 pass
-        elif action['action'] == 'observe':
-            # Werecrow observation
-            await process_observe_action(player_id, action)
-        elif action['action'] == 'id':
-            # Detective investigation
-            await process_detective_action(player_id, action)
-        elif action['action'] == 'shoot':
-            # Village drunk shooting
-            await process_drunk_shot(player_id, action, deaths)
-        elif action['action'] == 'curse':
-            # Warlock curse (mark for death in 2 nights)
-            await process_curse_action(player_id, action)
-        elif action['action'] == 'remember':
-            # Amnesiac remembering
-            await process_remember_action(player_id, action)
-        elif action['action'] == 'turn':
-            # Turncoat changing teams
-            await process_turn_action(player_id, action)
-        elif action['action'] == 'doom':
-            # Doomsayer doom (mark for day kill)
-            await process_doom_action(player_id, action)
-    
-    # Apply deaths with role reveals
-    death_messages = []
-    for victim_id, killer in deaths:
-        victim_user = bot.get_user(victim_id)
-        victim_role = game_state.players[victim_id]['role']
-        victim_template = game_state.players[victim_id].get('template')
-        
-        # Format role display
-        role_display = victim_role.replace('_', ' ').title()
-        if victim_template:
-            role_display += f" ({victim_template.replace('_', ' ').title()})"
-        
-        game_state.players[victim_id]['alive'] = False
-        game_state.dead_players[victim_id] = victim_role
-        
-        death_messages.append(f"💀 **{victim_user.display_name}** ({role_display}) was killed by {killer}!")
-        
-        # Handle chat permissions and death effects
-        await handle_player_death(victim_id, ctx)
-        await process_death_effects(ctx, victim_id, 'night')
-    
-    # Clear temporary effects
-    for player_id in game_state.players:
-        game_state.players[player_id]['protected'] = False
-        # Clear totems that are one-time use
-        totem = game_state.players[player_id].get('totem')
-        if totem in ['death_totem', 'protection_totem', 'revealing_totem', 'lycanthropy_totem', 'retribution_totem']:
-            game_state.players[player_id]['totem'] = None
-    
-    # Send death report
-    game_state.day_number += 1
+            elif wolf_target not in protections:
+                deaths.append((wolf_target, 'wolves'))
+                # A harlot visiting the victim is caught by the wolves too
+                for visitor_id in game_state.night_actions.visitors(wolf_target, 'visit'):
+                    if game_state.players[visitor_id]['role'] == 'harlot':
+                        deaths.append((visitor_id, 'wolves'))
+            else:
+                # A bodyguard dies in place of the player they guard
+                for guard_id in game_state.night_actions.visitors(wolf_target, 'guard'):
+                    if game_state.players[guard_id]['role'] == 'bodyguard':
+                        deaths.append((guard_id, 'wolves'))
+                        break
+    
+        # Process other kills (vigilante, serial killer, etc.)
+        for player_id, action in game_state.night_actions.items():
+            if action['action'] == 'kill':
+                role = game_state.players[player_id]['role']
+                target = action['target']
+            
+                if role == 'vigilante' and target not in protections:
+                    deaths.append((target, 'vigilante'))
+                elif role in ['serial killer', 'monster'] and target not in protections:
+                    deaths.append((target, role))
+    
+    with tracer.span('night_actions'):
+        # Process other night actions (seers, etc.)
+        for player_id, action in game_state.night_actions.items():
+            if action['action'] == 'see':
+                # Process seer/oracle results (send to player)
+                process_seer_action(player_id, action, results)
+            elif action['action'] == 'visit':
+                # Harlot/Succubus visits
+                await process_visit_action(player_id, action)
+            elif action['action'] == 'hex':
+                # Hag hex (mark for role exchange on death)
+                game_state.players[player_id]['hex_target'] = action['target']
+            elif action['action'] == 'charm':
+                # Piper charm
+                game_state.players[action['target']]['charmed'] = True
+            elif action['action'] == 'mysticism':
+                # Mystic/Wolf Mystic power check
+                process_mysticism_action(player_id, action, results)
+            elif action['action'] == 'bless':
+                # Priest blessing (protects from lycanthropy)
+                target_id = action['target']
+                game_state.players[target_id]['blessed'] = True
+                target_name = display_name(target_id)
+                results.add(player_id, f"✨ You blessed **{target_name}** - they are now protected from lycanthropy!")
+            elif action['action'] == 'observe':
+                # Werecrow observation
+                process_observe_action(player_id, action, results)
+            elif action['action'] == 'id':
+                # Detective investigation
+                process_detective_action(player_id, action, results)
+            elif action['action'] == 'shoot':
+                # Village drunk shooting
+                process_drunk_shot(player_id, action, deaths, results)
+            elif action['action'] == 'curse':
+                # Warlock curse (mark for death in 2 nights)
+                process_curse_action(player_id, action, results)
+            elif action['action'] == 'remember':
+                # Amnesiac remembering
+                process_remember_action(player_id, action, results)
+            elif action['action'] == 'turn':
+                # Turncoat changing teams
+                process_turn_action(player_id, action, results)
+            elif action['action'] == 'doom':
+                # Doomsayer doom (mark for day kill)
+                process_doom_action(player_id, action, results)
+    
+    with tracer.span('night_deaths'):
+        # Apply deaths with role reveals, including everyone they take along
+        cascade = await kill_players(ctx, deaths)
+        death_messages = []
+        for death in cascade.deaths:
+            if death.source is None:
+                victim_name = display_name(death.player_id)
+                death_messages.append(f"💀 **{victim_name}** ({format_role(death.player_id)}) was killed by {death.cause}!")
+        death_messages.extend(chained_death_lines(cascade))
+        
+        # Clear temporary effects
+        for player_id in game_state.players:
+            game_state.players[player_id]['protected'] = False
+            # Clear totems that are one-time use
+            totem = game_state.players[player_id].get('totem')
+            if totem in ['death_totem', 'protection_totem', 'revealing_totem', 'lycanthropy_totem', 'retribution_totem']:
+                game_state.players[player_id]['totem'] = None
+    
+        # Send death report
+        game_state.day_number += 1
+    
+        if death_messages:
+            embed = discord.Embed(
+                title=f"🌅 Day {game_state.day_number}",
+                description="\n".join(death_messages),
+                color=0xFFD700
+            )
+        else:
+            embed = discord.Embed(
+                title=f"🌅 Day {game_state.day_number}",
+                description=msg('nokills'),
+                color=0xFFD700
+            )
     
-    if death_messages:
-        embed = discord.Embed(
-            title=f"🌅 Day {game_state.day_number}",
-            description="\n".join(death_messages),
-            color=0xFFD700
-        )
-    else:
-        embed = discord.Embed(
-            title=f"🌅 Day {game_state.day_number}",
-            description="The village wakes up to find everyone alive!",
-            color=0xFFD700
-        )
+        await outbound.send(ctx, embed=embed)
     
-    await ctx.send(embed=embed)
+    deliver_private_results(results)
     
     # Check win conditions
     if await check_win_conditions(ctx):
         return
     
-    # Start new day
-    game_state.phase = "day"
-    game_state.day_number += 1
-    game_state.votes.clear()
+    with tracer.span('night_new_day'):
+        # Start new day
+        game_state.phase = "day"
+        game_state.day_number += 1
+        game_state.votes.clear()
     
-    # Announce new day
-    embed = discord.Embed(
-        title=f"🌅 Day {game_state.day_number} Begins!",
-        description=f"The sun rises on day {game_state.day_number}...\n\nDiscuss and vote to lynch someone suspicious!\n\n⏰ **2 minutes** to vote (or until everyone votes)",
-        color=0xFFD700
-    )
+        # Announce new day
+        embed = discord.Embed(
+            title=f"🌅 Day {game_state.day_number} Begins!",
+            description=f"The sun rises on day {game_state.day_number}...\n\nDiscuss and vote to lynch someone suspicious!\n\n⏰ **2 minutes** to vote (or until everyone votes)",
+            color=0xFFD700
+        )
     
-    alive_players = game_state.get_alive_players()
-    player_list = [bot.get_user(uid).display_name for uid in alive_players]
-    embed.add_field(
-        name=f"Alive Players ({len(player_list)})",
-        value="\n".join(player_list),
-        inline=False
-    )
+        alive_players = game_state.get_alive_players()
+        player_list = [display_name(uid) for uid in alive_players]
+        embed.add_field(
+            name=f"Alive Players ({len(player_list)})",
+            value="\n".join(player_list),
+            inline=False
+        )
     
-    await ctx.send(embed=embed)
+        await outbound.send(ctx, embed=embed)
     
-    await start_phase_timer(ctx, "day", game_state.settings['day_length'])
+        await start_phase_timer(ctx, "day", game_state.settings['day_length'])
 
-async def process_seer_action(player_id: int, action: dict):
+def process_seer_action(player_id: int, action: dict, results: PrivateResults):
     """Process seer/oracle vision results"""
     try:
-        seer_user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         
         role = game_state.players[player_id]['role']
         target_role = game_state.players[target_id]['role']
@@ -3457,7 +2746,7 @@ async def process_seer_action(player_id: int, action: dict):
             else:
                 shown_role = target_role
             
-            await seer_user.send(f"🔮 **Seer Vision**: {target_user.display_name} is a **{shown_role}**!")
+            results.add(player_id, f"🔮 **Seer Vision**: {target_name} is a **{shown_role}**!")
             
         elif role == 'oracle':
             # Show team
@@ -3468,7 +2757,7 @@ async def process_seer_action(player_id: int, action: dict):
             else:
                 team = "Neutral"
             
-            await seer_user.send(f"🔮 **Oracle Vision**: {target_user.display_name} is on the **{team}** team!")
+            results.add(player_id, f"🔮 **Oracle Vision**: {target_name} is on the **{team}** team!")
             
         elif role == 'augur':
             # Check if target can kill
@@ -3477,7 +2766,7 @@ async def process_seer_action(player_id: int, action: dict):
             if flip_result:
                 result = "cannot kill" if can_kill else "can kill"
             
-            await seer_user.send(f"🔮 **Augur Vision**: {target_user.display_name} **{result}**!")
+            results.add(player_id, f"🔮 **Augur Vision**: {target_name} **{result}**!")
             
     except Exception as e:
         logger.error(f"Error processing seer action: {e}")
@@ -3497,6 +2786,7 @@ async def process_visit_action(player_id: int, action: dict):
             if target_id in visits:
                 # Second visit - kill target
                 game_state.players[target_id]['alive'] = False
+                game_state.seating.remove(target_id)
                 target_user = bot.get_user(target_id)
                 # This would need to be added to death messages in main function
             else:
@@ -3506,87 +2796,11 @@ async def process_visit_action(player_id: int, action: dict):
     except Exception as e:
         logger.error(f"Error processing visit action: {e}")
 
-async def process_death_effects(ctx, player_id: int, death_type: str):
-    """Process special effects when a player dies"""
-    role = game_state.players[player_id]['role']
-    template = game_state.players[player_id].get('template')
-    user = bot.get_user(player_id)
-    
-    # Handle chat permissions for dead player
-    await handle_player_death(player_id, ctx)
-    
-    # Lover death - if player has a lover, the lover dies too
-    lover_id = game_state.players[player_id].get('lover')
-    if lover_id and game_state.is_player_alive(lover_id):
-        lover_user = bot.get_user(lover_id)
-        lover_role = game_state.players[lover_id]['role']
-        lover_template = game_state.players[lover_id].get('template')
-        
-        # Format role display
-        lover_role_display = lover_role.replace('_', ' ').title()
-        if lover_template:
-            lover_role_display += f" ({lover_template.replace('_', ' ').title()})"
-        
-        # Kill the lover
-        game_state.players[lover_id]['alive'] = False
-        game_state.dead_players[lover_id] = lover_role
-        
-        await ctx.send(f"💔 **{lover_user.display_name}** ({lover_role_display}) dies of heartbreak after losing their lover!")
-        
-        # Handle lover's death effects recursively (but prevent infinite loop)
-        await handle_player_death(lover_id, ctx)
-        if lover_id != player_id:  # Prevent infinite recursion
-            await process_death_effects(ctx, lover_id, 'heartbreak')
-    
-    # Assassin template - kill target when assassin dies
-    if template == 'assassin':
-        assassin_target = game_state.players[player_id].get('assassin_target')
-        if assassin_target and game_state.is_player_alive(assassin_target):
-            target_user = bot.get_user(assassin_target)
-            target_role = game_state.players[assassin_target]['role']
-            target_template = game_state.players[assassin_target].get('template')
-            
-            # Format role display
-            role_display = target_role.replace('_', ' ').title()
-            if target_template:
-                role_display += f" ({target_template.replace('_', ' ').title()})"
-            
-            # Kill the target
-            game_state.players[assassin_target]['alive'] = False
-            game_state.dead_players[assassin_target] = target_role
-            
-            await ctx.send(f"💀 **Assassin's Revenge!** {user.display_name}'s death triggers their assassination target!\n\n⚰️ **{target_user.display_name}** ({role_display}) dies with the assassin!")
-            
-            # Handle target's death effects recursively
-            await handle_player_death(assassin_target, ctx)
-            await process_death_effects(ctx, assassin_target, 'assassin')
-    
-    # Hunter revenge kill
-    if role == 'hunter':
-        # Hunter can kill someone when they die
-        # This would normally prompt the player, simplified here
-        pass
-    
-    # Mad Scientist template/role - kill adjacent players
-    if role == 'mad scientist':
-        # Kill adjacent players (would need to implement seating order)
-        pass
-    
-    # Wolf cub effect
-    if role == 'wolf cub':
-        # Wolves get extra kill next night (would be implemented in night processing)
-        pass
-    
-    # Jester/Fool win condition
-    if role in ['jester', 'fool'] and death_type == 'lynch':
-        await announce_winner(ctx, 'jester', [player_id])
-
-async def process_mysticism_action(player_id: int, action: dict):
+def process_mysticism_action(player_id: int, action: dict, results: PrivateResults):
     """Process mysticism power (mystic/wolf mystic)"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         target_role = game_state.players[target_id]['role']
         
         # Check if target has active power role
@@ -3598,43 +2812,39 @@ async def process_mysticism_action(player_id: int, action: dict):
         has_power = target_role in power_roles
         result = "has an active power role" if has_power else "does not have an active power role"
         
-        await user.send(f"🔮 **Mysticism Result**: {target_user.display_name} **{result}**!")
+        results.add(player_id, f"🔮 **Mysticism Result**: {target_name} **{result}**!")
         
     except Exception as e:
         logger.error(f"Error processing mysticism action: {e}")
 
-async def process_observe_action(player_id: int, action: dict):
+def process_observe_action(player_id: int, action: dict, results: PrivateResults):
     """Process werecrow observation"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         
-        # Check who visited the target (simplified - would need visit tracking)
+        # Check who visited the target
         visitors = []
-        for pid, player_action in game_state.night_actions.items():
-            if (player_action.get('action') == 'visit' and 
-                player_action.get('target') == target_id and 
-                pid != player_id):
+        for pid in game_state.night_actions.visitors(target_id, 'visit'):
+            if pid != player_id:
                 visitor_user = bot.get_user(pid)
                 if visitor_user:
                     visitors.append(visitor_user.display_name)
         
         if visitors:
             visitor_list = ", ".join(visitors)
-            await user.send(f"👁️ **Observation**: {target_user.display_name} was visited by: {visitor_list}")
+            results.add(player_id, f"👁️ **Observation**: {target_name} was visited by: {visitor_list}")
         else:
-            await user.send(f"👁️ **Observation**: {target_user.display_name} had no visitors tonight.")
+            results.add(player_id, f"👁️ **Observation**: {target_name} had no visitors tonight.")
             
     except Exception as e:
         logger.error(f"Error processing observe action: {e}")
 
-async def process_detective_action(player_id: int, action: dict):
+def process_detective_action(player_id: int, action: dict, results: PrivateResults):
     """Process detective investigation"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         target_role = game_state.players[target_id]['role']
         
         # Get detective's previous investigations
@@ -3644,16 +2854,16 @@ async def process_detective_action(player_id: int, action: dict):
         match_found = False
         for prev_target, prev_role in investigations:
             if prev_role == target_role:
-                prev_user = bot.get_user(prev_target)
-                await user.send(f"🕵️ **Detective Result**: {target_user.display_name} has the **same role** as {prev_user.display_name}!")
+                prev_name = display_name(prev_target)
+                results.add(player_id, f"🕵️ **Detective Result**: {target_name} has the **same role** as {prev_name}!")
                 match_found = True
                 break
         
         if not match_found:
             if investigations:
-                await user.send(f"🕵️ **Detective Result**: {target_user.display_name} has a **different role** from your previous investigations!")
+                results.add(player_id, f"🕵️ **Detective Result**: {target_name} has a **different role** from your previous investigations!")
             else:
-                await user.send(f"🕵️ **Detective Result**: {target_user.display_name} is your first investigation!")
+                results.add(player_id, f"🕵️ **Detective Result**: {target_name} is your first investigation!")
         
         # Add to investigations
         investigations.append((target_id, target_role))
@@ -3662,7 +2872,7 @@ async def process_detective_action(player_id: int, action: dict):
     except Exception as e:
         logger.error(f"Error processing detective action: {e}")
 
-async def process_drunk_shot(player_id: int, action: dict, deaths: list):
+def process_drunk_shot(player_id: int, action: dict, deaths: list, results: PrivateResults):
     """Process village drunk shooting (with accuracy issues)"""
     try:
         import random
@@ -3672,48 +2882,44 @@ async def process_drunk_shot(player_id: int, action: dict, deaths: list):
         accuracy = random.random()
         
         if accuracy < 0.3:  # 30% miss completely
-            user = bot.get_user(player_id)
-            await user.send("🍺 **Drunk Shot**: You missed completely! Maybe next time...")
+            results.add(player_id, "🍺 **Drunk Shot**: You missed completely! Maybe next time...")
         elif accuracy < 0.6:  # 30% hit adjacent player
             alive_players = game_state.get_alive_players()
             if len(alive_players) > 1:
-                # Find adjacent players (simplified - random nearby player)
-                nearby_players = [pid for pid in alive_players if pid != player_id and pid != target_id]
+                # Someone sitting next to the intended target
+                nearby_players = [pid for pid in set(game_state.seating.neighbours(target_id))
+                                  if pid is not None and pid != player_id]
                 if nearby_players:
                     actual_target = random.choice(nearby_players)
                     deaths.append((actual_target, 'village drunk (misfired)'))
                     
-                    user = bot.get_user(player_id)
-                    actual_user = bot.get_user(actual_target)
-                    await user.send(f"🍺 **Drunk Shot**: You aimed poorly and hit {actual_user.display_name} instead!")
+                    actual_name = display_name(actual_target)
+                    results.add(player_id, f"🍺 **Drunk Shot**: You aimed poorly and hit {actual_name} instead!")
         else:  # 40% hit intended target
             deaths.append((target_id, 'village drunk'))
-            user = bot.get_user(player_id)
-            target_user = bot.get_user(target_id)
-            await user.send(f"🍺 **Drunk Shot**: You successfully shot {target_user.display_name}!")
+            target_name = display_name(target_id)
+            results.add(player_id, f"🍺 **Drunk Shot**: You successfully shot {target_name}!")
             
     except Exception as e:
         logger.error(f"Error processing drunk shot: {e}")
 
-async def process_curse_action(player_id: int, action: dict):
+def process_curse_action(player_id: int, action: dict, results: PrivateResults):
     """Process warlock curse (2-night delayed kill)"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         
         # Mark target for death in 2 nights
         game_state.players[target_id]['cursed_death'] = game_state.day_number + 2
         
-        await user.send(f"🌙 **Curse Cast**: {target_user.display_name} will die in 2 nights!")
+        results.add(player_id, f"🌙 **Curse Cast**: {target_name} will die in 2 nights!")
         
     except Exception as e:
         logger.error(f"Error processing curse action: {e}")
 
-async def process_remember_action(player_id: int, action: dict):
+def process_remember_action(player_id: int, action: dict, results: PrivateResults):
     """Process amnesiac remembering"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
         
         # Check if target is dead
@@ -3724,47 +2930,45 @@ async def process_remember_action(player_id: int, action: dict):
             # Change role
             game_state.players[player_id]['role'] = new_role
             
-            target_user = bot.get_user(target_id)
-            await user.send(f"🧠 **Memory Restored**: You are now a **{new_role}** (remembered from {target_user.display_name})!")
+            target_name = display_name(target_id)
+            results.add(player_id, f"🧠 **Memory Restored**: You are now a **{new_role}** (remembered from {target_name})!")
             
             # Send new role PM
-            await send_role_pm(bot, player_id)
+            results.add(player_id, embed=role_pm_embed(bot, player_id))
         else:
-            await user.send(f"❌ **Memory Failed**: You can only remember the roles of dead players!")
+            results.add(player_id, f"❌ **Memory Failed**: You can only remember the roles of dead players!")
             
     except Exception as e:
         logger.error(f"Error processing remember action: {e}")
 
-async def process_turn_action(player_id: int, action: dict):
+def process_turn_action(player_id: int, action: dict, results: PrivateResults):
     """Process turncoat team change"""
     try:
-        user = bot.get_user(player_id)
         current_role = game_state.players[player_id]['role']
         
         # Simple team switching logic
         if current_role in VILLAGE_ROLES_ORDERED:
             # Join wolves
             game_state.players[player_id]['team'] = 'wolf'
-            await user.send(f"🔄 **Team Change**: You have joined the wolf team!")
+            results.add(player_id, f"🔄 **Team Change**: You have joined the wolf team!")
         else:
             # Join village
             game_state.players[player_id]['team'] = 'village'
-            await user.send(f"🔄 **Team Change**: You have joined the village team!")
+            results.add(player_id, f"🔄 **Team Change**: You have joined the village team!")
             
     except Exception as e:
         logger.error(f"Error processing turn action: {e}")
 
-async def process_doom_action(player_id: int, action: dict):
+def process_doom_action(player_id: int, action: dict, results: PrivateResults):
     """Process doomsayer doom (next day kill)"""
     try:
-        user = bot.get_user(player_id)
         target_id = action['target']
-        target_user = bot.get_user(target_id)
+        target_name = display_name(target_id)
         
         # Mark target for death next day
         game_state.players[target_id]['doomed'] = True
         
-        await user.send(f"💀 **Doom Predicted**: {target_user.display_name} will die tomorrow!")
+        results.add(player_id, f"💀 **Doom Predicted**: {target_name} will die tomorrow!")
         
     except Exception as e:
         logger.error(f"Error processing doom action: {e}")
@@ -3817,35 +3021,22 @@ async def gunner_shoot(ctx, *, target=None):
     hit_chance = 1.0 if is_sharpshooter else 0.8  # 80% hit chance for regular gunner
     shot_hits = random.random() < hit_chance
     
-    target_user = bot.get_user(target_id)
+    target_name = display_name(target_id)
     
     if not shot_hits:
-        await ctx.send(f"💥 **{ctx.author.display_name}** shoots at **{target_user.display_name}** but misses!")
+        await ctx.send(f"💥 **{ctx.author.display_name}** shoots at **{target_name}** but misses!")
         return
     
     # Shot hits - check for protections
     if attempt_kill(target_id, 'shot'):
-        # Target dies
-        target_role = game_state.players[target_id]['role']
-        target_template = game_state.players[target_id].get('template')
-        
-        # Format role display
-        role_display = target_role.replace('_', ' ').title()
-        if target_template:
-            role_display += f" ({target_template.replace('_', ' ').title()})"
-        
-        # Kill target
-        game_state.players[target_id]['alive'] = False
-        game_state.dead_players[target_id] = target_role
-        
-        await ctx.send(f"💥 **{target_user.display_name}** ({role_display}) was shot and killed by {ctx.author.display_name}!")
-        
-        # Handle death effects
-        await handle_player_death(target_id, ctx)
-        await process_death_effects(ctx, target_id, 'shot')
+        # Target dies, along with anyone their death takes
+        role_display = format_role(target_id)
+        cascade = await kill_players(ctx, [(target_id, 'shot')])
+        report = [f"💥 **{target_name}** ({role_display}) was shot and killed by {ctx.author.display_name}!"]
+        await ctx.send("\n".join(report + chained_death_lines(cascade)))
     else:
         # Target was protected
-        await ctx.send(f"💥 **{ctx.author.display_name}** shoots **{target_user.display_name}**, but they are protected!")
+        await ctx.send(f"💥 **{ctx.author.display_name}** shoots **{target_name}**, but they are protected!")
     
     # Check if game ended
     await check_win_conditions(ctx)
@@ -3901,7 +3092,7 @@ async def mayor_reveal(ctx):
 
 @bot.command(name='target', aliases=['assassin_target'])
 async def assassin_target(ctx, *, target=None):
-    """Assassin targets someone to die with them"""
+    """Assassin or hunter targets someone to die with them"""
     if not game_state.active:
         await ctx.send("❌ No game is currently active!")
         return
@@ -3911,8 +3102,9 @@ async def assassin_target(ctx, *, target=None):
         return
     
     player_template = game_state.players[ctx.author.id].get('template')
-    if player_template != 'assassin':
-        await ctx.send("❌ You are not the assassin!")
+    is_hunter = game_state.players[ctx.author.id]['role'] == 'hunter'
+    if player_template != 'assassin' and not is_hunter:
+        await ctx.send("❌ You are not the assassin or a hunter!")
         return
     
     if not target:
@@ -3931,18 +3123,18 @@ async def assassin_target(ctx, *, target=None):
         await ctx.send("❌ You cannot target yourself!")
         return
     
-    # Set assassin target
-    game_state.players[ctx.author.id]['assassin_target'] = target_id
-    target_user = bot.get_user(target_id)
+    # Set assassin/hunter target
+    game_state.players[ctx.author.id]['assassin_target' if player_template == 'assassin' else 'hunter_target'] = target_id
+    target_name = display_name(target_id)
     
-    await ctx.send(f"🎯 You have targeted **{target_user.display_name}**! If you die, they will die with you.")
+    await ctx.send(f"🎯 You have targeted **{target_name}**! If you die, they will die with you.")
 
 # ==================== NIGHT ACTION COMMANDS ====================
 # These commands work in DMs during night phase
 
 async def security_warning(ctx, command_name: str):
     """Send security warning when night actions are used in public"""
-    await ctx.send("🚨 **SECURITY WARNING!** Night actions must be done in DMs only! Please send me a private message to use this command.")
+    await ctx.send(f"🚨 **SECURITY WARNING!** Night actions must be secret! Use `/{command_name.split()[0]}` here (only you will see it) or send me a private message.")
     try:
         await ctx.author.send(f"🌙 **Night Action Reminder**: Use `{prefix}{command_name}` in THIS private message, not in the public channel!")
     except:
@@ -3950,14 +3142,14 @@ async def security_warning(ctx, command_name: str):
 
 @bot.command(name='see')
 async def seer_see(ctx, *, target=None):
-    """Seer/Oracle see command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    """Seer/Oracle/Augur see command"""
+    if is_private(ctx):
         # Process in DM
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
             role = game_state.players[ctx.author.id]['role']
-            if role not in ['seer', 'oracle']:
+            if role not in ['seer', 'oracle', 'augur']:
                 await ctx.send("❌ You don't have this power!")
                 return
             
@@ -3986,10 +3178,13 @@ async def seer_see(ctx, *, target=None):
             
             # Give result immediately (simplified)
             target_role = game_state.players[target_id]['role']
-            target_user = bot.get_user(target_id)
+            target_name = display_name(target_id)
             
             if role == 'seer':
-                await ctx.send(f"🔮 **{target_user.display_name}** is a **{target_role}**!")
+                await ctx.send(f"🔮 **{target_name}** is a **{target_role}**!")
+            elif role == 'augur':
+                can_kill = target_role in ACTUAL_WOLVES + ['vigilante', 'serial killer', 'monster', 'hunter']
+                await ctx.send(f"🔮 **{target_name}** **{'can' if can_kill else 'cannot'} kill**!")
             else:  # oracle
                 if target_role in VILLAGE_ROLES_ORDERED:
                     team = "Village"
@@ -3997,7 +3192,7 @@ async def seer_see(ctx, *, target=None):
                     team = "Wolf"
                 else:
                     team = "Neutral"
-                await ctx.send(f"🔮 **{target_user.display_name}** is on the **{team}** team!")
+                await ctx.send(f"🔮 **{target_name}** is on the **{team}** team!")
     else:
         # Security warning for public channel usage
         await security_warning(ctx, "see <player>")
@@ -4005,7 +3200,7 @@ async def seer_see(ctx, *, target=None):
 @bot.command(name='kill')
 async def night_kill(ctx, *, target=None):
     """Night kill command (also works for vengeful ghost when dead)"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         # Check for vengeful ghost (can kill when dead)
         if (game_state.active and ctx.author.id in game_state.dead_players and 
             game_state.dead_players[ctx.author.id] == 'vengeful ghost'):
@@ -4034,29 +3229,17 @@ async def night_kill(ctx, *, target=None):
             
             # Use the power
             game_state.players[ctx.author.id]['ghost_kill_used'] = True
-            target_user = bot.get_user(target_id)
+            target_name = display_name(target_id)
             
             # Kill target immediately (vengeful ghost kills bypass night phase)
             if attempt_kill(target_id, 'ghost'):
-                target_role = game_state.players[target_id]['role']
-                target_template = game_state.players[target_id].get('template')
-                
-                # Format role display
-                role_display = target_role.replace('_', ' ').title()
-                if target_template:
-                    role_display += f" ({target_template.replace('_', ' ').title()})"
-                
-                # Kill target
-                game_state.players[target_id]['alive'] = False
-                game_state.dead_players[target_id] = target_role
-                
-                await ctx.send(f"👻 **{target_user.display_name}** ({role_display}) has been killed by your vengeful spirit!")
-                
-                # Handle death effects
-                await handle_player_death(target_id, ctx)
-                await process_death_effects(ctx, target_id, 'ghost')
+                # Kill target, along with anyone their death takes
+                role_display = format_role(target_id)
+                cascade = await kill_players(ctx, [(target_id, 'ghost')])
+                report = [f"👻 **{target_name}** ({role_display}) has been killed by your vengeful spirit!"]
+                await ctx.send("\n".join(report + chained_death_lines(cascade)))
             else:
-                await ctx.send(f"👻 You attack **{target_user.display_name}** from beyond the grave, but they are protected!")
+                await ctx.send(f"👻 You attack **{target_name}** from beyond the grave, but they are protected!")
         
         elif (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
@@ -4088,8 +3271,10 @@ async def night_kill(ctx, *, target=None):
                 'action': 'kill',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"✅ You will attempt to kill **{target_user.display_name}** tonight!")
+            if role in ACTUAL_WOLVES:
+                wolf_digest.trigger()
+            target_name = display_name(target_id)
+            await ctx.send(f"✅ You will attempt to kill **{target_name}** tonight!")
     else:
         # Security warning for public channel usage
         await security_warning(ctx, "kill <player>")
@@ -4097,7 +3282,7 @@ async def night_kill(ctx, *, target=None):
 @bot.command(name='guard')
 async def guard_protect(ctx, *, target=None):
     """Guard protection command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4116,15 +3301,15 @@ async def guard_protect(ctx, *, target=None):
                 'action': 'guard',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🛡️ You will protect **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🛡️ You will protect **{target_name}** tonight!")
     else:
         await security_warning(ctx, "guard <player>")
 
 @bot.command(name='visit')
 async def harlot_visit(ctx, *, target=None):
     """Harlot/Succubus visit command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4143,24 +3328,24 @@ async def harlot_visit(ctx, *, target=None):
                 'action': 'visit',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
+            target_name = display_name(target_id)
             
             if role == 'harlot':
-                await ctx.send(f"💃 You will visit **{target_user.display_name}** tonight! (You'll be safe from wolves)")
+                await ctx.send(f"💃 You will visit **{target_name}** tonight! (You'll be safe from wolves)")
             elif role == 'succubus':
                 # Check if already visited this person before
                 previous_visits = game_state.players[ctx.author.id].get('succubus_visits', [])
                 if target_id in previous_visits:
-                    await ctx.send(f"😈 You will visit **{target_user.display_name}** tonight! (They will die since this is your second visit)")
+                    await ctx.send(f"😈 You will visit **{target_name}** tonight! (They will die since this is your second visit)")
                 else:
-                    await ctx.send(f"😈 You will visit **{target_user.display_name}** tonight! (They will be entranced)")
+                    await ctx.send(f"😈 You will visit **{target_name}** tonight! (They will be entranced)")
     else:
         await security_warning(ctx, "visit <player>")
 
 @bot.command(name='give')
 async def shaman_give(ctx, *, target=None):
     """Shaman give totem command - now gives 1 random totem per shaman"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4207,21 +3392,21 @@ async def shaman_give(ctx, *, target=None):
             }
             game_state.used_shamans.add(ctx.author.id)
             
-            target_user = bot.get_user(target_id)
+            target_name = display_name(target_id)
             
             # Show different info based on shaman type
             if role == 'crazed shaman':
-                await ctx.send(f"🎭 You give a mysterious totem to **{target_user.display_name}**!\n\n❓ **Effect**: Unknown - you don't know what this totem does!")
+                await ctx.send(f"🎭 You give a mysterious totem to **{target_name}**!\n\n❓ **Effect**: Unknown - you don't know what this totem does!")
             else:
                 totem_description = TOTEMS.get(assigned_totem, "Unknown totem effect.")
-                await ctx.send(f"🎭 You give **{assigned_totem.replace('_', ' ').title()}** to **{target_user.display_name}**!\n\n📝 **Effect**: {totem_description}")
+                await ctx.send(f"🎭 You give **{assigned_totem.replace('_', ' ').title()}** to **{target_name}**!\n\n📝 **Effect**: {totem_description}")
     else:
         await security_warning(ctx, "give <player>")
 
 @bot.command(name='observe')
 async def werecrow_observe(ctx, *, target=None):
     """Werecrow observe command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4245,15 +3430,15 @@ async def werecrow_observe(ctx, *, target=None):
                 'action': 'observe',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"👁️ You will observe **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"👁️ You will observe **{target_name}** tonight!")
     else:
         await security_warning(ctx, "observe <player>")
 
 @bot.command(name='id')
 async def detective_id(ctx, *, target=None):
     """Detective ID command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4277,15 +3462,15 @@ async def detective_id(ctx, *, target=None):
                 'action': 'id',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🕵️ You will investigate **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🕵️ You will investigate **{target_name}** tonight!")
     else:
         await security_warning(ctx, "id <player>")
 
 @bot.command(name='drunk_shoot')
 async def drunk_shoot(ctx, *, target=None):
     """Village drunk shoot command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4309,8 +3494,8 @@ async def drunk_shoot(ctx, *, target=None):
                 'action': 'shoot',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🔫 You will shoot **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🔫 You will shoot **{target_name}** tonight!")
     else:
         await security_warning(ctx, "drunk_shoot <player>")
 
@@ -4319,7 +3504,7 @@ async def drunk_shoot(ctx, *, target=None):
 @bot.command(name='hex')
 async def hag_hex(ctx, *, target=None):
     """Hag hex command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4343,15 +3528,15 @@ async def hag_hex(ctx, *, target=None):
                 'action': 'hex',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🔮 You will hex **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🔮 You will hex **{target_name}** tonight!")
     else:
         await security_warning(ctx, "hex <player>")
 
 @bot.command(name='curse')
 async def warlock_curse(ctx, *, target=None):
     """Warlock curse command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4381,15 +3566,15 @@ async def warlock_curse(ctx, *, target=None):
                 'target': target_id
             }
             game_state.players[ctx.author.id]['curse_used'] = True
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🌙 You will curse **{target_user.display_name}** tonight! They will die in 2 nights.")
+            target_name = display_name(target_id)
+            await ctx.send(f"🌙 You will curse **{target_name}** tonight! They will die in 2 nights.")
     else:
         await security_warning(ctx, "curse <player>")
 
 @bot.command(name='charm')
 async def piper_charm(ctx, *, target=None):
     """Piper charm command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4413,15 +3598,15 @@ async def piper_charm(ctx, *, target=None):
                 'action': 'charm',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🎵 You will charm **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🎵 You will charm **{target_name}** tonight!")
     else:
         await security_warning(ctx, "charm <player>")
 
 @bot.command(name='remember')
 async def amnesiac_remember(ctx, *, target=None):
     """Amnesiac remember command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4436,7 +3621,7 @@ async def amnesiac_remember(ctx, *, target=None):
                 return
             
             # Show dead players
-            dead_players = [bot.get_user(uid).display_name for uid in game_state.dead_players.keys()]
+            dead_players = [display_name(uid) for uid in game_state.dead_players.keys()]
             if not dead_players:
                 await ctx.send("❌ No dead players to remember!")
                 return
@@ -4457,15 +3642,15 @@ async def amnesiac_remember(ctx, *, target=None):
                 'target': target_id
             }
             game_state.players[ctx.author.id]['remember_used'] = True
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🧠 You will remember the role of **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🧠 You will remember the role of **{target_name}** tonight!")
     else:
         await security_warning(ctx, "remember <dead_player>")
 
 @bot.command(name='turn')
 async def turncoat_turn(ctx):
     """Turncoat team change command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4492,7 +3677,7 @@ async def turncoat_turn(ctx):
 @bot.command(name='doom')
 async def doomsayer_doom(ctx, *, target=None):
     """Doomsayer doom command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4522,15 +3707,15 @@ async def doomsayer_doom(ctx, *, target=None):
                 'target': target_id
             }
             game_state.players[ctx.author.id]['doom_used'] = True
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"☠️ You will doom **{target_user.display_name}** tonight! They will die tomorrow.")
+            target_name = display_name(target_id)
+            await ctx.send(f"☠️ You will doom **{target_name}** tonight! They will die tomorrow.")
     else:
         await security_warning(ctx, "doom <player>")
 
 @bot.command(name='bless')
 async def priest_bless(ctx, *, target=None):
     """Priest bless command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4554,15 +3739,15 @@ async def priest_bless(ctx, *, target=None):
                 'action': 'bless',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"✨ You will bless **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"✨ You will bless **{target_name}** tonight!")
     else:
         await security_warning(ctx, "bless <player>")
 
 @bot.command(name='mysticism')
 async def mystic_power(ctx, *, target=None):
     """Mystic/Wolf Mystic mysticism command"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4586,8 +3771,8 @@ async def mystic_power(ctx, *, target=None):
                 'action': 'mysticism',
                 'target': target_id
             }
-            target_user = bot.get_user(target_id)
-            await ctx.send(f"🔮 You will use mysticism on **{target_user.display_name}** tonight!")
+            target_name = display_name(target_id)
+            await ctx.send(f"🔮 You will use mysticism on **{target_name}** tonight!")
     else:
         await security_warning(ctx, "mysticism <player>")
 
@@ -4628,7 +3813,7 @@ async def time_lord_time(ctx):
 @bot.command(name='match', aliases=['choose', 'lovers'])
 async def matchmaker_match(ctx, *, targets=None):
     """Matchmaker creates lovers (first night only)"""
-    if isinstance(ctx.channel, discord.DMChannel):
+    if is_private(ctx):
         if (game_state.active and game_state.phase == "night" and 
             game_state.is_player_alive(ctx.author.id)):
             
@@ -4681,20 +3866,185 @@ async def matchmaker_match(ctx, *, targets=None):
             game_state.players[target_ids[0]]['lover'] = target_ids[1]
             game_state.players[target_ids[1]]['lover'] = target_ids[0]
             
-            target1_user = bot.get_user(target_ids[0])
-            target2_user = bot.get_user(target_ids[1])
+            target1_name, target2_name = display_name(target_ids[0]), display_name(target_ids[1])
             
-            await ctx.send(f"💕 You have made **{target1_user.display_name}** and **{target2_user.display_name}** lovers!\n\n💔 If one dies, the other will die of heartbreak!")
+            await ctx.send(f"💕 You have made **{target1_name}** and **{target2_name}** lovers!\n\n💔 If one dies, the other will die of heartbreak!")
             
             # Notify the lovers
             try:
-                await target1_user.send(f"💕 **You are now lovers with {target2_user.display_name}!**\n\n💔 If one of you dies, the other will die of heartbreak!")
-                await target2_user.send(f"💕 **You are now lovers with {target1_user.display_name}!**\n\n💔 If one of you dies, the other will die of heartbreak!")
+                for lover_id, partner_name in ((target_ids[0], target2_name), (target_ids[1], target1_name)):
+                    lover = bot.get_user(lover_id)
+                    if lover:
+                        await lover.send(f"💕 **You are now lovers with {partner_name}!**\n\n💔 If one of you dies, the other will die of heartbreak!")
             except:
                 pass
     else:
         await security_warning(ctx, "match <player1> and <player2>")
 
+# ==================== SLASH COMMANDS ====================
+# Night actions as slash commands and buttons. Replies are ephemeral, so they work right
+# in the game channel: no DM channel to open and nothing for anyone else to see
+NIGHT_PROMPT_MODE = os.getenv('NIGHT_PROMPT_MODE', 'interaction').lower()
+if NIGHT_PROMPT_MODE not in ('interaction', 'dm'):
+    raise ValueError(f"NIGHT_PROMPT_MODE must be 'interaction' or 'dm', got '{NIGHT_PROMPT_MODE}'")
+
+# slash command -> description; each takes one player
+NIGHT_SLASH_COMMANDS = {
+    'see': "See a player's role, team or killing power (seer, oracle, augur)",
+    'kill': "Choose tonight's kill",
+    'guard': "Protect a player tonight",
+    'visit': "Visit a player tonight",
+    'give': "Give your totem to a player",
+    'observe': "Observe whether a player leaves their house",
+    'id': "Investigate a player's role",
+    'drunk_shoot': "Shoot a player (village drunk)",
+    'hex': "Hex a player",
+    'curse': "Curse a player",
+    'charm': "Charm a player",
+    'doom': "Doom a player",
+    'bless': "Bless a player against lycanthropy",
+    'mysticism': "Use your mysticism on a player",
+    'remember': "Remember a dead player's role",
+}
+
+# Commands offered in a role's night prompt menu, matching its prompt: wolves with a power
+# of their own get the pack kill and that power
+NIGHT_ACTIONS_BY_ROLE = {
+    'seer': ('see',), 'oracle': ('see',), 'augur': ('see',), 'detective': ('id',),
+    'guardian angel': ('guard',), 'bodyguard': ('guard',), 'harlot': ('visit',),
+    'vigilante': ('kill',), 'serial killer': ('kill',), 'monster': ('kill',), 'village drunk': ('drunk_shoot',),
+    'shaman': ('give',), 'crazed shaman': ('give',), 'mystic': ('mysticism',), 'priest': ('bless',),
+    'hag': ('hex',), 'warlock': ('curse',), 'piper': ('charm',), 'amnesiac': ('remember',),
+    'turncoat': ('turn',), 'matchmaker': ('match',),
+    **{role: ('kill',) for role in ACTUAL_WOLVES},
+    'werecrow': ('kill', 'observe'), 'doomsayer': ('kill', 'doom'),
+    'wolf shaman': ('kill', 'give'), 'wolf mystic': ('kill', 'mysticism'),
+}
+
+def named_players(player_ids) -> List[tuple]:
+    return [(uid, user.display_name) for uid in player_ids if (user := bot.get_user(uid))]
+
+async def alive_player_choices(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    return player_choices(named_players(game_state.get_alive_players()), current)
+
+async def dead_player_choices(interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+    return player_choices(named_players(game_state.dead_players), current)
+
+async def run_interaction_command(interaction: discord.Interaction, command_name: str, **kwargs):
+    """Run a prefix command's implementation for an interaction, through the game mailbox"""
+    ctx = InteractionContext(interaction, bot)
+    if spam_limiter.hit(interaction.user.id) != ALLOWED:
+        await ctx.send("🔇 Slow down! Try again in a few seconds.")
+        return
+    # The mailbox may be busy with a phase change for longer than Discord waits for an answer
+    await ctx.defer()
+    try:
+        await game_mailbox.run(bot.get_command(command_name).callback, ctx, **kwargs)
+    except MailboxFull:
+        await ctx.send("⏳ The game is busy right now, try again in a moment.")
+        return
+    # The commands stay silent when it isn't their phase or the author isn't playing
+    if not ctx.answered:
+        await ctx.send("❌ You can't use that right now.")
+
+def add_night_slash_command(name: str, description: str):
+    autocomplete = dead_player_choices if name == 'remember' else alive_player_choices
+    
+    @app_commands.describe(target="The player to target")
+    async def callback(interaction: discord.Interaction, target: str):
+        await run_interaction_command(interaction, name, target=target)
+    
+    command = app_commands.Command(name=name, description=description, callback=callback)
+    command.autocomplete('target')(autocomplete)
+    bot.tree.add_command(command)
+
+for name, description in NIGHT_SLASH_COMMANDS.items():
+    add_night_slash_command(name, description)
+
+@bot.tree.command(name='turn', description="Switch sides (turncoat)")
+async def turn_slash(interaction: discord.Interaction):
+    await run_interaction_command(interaction, 'turn')
+
+@bot.tree.command(name='match', description="Make two players lovers (matchmaker, first night)")
+@app_commands.describe(first="First lover", second="Second lover")
+@app_commands.autocomplete(first=alive_player_choices, second=alive_player_choices)
+async def match_slash(interaction: discord.Interaction, first: str, second: str):
+    await run_interaction_command(interaction, 'match', targets=f"{first} and {second}")
+
+class NightTargetView(discord.ui.View):
+    """Ephemeral menu of targets for one player's night actions, one menu per action"""
+    
+    def __init__(self, command_names, player_id: int, timeout: float):
+        super().__init__(timeout=timeout)
+        for command_name in command_names:
+            self.add_action(command_name, player_id, several=len(command_names) > 1)
+    
+    def add_action(self, command_name: str, player_id: int, several: bool):
+        if command_name == 'turn':
+            button = discord.ui.Button(label="Switch sides", emoji="🔄", style=discord.ButtonStyle.danger)
+            button.callback = self.turn
+            self.add_item(button)
+            return
+        
+        if command_name == 'remember':
+            targets = named_players(game_state.dead_players)
+        else:
+            targets = [(uid, name) for uid, name in named_players(game_state.get_alive_players())
+                       if uid != player_id or command_name == 'give']
+        if not targets:
+            return
+        picks = 2 if command_name == 'match' else 1
+        placeholder = "Choose two players" if picks == 2 else "Choose a player"
+        if several:
+            placeholder = f"{NIGHT_SLASH_COMMANDS.get(command_name, command_name.title())}: {placeholder.lower()}"
+        select = discord.ui.Select(
+            placeholder=placeholder[:150],
+            min_values=picks, max_values=picks,
+            options=[discord.SelectOption(label=name[:100], value=str(uid)) for uid, name in targets[:25]]
+        )
+        
+        async def choose(interaction: discord.Interaction):
+            if command_name == 'match':
+                await run_interaction_command(interaction, 'match', targets=" and ".join(select.values))
+            else:
+                await run_interaction_command(interaction, command_name, target=select.values[0])
+        
+        select.callback = choose
+        self.add_item(select)
+    
+    async def turn(self, interaction: discord.Interaction):
+        await run_interaction_command(interaction, 'turn')
+
+class NightActionView(discord.ui.View):
+    """Button under the night announcement that opens a player's prompt just for them"""
+    
+    def __init__(self, day_number: int, timeout: float):
+        super().__init__(timeout=timeout)
+        self.day_number = day_number
+    
+    @discord.ui.button(label="Night action", emoji="🌙", style=discord.ButtonStyle.primary)
+    async def open_prompt(self, interaction: discord.Interaction, button: discord.ui.Button):
+        player = game_state.players.get(interaction.user.id)
+        if (not game_state.active or game_state.phase != "night" or game_state.day_number != self.day_number
+                or not player or not player['alive']):
+            await interaction.response.send_message("❌ You have nothing to do right now.", ephemeral=True)
+            return
+        if player.get('silenced', False):
+            await interaction.response.send_message("🔇 You are silenced and cannot use your power tonight.", ephemeral=True)
+            return
+        
+        embed = night_prompt_embed(interaction.user.id)
+        if embed is None:
+            await interaction.response.send_message("😴 You have no night action. Sleep well!", ephemeral=True)
+            return
+        remaining = max(1.0, (game_state.phase_deadline or time.time()) - time.time())
+        command_names = NIGHT_ACTIONS_BY_ROLE.get(player['role'])
+        if command_names:
+            view = NightTargetView(command_names, interaction.user.id, remaining)
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
 # ==================== INFORMATION COMMANDS ====================
 
 @bot.command(name='dead', aliases=['graveyard'])
@@ -4725,22 +4075,43 @@ async def list_dead(ctx):
 @bot.command(name='status', aliases=['game'])
 async def game_status(ctx):
     """Show current game status"""
-    if not game_state.active:
-        await ctx.send("❌ No game is currently active!")
-        return
-    
     embed = discord.Embed(
         title="🎮 Game Status",
         color=0x8B4513
     )
     
-    embed.add_field(name="Phase", value=game_state.phase.title(), inline=True)
-    embed.add_field(name="Day", value=str(game_state.day_number), inline=True)
-    embed.add_field(name="Alive Players", value=str(len(game_state.get_alive_players())), inline=True)
+    if game_state.active:
+        embed.add_field(name="Phase", value=game_state.phase.title(), inline=True)
+        embed.add_field(name="Day", value=str(game_state.day_number), inline=True)
+        embed.add_field(name="Alive Players", value=str(len(game_state.get_alive_players())), inline=True)
+        
+        if game_state.phase == "day" and game_state.votes:
+            vote_count = len(game_state.votes)
+            embed.add_field(name="Votes Cast", value=str(vote_count), inline=True)
+        
+        if game_state.result_delivery:
+            delivered = sum(1 for outcome in game_state.result_delivery.values() if outcome == SENT)
+            embed.add_field(name="Night DMs", value=f"{delivered}/{len(game_state.result_delivery)} delivered", inline=True)
+    else:
+        embed.description = "❌ No game is currently active!"
     
-    if game_state.phase == "day" and game_state.votes:
-        vote_count = len(game_state.votes)
-        embed.add_field(name="Votes Cast", value=str(vote_count), inline=True)
+    loop = loop_monitor.stats()
+    embed.add_field(
+        name="Event Loop",
+        value=f"lag {loop['lag_ms']}ms (p99 {loop['lag_p99_ms']}ms, max {loop['lag_max_ms']}ms), {loop['tasks']} tasks",
+        inline=False
+    )
+    problems = [f"`{name}` running {age:.0f}s" for name, age in loop['long_running'].items()]
+    problems += [f"{count} leaked ({check})" for check, count in loop['leaks'].items() if count]
+    if problems:
+        embed.add_field(name="⚠️ Task Warnings", value="\n".join(problems[:10]), inline=False)
+    
+    mailbox = game_mailbox.stats()
+    embed.add_field(
+        name="Command Queue",
+        value=f"{mailbox['depth']} pending (max {mailbox['max_depth']}), last wait {mailbox['last_wait_ms']}ms",
+        inline=False
+    )
     
     await ctx.send(embed=embed)
 
@@ -4903,8 +4274,7 @@ async def chat_info(ctx):
     
     # Wolfchat info
     if game_state.wolfchat_channel:
-        wolf_members = [bot.get_user(uid).display_name for uid in game_state.wolfchat_members 
-                       if bot.get_user(uid)]
+        wolf_members = [display_name(uid) for uid in game_state.wolfchat_members]
         embed.add_field(
             name="🐺 Wolfchat",
             value=f"**Channel**: {game_state.wolfchat_channel.mention}\n"
@@ -4915,8 +4285,7 @@ async def chat_info(ctx):
     
     # Dead chat info
     if game_state.dead_chat_channel:
-        dead_members = [bot.get_user(uid).display_name for uid in game_state.dead_chat_members 
-                       if bot.get_user(uid)]
+        dead_members = [display_name(uid) for uid in game_state.dead_chat_members]
         embed.add_field(
             name="💀 Dead Chat",
             value=f"**Channel**: {game_state.dead_chat_channel.mention}\n"
@@ -4937,6 +4306,32 @@ async def chat_info(ctx):
     
     await ctx.send(embed=embed)
 
+@bot.command(name='shards', aliases=['shard'])
+async def shard_info(ctx):
+    """Show per-shard latency and event rates"""
+    shard_metrics.record_latencies(bot.latencies)
+    
+    embed = discord.Embed(
+        title="🛰️ Shard Status",
+        description=f"Running shards {sorted(shard_router.shard_ids)} of {shard_router.shard_count}",
+        color=0x8B4513
+    )
+    if ctx.guild:
+        embed.description += f"\nThis server is on shard **{shard_router.shard_of(ctx.guild.id)}**"
+    
+    for shard_id, stats in shard_metrics.snapshot().items():
+        latency = f"{stats['latency_ms']}ms" if stats['latency_ms'] is not None else "n/a"
+        embed.add_field(
+            name=f"Shard {shard_id}",
+            value=f"**Status**: {stats['status']}\n"
+                  f"**Latency**: {latency}\n"
+                  f"**Messages/s**: {stats['events_per_sec']}\n"
+                  f"**Reconnects**: {stats['reconnects']}",
+            inline=True
+        )
+    
+    await ctx.send(embed=embed)
+
 # ==================== ADMIN COMMANDS ====================
 @bot.command(name='fstart')
 async def force_start(ctx):
@@ -5004,6 +4399,123 @@ async def game_settings(ctx, setting=None, value=None):
     except ValueError:
         await ctx.send("❌ Value must be a number!")
 
+@bot.command(name='profile')
+@commands.is_owner()
+async def profile_bot(ctx, seconds: int = 30):
+    """Sample the event loop and upload a flamegraph-ready profile (owner only)"""
+    seconds = max(1, min(seconds, 300))
+    await ctx.send(f"🔬 Profiling the bot for **{seconds} seconds**...")
+    
+    try:
+        profiler = await profile_event_loop(seconds)
+    except ProfilerBusy:
+        await ctx.send("❌ A profile is already running!")
+        return
+    
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    files = [
+        discord.File(io.BytesIO(profiler.top(30).encode('utf-8')), filename=f"profile-{stamp}-top.txt"),
+        discord.File(io.BytesIO(profiler.collapsed().encode('utf-8')), filename=f"profile-{stamp}.folded")
+    ]
+    await ctx.send(
+        f"✅ Collected **{profiler.samples}** samples over {profiler.duration:.1f}s. "
+        f"Feed the `.folded` file to flamegraph.pl or speedscope.app.",
+        files=files
+    )
+
+memory_tracer = MemoryTracer()
+
+@bot.command(name='memory', aliases=['mem'])
+@commands.is_owner()
+async def memory_report(ctx, action: str = 'diff', frames: int = 1):
+    """Trace allocations and report growth since the last snapshot (owner only)"""
+    action = action.lower()
+    loop = asyncio.get_running_loop()
+    
+    if action == 'stop':
+        memory_tracer.stop()
+        await ctx.send("🧹 Memory tracing stopped.")
+        return
+    if action == 'start' or not memory_tracer.tracing:
+        frames = max(1, min(frames, 25))
+        await loop.run_in_executor(None, memory_tracer.start, frames)
+        await ctx.send(f"🔬 Memory tracing started ({frames} frame(s) per allocation). "
+                       f"Run `{prefix}memory` again later to see what grew.")
+        return
+    if action not in ('diff', 'snap', 'snapshot'):
+        await ctx.send(f"❌ Usage: `{prefix}memory [start [frames]|diff|stop]`")
+        return
+    
+    report = await loop.run_in_executor(None, memory_tracer.diff, 25)
+    instances = await loop.run_in_executor(None, count_instances)
+    traced = memory_tracer.traced_memory()
+    
+    summary = ", ".join(f"{name}: {count}" for name, count in sorted(instances.items()))
+    await ctx.send(
+        f"📊 Traced memory {format_size(traced['current'])} (peak {format_size(traced['peak'])}). "
+        f"Live objects: {summary}",
+        file=discord.File(io.BytesIO("\n".join(report).encode('utf-8')),
+                          filename=f"memory-{datetime.now().strftime('%Y%m%d-%H%M%S')}.txt")
+    )
+
+# Game rule modules !hotreload swaps out, dependencies first
+HOT_RELOAD_MODULES = (
+    'src.game.seating', 'src.game.night_actions', 'src.game.deaths', 'src.game.prompts',
+    'src.game.gamemodes', 'src.game.snapshot', 'src.core.messages',
+)
+
+@bot.command(name='hotreload')
+@commands.is_owner()
+async def hot_reload(ctx):
+    """Reload the game rule modules without restarting, migrating a running game (owner only)"""
+    global GAMEMODES, messages
+    modules = resolve_modules(HOT_RELOAD_MODULES)
+    
+    # The running game leaves as a snapshot in the old format...
+    old_version = snapshot_format.SNAPSHOT_VERSION
+    state = snapshot_format.encode(game_state.to_snapshot()) if game_state.active else None
+    if game_state.timer_task:
+        game_state.timer_task.cancel()
+        game_state.timer_task = None
+    
+    try:
+        # Either every module is reloaded or, on any error, none of them is
+        rebound = reload_modules(modules, globals())
+    except Exception as e:
+        logger.error(f"Hot reload failed: {e}")
+        report = f"❌ Reload failed, still running the old code: {e}"
+    else:
+        report = f"♻️ Reloaded {len(modules)} modules, rebound {len(rebound)} names."
+        try:
+            new_gamemodes = load_gamemodes(
+                GAMEMODES_PATH,
+                VILLAGE_ROLES_ORDERED + WOLF_ROLES_ORDERED + NEUTRAL_ROLES_ORDERED,
+                TEMPLATES_ORDERED
+            )
+            new_messages = get_catalog()
+        except Exception as e:
+            logger.error(f"Reloading gamemodes and messages failed: {e}")
+            report += f" ⚠️ Kept the old gamemodes and messages: {e}"
+        else:
+            GAMEMODES, messages = new_gamemodes, new_messages
+    
+    # ...and comes back through the (possibly new) migrations into fresh objects
+    if state is not None:
+        try:
+            restored = snapshot_format.migrate(snapshot_format.decode(state), old_version)
+        except ValueError as e:
+            logger.error(f"Could not migrate the running game after reload: {e}")
+            restored = snapshot_format.decode(state)
+        game_state.restore_snapshot(restored, bot.get_channel)
+        channel = bot.get_channel(game_state.channel_id)
+        if channel is not None:
+            remaining = max(int((game_state.phase_deadline or 0) - time.time()), 15)
+            await start_phase_timer(ChannelContext(channel), game_state.phase, remaining)
+            report += (f" Game migrated (snapshot v{old_version} → v{snapshot_format.SNAPSHOT_VERSION}), "
+                       f"{game_state.phase} continues with {remaining}s left.")
+    
+    await ctx.send(report)
+
 # ==================== HELP COMMAND ====================
 @bot.command(name='help', aliases=['h', 'commands'])
 async def help_command(ctx, category=None):
@@ -5091,6 +4603,7 @@ async def help_command(ctx, category=None):
         embed.add_field(name=f"{prefix}give <player> <totem>", value="Shaman: Give a totem", inline=False)
         embed.add_field(name=f"{prefix}visit <player>", value="Harlot: Visit a player", inline=False)
         embed.add_field(name=f"{prefix}observe <player>", value="Werecrow: See who visits target", inline=False)
+        embed.add_field(name="/see, /kill, /guard ...", value="Same commands as slash commands in the game channel - only you see the reply", inline=False)
         
     elif category.lower() == "info":
         embed = discord.Embed(title="📊 Information Commands", color=0x00FF00)
@@ -5100,6 +4613,7 @@ async def help_command(ctx, category=None):
         embed.add_field(name=f"{prefix}roles", value="List all 43 roles", inline=False)
         embed.add_field(name=f"{prefix}role <name>", value="Get role information", inline=False)
         embed.add_field(name=f"{prefix}totems", value="List all 16 totems", inline=False)
+        embed.add_field(name=f"{prefix}shards", value="Show shard latency and message rates", inline=False)
         
     elif category.lower() == "admin":
         embed = discord.Embed(title="👑 Admin Commands", color=0xFF0000)
@@ -5107,6 +4621,9 @@ async def help_command(ctx, category=None):
         embed.add_field(name=f"{prefix}fday", value="Force day phase", inline=False)
         embed.add_field(name=f"{prefix}fnight", value="Force night phase", inline=False)
         embed.add_field(name=f"{prefix}settings", value="View/change game settings", inline=False)
+        embed.add_field(name=f"{prefix}profile [seconds]", value="Profile the bot and upload the results (owner only)", inline=False)
+        embed.add_field(name=f"{prefix}memory [start|diff|stop]", value="Trace memory growth between snapshots (owner only)", inline=False)
+        embed.add_field(name=f"{prefix}hotreload", value="Reload game rules without a restart; a running game is migrated (owner only)", inline=False)
         
     elif category.lower() == "chat":
         embed = discord.Embed(title="💬 Chat Commands", color=0x8B0000)
@@ -5129,23 +4646,32 @@ async def help_command(ctx, category=None):
     await ctx.send(embed=embed)
 
 # ==================== BOT STARTUP ====================
-def main():
-    """Main function to start the bot"""
+# Seconds from the top of this module to here; ready_s is added by on_ready
+startup_timings = {'import_s': round(time.perf_counter() - IMPORT_STARTED, 3)}
+
+def main() -> int:
+    """Main function to start the bot; returns the process exit code"""
     # Get token from environment or config
     token = os.getenv('DISCORD_TOKEN') or config.get('discord_token')
     
     if not token:
         logger.error("No Discord token found! Set DISCORD_TOKEN environment variable or add to config.")
-        return
+        return 1
     
     logger.info("Starting Discord Werewolf Bot - COMPLETE IMPLEMENTATION")
     logger.info(f"Prefix: {prefix}")
+    logger.info(f"Sharding: {shard_settings.describe()}")
     logger.info("Features: 43 Roles, 16 Totems, 7 Templates, Complete Game System")
     
     try:
         bot.run(token)
+    except discord.LoginFailure as e:
+        logger.error(f"Discord rejected the token: {e}")
+        return 1
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
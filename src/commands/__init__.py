@@ -1,11 +1,19 @@
 """
 Command loader for Discord Werewolf Bot
-Automatically imports and registers all commands
+Automatically imports and registers all commands. Rarely used groups are registered
+as stubs read from their @command declarations, and imported on first use.
+bot.py defines its own commands and doesn't load this package, so the deferral only
+shortens startup for bots built on the src/ command registry.
 """
 
+import ast
 import importlib
+import importlib.util
 import os
+import sys
+import time
 from pathlib import Path
+from typing import Dict, List
 from src.core import get_logger
 
 # Initialize logger
@@ -15,26 +23,93 @@ except RuntimeError:
     # Configuration not initialized yet, will be handled by importing modules
     logger = None
 
+# Command modules, in load order
+COMMAND_MODULES = [
+    'src.commands.basic',
+    'src.commands.game', 
+    'src.commands.admin',
+    'src.commands.night_actions',
+    'src.commands.voting',
+    'src.commands.roles_info'
+]
+
+# Imported the first time one of their commands runs, not at startup
+LAZY_COMMAND_MODULES = [
+    'src.commands.admin',
+    'src.commands.roles_info'
+]
+
+# @command(...) positional parameters, in order
+_COMMAND_PARAMS = ('name', 'permission_level', 'description', 'aliases', 'game_only', 'pm_only')
+
+def _declared_value(node: ast.expr):
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'PermissionLevel':
+        from src.utils.helpers import PermissionLevel
+        return getattr(PermissionLevel, node.attr)
+    return ast.literal_eval(node)
+
+def declared_commands(module_name: str) -> List[Dict]:
+    """register() arguments of every @command in a module, read from its source without importing it"""
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {module_name}")
+    tree = ast.parse(spec.loader.get_source(module_name))
+    declarations = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name)
+                    and decorator.func.id == 'command'):
+                declaration = {param: _declared_value(arg) for param, arg in zip(_COMMAND_PARAMS, decorator.args)}
+                declaration.update((kw.arg, _declared_value(kw.value)) for kw in decorator.keywords)
+                declarations.append(declaration)
+    return declarations
+
+def load_command_module(module_name: str):
+    """Import a command module, replacing any stubs with its real commands"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    if logger:
+        logger.info(f"Loaded command module on first use: {module_name} "
+                    f"({(time.perf_counter() - started) * 1000:.0f}ms)")
+    return module
+
+def register_stubs(module_name: str) -> int:
+    """Register a placeholder for each command in module_name that imports it when first called"""
+    from src.commands.base import get_registry
+    registry = get_registry()
+    declarations = declared_commands(module_name)
+    for declaration in declarations:
+        name = declaration['name']
+
+        async def load_and_run(ctx, *args, _name=name, **kwargs):
+            load_command_module(module_name)
+            command = registry.get_command(_name)
+            if command is None or getattr(command.func, 'lazy_module', None):
+                raise RuntimeError(f"{module_name} did not register command {_name}")
+            return await command.execute(ctx, *args, **kwargs)
+
+        load_and_run.lazy_module = module_name
+        registry.register(**declaration)(load_and_run)
+    return len(declarations)
+
 def load_all_commands():
     """Load all command modules"""
     commands_dir = Path(__file__).parent
     
-    # List of command modules to load
-    command_modules = [
-        'src.commands.basic',
-        'src.commands.game', 
-        'src.commands.admin',
-        'src.commands.night_actions',
-        'src.commands.voting',
-        'src.commands.roles_info'
-    ]
-    
     loaded_count = 0
     
-    for module_name in command_modules:
+    for module_name in COMMAND_MODULES:
         try:
-            importlib.import_module(module_name)
-            logger.info(f"Loaded command module: {module_name}")
+            if module_name in LAZY_COMMAND_MODULES and module_name not in sys.modules:
+                stubs = register_stubs(module_name)
+                logger.info(f"Deferred command module: {module_name} ({stubs} commands)")
+            else:
+                importlib.import_module(module_name)
+                logger.info(f"Loaded command module: {module_name}")
             loaded_count += 1
         except Exception as e:
             logger.error(f"Failed to load command module {module_name}: {e}")
@@ -5,13 +5,17 @@ Administrative commands for Discord Werewolf Bot
 import discord
 from discord.ext import commands
 import asyncio
+import re
 import traceback
 import sys
 from io import StringIO
 from src.commands.base import command, PermissionLevel
 from src.core import get_config, get_logger
 from src.utils.helpers import create_embed, create_success_embed, create_error_embed
+from src.utils.logfiles import tail_lines_async
 from src.game.state import get_session, get_persistent_data
+from src.core.hotreload import reload_modules, resolve_modules
+from src.commands import COMMAND_MODULES
 
 config = get_config()
 logger = get_logger()
@@ -140,17 +144,21 @@ async def exec_command(ctx: commands.Context, *, code: str):
 async def reload_command(ctx: commands.Context, component: str = "all"):
     """Reload bot components (owner only)"""
     try:
+        reloaded = []
         if component.lower() in ["all", "config"]:
             # Reload configuration
             import importlib
             import src.core
             importlib.reload(src.core)
+            reloaded.append("config")
             
         if component.lower() in ["all", "commands"]:
-            # TODO: Implement command reloading
-            pass
+            # Re-running a command module registers its commands again, replacing the old ones
+            modules = resolve_modules(name for name in COMMAND_MODULES if name in sys.modules)
+            reload_modules(modules)
+            reloaded.extend(module.__name__.rsplit('.', 1)[-1] for module in modules)
         
-        embed = create_success_embed("Reload Complete", f"Successfully reloaded: {component}")
+        embed = create_success_embed("Reload Complete", f"Successfully reloaded: {', '.join(reloaded) or component}")
         await ctx.send(embed=embed)
         
     except Exception as e:
@@ -195,28 +203,30 @@ async def stasis_command(ctx: commands.Context, action: str, user: discord.Membe
     persistent_data = get_persistent_data()
     
     if action.lower() == "add":
-        persistent_data.add_stasis(user.id, amount)
+        # Backend round trips run in a thread so a slow store can't stall the bot
+        await asyncio.to_thread(persistent_data.add_stasis, user.id, amount)
+        total = await asyncio.to_thread(persistent_data.get_stasis, user.id)
         embed = create_success_embed(
             "Stasis Added",
             f"Added **{amount}** stasis to {user.mention}.\n"
-            f"Total stasis: **{persistent_data.get_stasis(user.id)}**"
+            f"Total stasis: **{total}**"
         )
     elif action.lower() == "remove":
-        remaining = persistent_data.remove_stasis(user.id, amount)
+        remaining = await asyncio.to_thread(persistent_data.remove_stasis, user.id, amount)
         embed = create_success_embed(
             "Stasis Removed",
             f"Removed **{amount}** stasis from {user.mention}.\n"
             f"Remaining stasis: **{remaining}**"
         )
     elif action.lower() == "check":
-        stasis_count = persistent_data.get_stasis(user.id)
+        stasis_count = await asyncio.to_thread(persistent_data.get_stasis, user.id)
         embed = create_embed(
             "Stasis Check",
             f"{user.mention} has **{stasis_count}** stasis."
         )
     elif action.lower() == "clear":
         persistent_data.stasis[user.id] = 0
-        persistent_data.save_stasis()
+        await asyncio.to_thread(persistent_data.save_stasis)
         embed = create_success_embed("Stasis Cleared", f"Cleared all stasis for {user.mention}.")
     else:
         await ctx.send("❌ Invalid action. Use: add, remove, check, clear")
@@ -225,27 +235,29 @@ async def stasis_command(ctx: commands.Context, action: str, user: discord.Membe
     await ctx.send(embed=embed)
 
 @command("logs", PermissionLevel.ADMIN, "View recent logs")
-async def logs_command(ctx: commands.Context, lines: int = 20):
-    """View recent log entries (admin only)"""
+async def logs_command(ctx: commands.Context, lines: int = 20, *, pattern: str = None):
+    """View recent log entries, optionally only those matching a regex (admin only)"""
+    lines = max(1, min(lines, 200))
     try:
-        with open(config.log_file, 'r') as f:
-            log_lines = f.readlines()
+        recent_lines = await tail_lines_async(config.log_file, lines, pattern)
+        log_content = '\n'.join(recent_lines)
         
-        # Get last N lines
-        recent_lines = log_lines[-lines:] if len(log_lines) > lines else log_lines
-        log_content = ''.join(recent_lines)
+        # Truncate to fit an embed field (1024 chars)
+        if len(log_content) > 950:
+            log_content = "... (truncated)\n" + log_content[-950:]
         
-        # Truncate if too long
-        if len(log_content) > 1900:
-            log_content = log_content[-1900:] + "... (truncated)"
-        
-        embed = create_embed(f"Recent Logs ({len(recent_lines)} lines)")
-        embed.add_field(name="Content", value=f"```\n{log_content}\n```", inline=False)
+        title = f"Recent Logs ({len(recent_lines)} lines)"
+        if pattern:
+            title += f" matching `{pattern}`"
+        embed = create_embed(title)
+        embed.add_field(name="Content", value=f"```\n{log_content or 'No matching lines'}\n```", inline=False)
         
         await ctx.send(embed=embed)
         
     except FileNotFoundError:
         await ctx.send("❌ Log file not found.")
+    except re.error as e:
+        await ctx.send(f"❌ Invalid pattern: {e}")
     except Exception as e:
         await ctx.send(f"❌ Error reading logs: {e}")
 
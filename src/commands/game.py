@@ -3,6 +3,7 @@ Game-related commands for Discord Werewolf Bot
 Enhanced with comprehensive game state integration
 """
 
+import asyncio
 import discord
 from discord.ext import commands
 import random
@@ -14,6 +15,7 @@ from src.utils.helpers import (create_embed, create_error_embed, create_success_
                               remove_player_role, get_guild, get_rate_limiter)
 from src.game.state import game_session, GamePhase
 from src.game.phase_manager import PhaseManager
+from src.game.agents import AgentDriver, POLICIES, assign_policies
 
 # Initialize configuration if not already done
 try:
@@ -793,10 +795,22 @@ async def roles_command(ctx: commands.Context):
     
     await ctx.send(embed=embed)
 
+# Scripted players of the running test game, if it was started with a policy
+soak_driver = None
+
+def soak_commands():
+    """The command coroutines scripted players act through"""
+    from src.commands.voting import vote_command
+    from src.commands.night_actions import kill_command, see_command, detect_command, protect_command, pass_command
+    return {'vote': vote_command, 'kill': kill_command, 'see': see_command, 'detect': detect_command,
+            'protect': protect_command, 'pass': pass_command}
+
 # Dev/Admin commands for testing
 @command("teststart", PermissionLevel.ADMIN, "Start a test game with bots")
-async def teststart_command(ctx: commands.Context, player_count: int = 8):
-    """Start a test game with bot players"""
+async def teststart_command(ctx: commands.Context, player_count: int = 8, policy: str = "",
+                            phase_seconds: int = 0, rate: float = 2.0):
+    """Start a test game with bot players, optionally scripted (policy) with short phases"""
+    global soak_driver
     if game_session.playing:
         embed = create_error_embed("Game Running", "A game is already running!")
         await ctx.send(embed=embed)
@@ -822,6 +836,16 @@ async def teststart_command(ctx: commands.Context, player_count: int = 8):
         
         game_session.add_player(bot_user)
     
+    # Scripted players: a policy name, or several separated by commas
+    agents = None
+    if policy:
+        bot_ids = [pid for pid in game_session.players if pid != ctx.author.id]
+        try:
+            agents = assign_policies(bot_ids, policy)
+        except ValueError as e:
+            await ctx.send(embed=create_error_embed("Unknown Policy", str(e)))
+            return
+    
     # Start the game
     success = game_session.start_game("default")
     if success:
@@ -829,14 +853,55 @@ async def teststart_command(ctx: commands.Context, player_count: int = 8):
             "🧪 Test Game Started",
             f"Test game started with {len(game_session.players)} players!"
         )
+        
+        # vote, kill, see, ... check the phase and record actions on the game manager,
+        # so it runs the test game the way a vote-started game is run
+        from src.game.phases import GameManager
+        game_session.game_manager = GameManager(ctx.bot)
+        if int(phase_seconds) > 0:
+            # Compressed phases for soak runs
+            seconds = int(phase_seconds)
+            game_session.game_manager.day_duration = game_session.game_manager.night_duration = seconds
+            game_session.game_manager.day_warning_time = game_session.game_manager.night_warning_time = max(1, seconds // 4)
+            embed.add_field(name="Phase Length", value=f"{seconds}s", inline=True)
+        
+        if soak_driver:
+            soak_driver.stop()
+            soak_driver = None
+        if agents:
+            soak_driver = AgentDriver(game_session, agents, soak_commands(), bot=ctx.bot,
+                                      actions_per_second=float(rate))
+            embed.add_field(name="Scripted Players", value=f"{len(agents)} × {policy} at {rate}/s", inline=True)
         await ctx.send(embed=embed)
         
-        if phase_manager:
-            await phase_manager.start_game_flow()
+        await game_session.game_manager._start_night_phase_messages(game_session)
+        if soak_driver:
+            soak_driver.start()
     else:
         embed = create_error_embed("Start Failed", "Failed to start test game.")
         await ctx.send(embed=embed)
 
+@command("soak", PermissionLevel.ADMIN, "Show or stop the scripted players of a test game")
+async def soak_command(ctx: commands.Context, action: str = ""):
+    """Throughput and error counts of the scripted players; `soak stop` stops them"""
+    global soak_driver
+    if soak_driver is None:
+        await ctx.send(embed=create_error_embed("No Soak Run", "Start one with `teststart <players> <policy>`."))
+        return
+    if action.lower() == "stop":
+        soak_driver.stop()
+    stats = soak_driver.stats()
+    embed = create_embed(
+        title="🧪 Soak Run" + ("" if soak_driver.running else " (stopped)"),
+        description=f"Policies: {', '.join(POLICIES)}",
+        color=discord.Color.blue()
+    )
+    for name, value in stats.items():
+        if isinstance(value, dict):
+            value = ", ".join(f"{key}: {count}" for key, count in value.items()) or "-"
+        embed.add_field(name=name.replace('_', ' ').title(), value=str(value), inline=True)
+    await ctx.send(embed=embed)
+
 @command("phase", PermissionLevel.ADMIN, "Change game phase")
 async def phase_command(ctx: commands.Context, new_phase: str):
     """Change the current game phase"""
@@ -946,7 +1011,7 @@ async def leave_command(ctx: commands.Context, force: str = ""):
         
         # Player is leaving during an active game
         session.kill_player(ctx.author.id, "quit")
-        persistent_data.add_stasis(ctx.author.id, config.quit_game_stasis)
+        await asyncio.to_thread(persistent_data.add_stasis, ctx.author.id, config.quit_game_stasis)
         
         embed = create_error_embed(
             "Player Quit",
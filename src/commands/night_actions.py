@@ -28,7 +28,7 @@ async def kill_command(ctx: commands.Context, target_name: str = ""):
         return
     
     # Check if player is a wolf
-    if not player.role or player.role.info.team != Team.WOLF:
+    if not player.role or player.role.info.team != Team.WEREWOLF:
         await ctx.send("❌ Only wolves can use this command.")
         return
     
@@ -52,7 +52,7 @@ async def kill_command(ctx: commands.Context, target_name: str = ""):
         return
     
     # Check if target is a fellow wolf
-    if target_player.role and target_player.role.info.team == Team.WOLF:
+    if target_player.role and target_player.role.info.team == Team.WEREWOLF:
         await ctx.send("❌ You cannot kill a fellow wolf.")
         return
     
@@ -285,13 +285,13 @@ async def myrole_command(ctx: commands.Context):
         )
     
     # Add team-specific information
-    if role.info.team == Team.WOLF:
+    if role.info.team == Team.WEREWOLF:
         # Show other wolves
         wolves = []
         for other_player in session.players.values():
             if (other_player.user_id != player.user_id and 
                 other_player.role and 
-                other_player.role.info.team == Team.WOLF and
+                other_player.role.info.team == Team.WEREWOLF and
                 other_player.alive):
                 wolves.append(other_player.name)
         
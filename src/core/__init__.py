@@ -48,6 +48,11 @@ class BotConfig:
     stasis_file: str
     log_file: str
     
+    # Log rotation
+    log_max_bytes: int
+    log_backup_count: int
+    log_rotate_hours: int
+    
     # Other settings
     min_log_level: int
     message_language: str
@@ -161,6 +166,9 @@ def initialize_config() -> BotConfig:
     notify_file = get_str_env('NOTIFY_FILE', 'NOTIFY_FILE', 'notify.txt')
     stasis_file = get_str_env('STASIS_FILE', 'STASIS_FILE', 'stasis.json')
     log_file = get_str_env('LOG_FILE', 'LOG_FILE', 'debug.txt')
+    log_max_bytes = get_int_env('LOG_MAX_BYTES', 'LOG_MAX_BYTES', 10 * 1024 * 1024)
+    log_backup_count = get_int_env('LOG_BACKUP_COUNT', 'LOG_BACKUP_COUNT', 5)
+    log_rotate_hours = get_int_env('LOG_ROTATE_HOURS', 'LOG_ROTATE_HOURS', 24)
     
     # Other settings
     message_language = get_str_env('MESSAGE_LANGUAGE', 'MESSAGE_LANGUAGE', 'en')
@@ -187,6 +195,9 @@ def initialize_config() -> BotConfig:
         notify_file=notify_file,
         stasis_file=stasis_file,
         log_file=log_file,
+        log_max_bytes=log_max_bytes,
+        log_backup_count=log_backup_count,
+        log_rotate_hours=log_rotate_hours,
         min_log_level=min_log_level,
         message_language=message_language,
         playing_message=playing_message,
@@ -230,8 +241,14 @@ def initialize_logger() -> logging.Logger:
     console_handler.setFormatter(formatter)
     _logger.addHandler(console_handler)
     
-    # File handler
-    file_handler = logging.FileHandler('werewolf_bot.log')
+    # File handler, rotated by size and age into gzipped archives
+    from src.utils.logfiles import CompressingRotatingFileHandler
+    file_handler = CompressingRotatingFileHandler(
+        _config.log_file,
+        max_bytes=_config.log_max_bytes,
+        backup_count=_config.log_backup_count,
+        rotate_seconds=_config.log_rotate_hours * 3600
+    )
     file_handler.setFormatter(formatter)
     _logger.addHandler(file_handler)
 
@@ -0,0 +1,101 @@
+"""
+Hot reload of game logic for Discord Werewolf Bot.
+Reloads modules in place with importlib and repoints the names a caller imported
+from them (`from src.game.deaths import resolve_death_cascade` binds a name that a
+plain reload would leave pointing at the old function). Every module's source is
+compiled before anything is reloaded, so a syntax error changes nothing, and if a
+module fails while running (an ImportError, a NameError) every module already
+reloaded is put back, so the caller is left with all old code or all new code.
+"""
+
+import importlib
+import logging
+import sys
+from types import ModuleType
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ReloadError(Exception):
+    """A module raised while reloading; all the modules were restored to their old code"""
+
+    def __init__(self, module_name: str, error: Exception):
+        super().__init__(f"{module_name}: {error}")
+        self.module_name = module_name
+        self.error = error
+
+
+def resolve_modules(names: Iterable[str]) -> List[ModuleType]:
+    """Loaded modules by name, in the order given; unknown names raise ValueError"""
+    modules = []
+    for name in names:
+        module = sys.modules.get(name)
+        if module is None:
+            raise ValueError(f"module {name} is not loaded")
+        modules.append(module)
+    return modules
+
+
+def check_sources(modules: Iterable[ModuleType]):
+    """Compile each module's current source; raises SyntaxError before anything is touched"""
+    for module in modules:
+        spec = getattr(module, '__spec__', None)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, 'get_source'):
+            raise ValueError(f"module {module.__name__} cannot be reloaded")
+        source = spec.loader.get_source(module.__name__)
+        compile(source, module.__file__, 'exec')
+
+
+def imported_names(namespace: Dict, modules: Iterable[ModuleType]) -> List[Tuple[str, ModuleType]]:
+    """(name, module) for every name in namespace that was imported from one of modules"""
+    bindings = []
+    for name, value in namespace.items():
+        if name.startswith('__'):
+            continue
+        # Modules themselves are reloaded in place and need no rebinding
+        sources = [module for module in modules
+                   if value is not module and getattr(module, name, _MISSING) is value]
+        if sources:
+            # A class re-exported by another module is taken from the one defining it
+            defining = [module for module in sources if getattr(value, '__module__', None) == module.__name__]
+            bindings.append((name, (defining or sources)[0]))
+    return bindings
+
+
+def _restore(saved: List[Tuple[ModuleType, Dict]]):
+    for module, namespace in saved:
+        module.__dict__.clear()
+        module.__dict__.update(namespace)
+        sys.modules[module.__name__] = module
+
+
+def reload_modules(modules: List[ModuleType], namespace: Dict = None) -> List[str]:
+    """Reload modules in order (dependencies first) and rebind namespace's imports from them
+
+    Returns the names that were rebound. Raises ReloadError, with everything restored,
+    if a module fails to reload.
+    """
+    check_sources(modules)
+    bindings = imported_names(namespace, modules) if namespace is not None else []
+    # reload() re-runs a module in its existing namespace, so a copy of it is the undo
+    saved = [(module, dict(module.__dict__)) for module in modules]
+    for module in modules:
+        try:
+            importlib.reload(module)
+        except Exception as e:
+            _restore(saved)
+            logger.error(f"Reloading {module.__name__} failed, restored all {len(modules)} modules: {e}")
+            raise ReloadError(module.__name__, e) from e
+        logger.info(f"Reloaded {module.__name__}")
+    rebound = []
+    for name, module in bindings:
+        new_value = getattr(module, name, _MISSING)
+        if new_value is _MISSING:
+            logger.warning(f"{name} no longer exists in {module.__name__}, keeping the old one")
+            continue
+        namespace[name] = new_value
+        rebound.append(name)
+    return rebound
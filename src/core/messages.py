@@ -0,0 +1,113 @@
+"""
+Message catalog for Discord Werewolf Bot.
+
+lang/<language>.json maps a message key to a list of variant templates. A language
+is only read and compiled the first time one of its messages is needed, so adding
+languages costs nothing at startup. Templates are checked and split once: static
+variants are returned as-is, the rest are bound to str.format. Missing keys fall
+back to the default language, then to the key itself.
+"""
+
+import json
+import logging
+import os
+import random
+from string import Formatter
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+LANG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'lang')
+
+# A compiled variant: either the finished string or a formatter to call with arguments
+Variant = Union[str, Callable[..., str]]
+
+
+def compile_template(template: str) -> Variant:
+    """Return the template itself if it has no fields, else its bound str.format"""
+    has_fields = False
+    for _literal, field, _spec, _conversion in Formatter().parse(template):
+        if field is not None:
+            has_fields = True
+    if not has_fields:
+        # Literal braces ({{ }}) still need one pass through format to unescape
+        return template.format() if '{' in template or '}' in template else template
+    return template.format
+
+
+class MessageCatalog:
+    """Lazily loaded, precompiled message variants for every language in lang/"""
+
+    def __init__(self, language: str = 'en', default_language: str = 'en', lang_dir: str = LANG_DIR):
+        self.language = language
+        self.default_language = default_language
+        self.lang_dir = lang_dir
+        self._languages: Dict[str, Dict[str, Tuple[Variant, ...]]] = {}
+
+    def _load(self, language: str) -> Dict[str, Tuple[Variant, ...]]:
+        compiled = self._languages.get(language)
+        if compiled is not None:
+            return compiled
+        compiled = {}
+        path = os.path.join(self.lang_dir, f'{language}.json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            logger.warning(f"No message file for language '{language}' at {path}")
+            data = {}
+        except ValueError as e:
+            logger.error(f"Failed to parse {path}: {e}")
+            data = {}
+        for key, variants in data.items():
+            if isinstance(variants, str):
+                variants = [variants]
+            try:
+                compiled[key] = tuple(compile_template(v) for v in variants)
+            except (ValueError, TypeError) as e:
+                logger.error(f"Bad template for '{key}' in {path}: {e}")
+        self._languages[language] = compiled
+        logger.info(f"Loaded {len(compiled)} messages for language '{language}'")
+        return compiled
+
+    def variants(self, key: str, language: Optional[str] = None) -> Tuple[Variant, ...]:
+        language = language or self.language
+        variants = self._load(language).get(key)
+        if not variants and language != self.default_language:
+            variants = self._load(self.default_language).get(key)
+        return variants or ()
+
+    def get(self, key: str, *args, rng: Optional[random.Random] = None, language: Optional[str] = None,
+            **kwargs) -> str:
+        """Render a random variant of key; rng should be the game's RNG so replays match"""
+        variants = self.variants(key, language)
+        if not variants:
+            logger.warning(f"Missing message '{key}'")
+            return key
+        variant = variants[0] if len(variants) == 1 else (rng or random).choice(variants)
+        if isinstance(variant, str):
+            return variant
+        try:
+            return variant(*args, **kwargs)
+        except (IndexError, KeyError) as e:
+            logger.error(f"Message '{key}' is missing argument {e}")
+            return variant.__self__
+
+    def loaded_languages(self) -> List[str]:
+        return sorted(self._languages)
+
+
+_catalog: Optional[MessageCatalog] = None
+
+
+def get_catalog() -> MessageCatalog:
+    """Process-wide catalog for the configured message_language"""
+    global _catalog
+    if _catalog is None:
+        from src.core import initialize_config
+        try:
+            _catalog = MessageCatalog(initialize_config().message_language)
+        except ValueError as e:
+            logger.warning(f"Messages in the default language: {e}")
+            _catalog = MessageCatalog()
+    return _catalog
@@ -0,0 +1,254 @@
+"""
+Sharding support for Discord Werewolf Bot.
+
+Shard layout comes from the environment:
+    SHARD_COUNT  total number of shards across every process (unset = let Discord decide)
+    SHARD_IDS    shards run by this process, e.g. "0-3" or "0,2,4" (unset = all of them)
+
+A guild always belongs to shard (guild_id >> 22) % SHARD_COUNT, so a process only
+ever sees events - and therefore holds game state - for the guilds of its own shards.
+
+Run `python -m src.core.sharding --shards 4 --guilds 1000` to exercise the routing
+and metrics offline against a fake gateway. --router-shards / --router-shard-ids give
+the router a different layout from the gateway's, to see what a misconfigured
+process would misroute.
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Shard id Discord routes a guild to"""
+    if shard_count <= 0:
+        raise ValueError("shard_count must be positive")
+    return (guild_id >> 22) % shard_count
+
+
+def parse_shard_ids(spec: Optional[str]) -> Optional[List[int]]:
+    """Parse "0-3,6" style shard lists; None/empty means every shard"""
+    if not spec or not spec.strip():
+        return None
+    shard_ids = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-', 1)
+            start, end = int(start), int(end)
+            if end < start:
+                raise ValueError(f"invalid shard range '{part}'")
+            shard_ids.update(range(start, end + 1))
+        else:
+            shard_ids.add(int(part))
+    return sorted(shard_ids)
+
+
+@dataclass
+class ShardSettings:
+    """Which shards this process runs"""
+    shard_count: Optional[int] = None
+    shard_ids: Optional[List[int]] = None
+
+    def __post_init__(self):
+        if self.shard_ids is not None:
+            if self.shard_count is None:
+                raise ValueError("SHARD_IDS requires SHARD_COUNT")
+            bad = [sid for sid in self.shard_ids if not 0 <= sid < self.shard_count]
+            if bad:
+                raise ValueError(f"shard ids {bad} out of range for SHARD_COUNT={self.shard_count}")
+
+    def bot_kwargs(self) -> Dict:
+        """Keyword arguments for AutoShardedBot"""
+        kwargs = {}
+        if self.shard_count is not None:
+            kwargs['shard_count'] = self.shard_count
+        if self.shard_ids is not None:
+            kwargs['shard_ids'] = self.shard_ids
+        return kwargs
+
+    def describe(self) -> str:
+        if self.shard_count is None:
+            return "automatic shard count"
+        if self.shard_ids is None:
+            return f"all {self.shard_count} shards"
+        return f"shards {self.shard_ids} of {self.shard_count}"
+
+
+def load_shard_settings() -> ShardSettings:
+    """Read SHARD_COUNT / SHARD_IDS from the environment"""
+    count = os.getenv('SHARD_COUNT', '').strip()
+    return ShardSettings(
+        shard_count=int(count) if count else None,
+        shard_ids=parse_shard_ids(os.getenv('SHARD_IDS'))
+    )
+
+
+class ShardRouter:
+    """Maps guilds to shards and answers whether this process owns them"""
+
+    def __init__(self, shard_count: int = 1, shard_ids: Optional[Iterable[int]] = None):
+        self.shard_count = shard_count
+        self.shard_ids = set(shard_ids) if shard_ids is not None else set(range(shard_count))
+
+    def update(self, shard_count: Optional[int], shard_ids: Optional[Iterable[int]] = None):
+        """Refresh the layout once the gateway has decided the shard count"""
+        if shard_count:
+            self.shard_count = shard_count
+            self.shard_ids = set(shard_ids) if shard_ids is not None else set(range(shard_count))
+
+    def shard_of(self, guild_id: Optional[int]) -> int:
+        # DMs always arrive on shard 0
+        if guild_id is None:
+            return 0
+        return shard_for_guild(guild_id, self.shard_count)
+
+    def owns(self, guild_id: Optional[int]) -> bool:
+        return self.shard_of(guild_id) in self.shard_ids
+
+
+class ShardMetrics:
+    """Per-shard event counters, event rate over a sliding window, and latency"""
+
+    def __init__(self, window: float = 60.0, clock=time.monotonic):
+        self.window = window
+        self._clock = clock
+        self.events: Counter = Counter()
+        self._recent: Dict[int, Deque[float]] = {}
+        self.latencies: Dict[int, float] = {}
+        self.status: Dict[int, str] = {}
+        self.reconnects: Counter = Counter()
+
+    def record_event(self, shard_id: int):
+        now = self._clock()
+        self.events[shard_id] += 1
+        recent = self._recent.setdefault(shard_id, deque())
+        recent.append(now)
+        self._trim(recent, now)
+
+    def record_status(self, shard_id: int, status: str):
+        if status == 'resumed' or (status == 'ready' and self.status.get(shard_id) == 'disconnected'):
+            self.reconnects[shard_id] += 1
+        self.status[shard_id] = status
+
+    def record_latencies(self, latencies: Iterable[Tuple[int, float]]):
+        for shard_id, latency in latencies:
+            # A shard that hasn't heartbeated yet reports inf
+            if math.isfinite(latency):
+                self.latencies[shard_id] = latency
+
+    def _trim(self, recent: Deque[float], now: float):
+        cutoff = now - self.window
+        while recent and recent[0] < cutoff:
+            recent.popleft()
+
+    def rate(self, shard_id: int) -> float:
+        """Events per second on a shard over the window"""
+        recent = self._recent.get(shard_id)
+        if not recent:
+            return 0.0
+        self._trim(recent, self._clock())
+        return len(recent) / self.window
+
+    def snapshot(self) -> Dict[int, Dict]:
+        shard_ids = set(self.events) | set(self.latencies) | set(self.status)
+        return {
+            shard_id: {
+                'status': self.status.get(shard_id, 'unknown'),
+                'latency_ms': round(self.latencies[shard_id] * 1000, 1) if shard_id in self.latencies else None,
+                'events': self.events[shard_id],
+                'events_per_sec': round(self.rate(shard_id), 2),
+                'reconnects': self.reconnects[shard_id],
+            }
+            for shard_id in sorted(shard_ids)
+        }
+
+
+class FakeGateway:
+    """Offline stand-in for the Discord gateway that replays synthetic guild traffic
+
+    The gateway decides each guild's shard itself, the way Discord documents it, rather
+    than through shard_for_guild, so run() checks the router against an independent answer.
+    """
+
+    def __init__(self, shard_count: int, guild_count: int, shard_ids: Optional[Iterable[int]] = None,
+                 seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        self.shard_count = shard_count
+        self.shard_ids = set(shard_ids) if shard_ids is not None else set(range(shard_count))
+        # Snowflakes: timestamp in the high bits, so the shard id is well mixed
+        self.guild_ids = [self.rng.getrandbits(41) << 22 | self.rng.getrandbits(22) for _ in range(guild_count)]
+        # Discord: shard_id = (guild_id >> 22) % num_shards
+        timestamps = {guild_id: guild_id >> 22 for guild_id in self.guild_ids}
+        self.guild_shards = {guild_id: timestamp % shard_count for guild_id, timestamp in timestamps.items()}
+        self.sources = self.guild_ids + [None]  # None: a DM
+
+    def events(self, count: int):
+        """Yield (shard_id, guild_id) pairs as the gateway would deliver them; DMs come on shard 0"""
+        for _ in range(count):
+            guild_id = self.rng.choice(self.sources)
+            shard_id = self.guild_shards[guild_id] if guild_id is not None else 0
+            if shard_id in self.shard_ids:
+                yield shard_id, guild_id
+
+    def run(self, router: ShardRouter, metrics: ShardMetrics, event_count: int) -> Dict:
+        """Feed events through the router; an event is misrouted if the router wouldn't
+        put its guild on the shard that delivered it, or doesn't own it"""
+        for shard_id in self.shard_ids:
+            metrics.record_status(shard_id, 'ready')
+            metrics.record_latencies([(shard_id, self.rng.uniform(0.02, 0.12))])
+        misrouted = 0
+        delivered = 0
+        for shard_id, guild_id in self.events(event_count):
+            delivered += 1
+            if not router.owns(guild_id) or router.shard_of(guild_id) != shard_id:
+                misrouted += 1
+            metrics.record_event(shard_id)
+        guilds_per_shard = Counter(self.guild_shards.values())
+        return {
+            'delivered': delivered,
+            'misrouted': misrouted,
+            'guilds_per_shard': dict(sorted(guilds_per_shard.items())),
+            'shards': metrics.snapshot(),
+        }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Exercise shard routing against a fake gateway")
+    parser.add_argument('--shards', type=int, default=4)
+    parser.add_argument('--shard-ids', default=None, help='shards run by this process, e.g. 0-1')
+    parser.add_argument('--guilds', type=int, default=1000)
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--router-shards', type=int, default=None, help='shard count the router is given '
+                        '(default: --shards)')
+    parser.add_argument('--router-shard-ids', default=None, help='shards the router thinks it runs '
+                        '(default: --shard-ids)')
+    args = parser.parse_args(argv)
+
+    settings = ShardSettings(shard_count=args.shards, shard_ids=parse_shard_ids(args.shard_ids))
+    router_settings = ShardSettings(
+        shard_count=args.router_shards or args.shards,
+        shard_ids=parse_shard_ids(args.router_shard_ids or args.shard_ids)
+    )
+    router = ShardRouter(router_settings.shard_count, router_settings.shard_ids)
+    gateway = FakeGateway(args.shards, args.guilds, settings.shard_ids, seed=args.seed)
+    report = gateway.run(router, ShardMetrics(), args.events)
+
+    print(f"Fake gateway: {args.guilds} guilds, {settings.describe()}; router: {router_settings.describe()}")
+    print(f"Delivered {report['delivered']} events, {report['misrouted']} misrouted")
+    for shard_id, stats in report['shards'].items():
+        print(f"  shard {shard_id}: {report['guilds_per_shard'].get(shard_id, 0)} guilds, "
+              f"{stats['events']} events, {stats['latency_ms']}ms")
+    return 1 if report['misrouted'] else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,392 @@
+"""
+Shared state storage for Discord Werewolf Bot.
+
+Server configs, stasis, the notify list and game snapshots all go through a
+StateBackend chosen by the STATE_BACKEND url:
+    memory://                      in-process only, for tests and throwaway runs
+    sqlite:///werewolf_state.db    single node (default)
+    redis://host:6379/0            multi-node; anything speaking the Redis protocol
+
+The interface is a small subset of Redis (strings, hashes, sets) so every backend
+behaves the same and several bot nodes pointed at one Redis share their state.
+Calls block (a Redis round trip can take up to its timeout), so code on the event
+loop runs them with asyncio.to_thread; every backend is safe to use from threads.
+"""
+
+import json
+import logging
+import os
+import select
+import socket
+import sqlite3
+import threading
+from typing import Any, Dict, Optional, Set
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_BACKEND = 'sqlite:///werewolf_state.db'
+
+
+class StateBackend:
+    """Key/value, hash and set storage shared by every node of the bot"""
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def hset(self, key: str, field: str, value: str):
+        raise NotImplementedError
+
+    def hdel(self, key: str, field: str):
+        raise NotImplementedError
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        raise NotImplementedError
+
+    def sadd(self, key: str, member: str) -> bool:
+        raise NotImplementedError
+
+    def srem(self, key: str, member: str) -> bool:
+        raise NotImplementedError
+
+    def smembers(self, key: str) -> Set[str]:
+        raise NotImplementedError
+
+    def sismember(self, key: str, member: str) -> bool:
+        return member in self.smembers(key)
+
+    def close(self):
+        pass
+
+    def get_json(self, key: str, default: Any = None) -> Any:
+        value = self.get(key)
+        if value is None:
+            return default
+        try:
+            return json.loads(value)
+        except ValueError as e:
+            logger.error(f"Corrupt JSON in state key {key}: {e}")
+            return default
+
+    def set_json(self, key: str, value: Any):
+        self.set(key, json.dumps(value))
+
+
+class MemoryBackend(StateBackend):
+    """Plain dicts; state lives and dies with the process"""
+
+    def __init__(self):
+        self._strings: Dict[str, str] = {}
+        self._hashes: Dict[str, Dict[str, str]] = {}
+        self._sets: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()  # for the read-modify-write calls made from worker threads
+
+    def get(self, key):
+        return self._strings.get(key)
+
+    def set(self, key, value):
+        self._strings[key] = value
+
+    def delete(self, key):
+        self._strings.pop(key, None)
+        self._hashes.pop(key, None)
+        self._sets.pop(key, None)
+
+    def hget(self, key, field):
+        return self._hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self._hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self._hashes.get(key, {}).pop(field, None)
+
+    def hgetall(self, key):
+        return dict(self._hashes.get(key, {}))
+
+    def hincrby(self, key, field, amount=1):
+        with self._lock:
+            fields = self._hashes.setdefault(key, {})
+            value = int(fields.get(field, 0)) + amount
+            fields[field] = str(value)
+            return value
+
+    def sadd(self, key, member):
+        with self._lock:
+            members = self._sets.setdefault(key, set())
+            added = member not in members
+            members.add(member)
+            return added
+
+    def srem(self, key, member):
+        with self._lock:
+            members = self._sets.get(key, set())
+            removed = member in members
+            members.discard(member)
+            return removed
+
+    def smembers(self, key):
+        return set(self._sets.get(key, set()))
+
+
+class SQLiteBackend(StateBackend):
+    """Single-file store; safe to share between worker processes on one host"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        self._db.execute('CREATE TABLE IF NOT EXISTS hashes (key TEXT, field TEXT, value TEXT NOT NULL, '
+                         'PRIMARY KEY (key, field))')
+        self._db.execute('CREATE TABLE IF NOT EXISTS sets (key TEXT, member TEXT, PRIMARY KEY (key, member))')
+
+    def _execute(self, sql: str, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get(self, key):
+        rows = self._execute('SELECT value FROM kv WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def set(self, key, value):
+        self._execute('INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)', (key, value))
+
+    def delete(self, key):
+        with self._lock:
+            for table in ('kv', 'hashes', 'sets'):
+                self._db.execute(f'DELETE FROM {table} WHERE key = ?', (key,))
+
+    def hget(self, key, field):
+        rows = self._execute('SELECT value FROM hashes WHERE key = ? AND field = ?', (key, field))
+        return rows[0][0] if rows else None
+
+    def hset(self, key, field, value):
+        self._execute('INSERT OR REPLACE INTO hashes (key, field, value) VALUES (?, ?, ?)', (key, field, value))
+
+    def hdel(self, key, field):
+        self._execute('DELETE FROM hashes WHERE key = ? AND field = ?', (key, field))
+
+    def hgetall(self, key):
+        return dict(self._execute('SELECT field, value FROM hashes WHERE key = ?', (key,)))
+
+    def hincrby(self, key, field, amount=1):
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._db.execute('SELECT value FROM hashes WHERE key = ? AND field = ?', (key, field)).fetchone()
+                value = (int(row[0]) if row else 0) + amount
+                self._db.execute('INSERT OR REPLACE INTO hashes (key, field, value) VALUES (?, ?, ?)',
+                                 (key, field, str(value)))
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return value
+
+    def sadd(self, key, member):
+        with self._lock:
+            return self._db.execute('INSERT OR IGNORE INTO sets (key, member) VALUES (?, ?)', (key, member)).rowcount > 0
+
+    def srem(self, key, member):
+        with self._lock:
+            return self._db.execute('DELETE FROM sets WHERE key = ? AND member = ?', (key, member)).rowcount > 0
+
+    def smembers(self, key):
+        return {row[0] for row in self._execute('SELECT member FROM sets WHERE key = ?', (key,))}
+
+    def sismember(self, key, member):
+        return bool(self._execute('SELECT 1 FROM sets WHERE key = ? AND member = ?', (key, member)))
+
+    def close(self):
+        self._db.close()
+
+
+class RedisProtocolError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+class RedisBackend(StateBackend):
+    """Minimal RESP client, so any Redis-compatible server works without extra packages"""
+
+    def __init__(self, host: str = 'localhost', port: int = 6379, db: int = 0,
+                 password: Optional[str] = None, timeout: float = 5.0):
+        self.address = (host, port)
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._buffer = b''
+
+    def _connect(self):
+        self._sock = socket.create_connection(self.address, timeout=self.timeout)
+        self._buffer = b''
+        if self.password:
+            self._roundtrip('AUTH', self.password)
+        if self.db:
+            self._roundtrip('SELECT', str(self.db))
+
+    def _closed_by_server(self) -> bool:
+        """True if the server hung up on the idle connection (it has sent EOF and nothing else)"""
+        readable, _, _ = select.select([self._sock], [], [], 0)
+        if not readable:
+            return False
+        try:
+            return self._sock.recv(1, socket.MSG_PEEK) == b''
+        except OSError:
+            return True
+
+    def _send(self, *args):
+        payload = [f'*{len(args)}\r\n'.encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode('utf-8')
+            payload.append(f'${len(data)}\r\n'.encode() + data + b'\r\n')
+        self._sock.sendall(b''.join(payload))
+
+    def _roundtrip(self, *args):
+        self._send(*args)
+        return self._read_reply()
+
+    def _read_line(self) -> bytes:
+        while b'\r\n' not in self._buffer:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Redis connection closed")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\r\n', 1)
+        return line
+
+    def _read_exact(self, size: int) -> bytes:
+        while len(self._buffer) < size + 2:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise ConnectionError("Redis connection closed")
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size + 2:]
+        return data
+
+    def _read_reply(self):
+        line = self._read_line()
+        kind, rest = line[:1], line[1:]
+        if kind == b'+':
+            return rest.decode()
+        if kind == b'-':
+            raise RedisProtocolError(rest.decode())
+        if kind == b':':
+            return int(rest)
+        if kind == b'$':
+            size = int(rest)
+            return None if size < 0 else self._read_exact(size).decode('utf-8')
+        if kind == b'*':
+            count = int(rest)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        raise RedisProtocolError(f"unexpected reply {line!r}")
+
+    def command(self, *args):
+        """Run one command, reconnecting once if the connection dropped before it was sent.
+
+        Once the command has gone out it is never sent again: the server may have run it
+        already, and a repeated HINCRBY would count twice."""
+        with self._lock:
+            for attempt in (1, 2):
+                try:
+                    if self._sock is None or self._closed_by_server():
+                        self._connect()
+                    self._send(*args)
+                    break
+                except (OSError, ConnectionError):
+                    self.close()
+                    if attempt == 2:
+                        raise
+            try:
+                return self._read_reply()
+            except (OSError, ConnectionError):
+                # The reply may be half read; the connection can't be reused
+                self.close()
+                raise
+
+    def get(self, key):
+        return self.command('GET', key)
+
+    def set(self, key, value):
+        self.command('SET', key, value)
+
+    def delete(self, key):
+        self.command('DEL', key)
+
+    def hget(self, key, field):
+        return self.command('HGET', key, field)
+
+    def hset(self, key, field, value):
+        self.command('HSET', key, field, value)
+
+    def hdel(self, key, field):
+        self.command('HDEL', key, field)
+
+    def hgetall(self, key):
+        flat = self.command('HGETALL', key) or []
+        return dict(zip(flat[::2], flat[1::2]))
+
+    def hincrby(self, key, field, amount=1):
+        return self.command('HINCRBY', key, field, amount)
+
+    def sadd(self, key, member):
+        return self.command('SADD', key, member) > 0
+
+    def srem(self, key, member):
+        return self.command('SREM', key, member) > 0
+
+    def smembers(self, key):
+        return set(self.command('SMEMBERS', key) or [])
+
+    def sismember(self, key, member):
+        return self.command('SISMEMBER', key, member) == 1
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+
+def create_backend(url: Optional[str] = None) -> StateBackend:
+    """Build a backend from a STATE_BACKEND url"""
+    url = url or os.getenv('STATE_BACKEND') or DEFAULT_STATE_BACKEND
+    parsed = urlparse(url)
+    if parsed.scheme == 'memory':
+        return MemoryBackend()
+    if parsed.scheme == 'sqlite':
+        # sqlite:///relative.db or sqlite:////absolute/path.db, like SQLAlchemy
+        path = url[len('sqlite:///'):] if url.startswith('sqlite:///') else parsed.netloc + parsed.path
+        return SQLiteBackend(path or 'werewolf_state.db')
+    if parsed.scheme in ('redis', 'rediss'):
+        if parsed.scheme == 'rediss':
+            raise ValueError("TLS redis (rediss://) is not supported, use a local TLS tunnel")
+        db = int(parsed.path.lstrip('/') or 0)
+        return RedisBackend(parsed.hostname or 'localhost', parsed.port or 6379, db, parsed.password)
+    raise ValueError(f"Unknown STATE_BACKEND '{url}' (expected memory://, sqlite:/// or redis://)")
+
+
+_backend: Optional[StateBackend] = None
+
+
+def get_backend() -> StateBackend:
+    """Process-wide backend, created from STATE_BACKEND on first use"""
+    global _backend
+    if _backend is None:
+        _backend = create_backend()
+        logger.info(f"Using {type(_backend).__name__} for shared state")
+    return _backend
@@ -0,0 +1,143 @@
+"""
+Multi-process launcher for Discord Werewolf Bot.
+
+Splits the bot's shards across N worker processes (one bot.py per worker) so games
+on different shards run on different cores and one slow game can't stall the rest.
+Discord's gateway already delivers each guild's events only to the shard that owns
+it, so every worker receives exactly the games it is responsible for. A worker that
+crashes is restarted with backoff and resumes its running game from its snapshot.
+A worker that exits cleanly is not restarted, and one that keeps failing right after
+starting (a bad token, say) is given up on.
+
+    python -m src.core.supervisor --workers 4
+    python -m src.core.supervisor --workers 4 --shards 16
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BOT_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'bot.py')
+
+
+def split_shards(shard_count: int, workers: int) -> List[List[int]]:
+    """Divide shard ids 0..shard_count-1 into contiguous ranges, one per worker"""
+    if workers <= 0 or shard_count < workers:
+        raise ValueError("need at least one shard per worker")
+    base, extra = divmod(shard_count, workers)
+    ranges, start = [], 0
+    for i in range(workers):
+        size = base + (1 if i < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+
+class Worker:
+    """One bot.py process running a fixed shard range"""
+
+    def __init__(self, index: int, shard_ids: List[int], shard_count: int):
+        self.index = index
+        self.shard_ids = shard_ids
+        self.shard_count = shard_count
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.restarts = 0
+        self.started_at = 0.0
+
+    def env(self) -> Dict[str, str]:
+        env = dict(os.environ)
+        env['SHARD_COUNT'] = str(self.shard_count)
+        env['SHARD_IDS'] = f"{self.shard_ids[0]}-{self.shard_ids[-1]}"
+        return env
+
+    async def start(self):
+        self.process = await asyncio.create_subprocess_exec(sys.executable, BOT_SCRIPT, env=self.env())
+        self.started_at = time.monotonic()
+        logger.info(f"Worker {self.index} started (pid {self.process.pid}, shards {self.shard_ids})")
+
+
+class Supervisor:
+    """Starts workers, restarts the ones that die, and stops them all on shutdown"""
+
+    MAX_BACKOFF = 60
+    FAST_FAILURE = 30      # seconds; a worker dying sooner than this counts as failing to start
+    MAX_FAST_FAILURES = 5  # in a row, before the worker is given up on
+
+    def __init__(self, workers: int, shard_count: int):
+        self.workers = [Worker(i, shard_ids, shard_count)
+                        for i, shard_ids in enumerate(split_shards(shard_count, workers))]
+        self._stopping = False
+
+    async def _watch(self, worker: Worker) -> bool:
+        """Keep worker running; False if it was given up on"""
+        backoff = 1
+        fast_failures = 0
+        while not self._stopping:
+            await worker.start()
+            code = await worker.process.wait()
+            if self._stopping:
+                break
+            if code == 0:
+                logger.info(f"Worker {worker.index} exited cleanly, not restarting it")
+                break
+            uptime = time.monotonic() - worker.started_at
+            fast_failures = fast_failures + 1 if uptime < self.FAST_FAILURE else 0
+            if fast_failures >= self.MAX_FAST_FAILURES:
+                logger.error(f"Worker {worker.index} exited with code {code} within {self.FAST_FAILURE}s of "
+                             f"starting {fast_failures} times in a row, giving up (check its log)")
+                return False
+            # A worker that stayed up for a while gets a fresh backoff
+            if uptime > self.MAX_BACKOFF:
+                backoff = 1
+            worker.restarts += 1
+            logger.error(f"Worker {worker.index} exited with code {code}, restarting in {backoff}s "
+                         f"(restart #{worker.restarts})")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.MAX_BACKOFF)
+        return True
+
+    def stop(self):
+        self._stopping = True
+        for worker in self.workers:
+            if worker.process and worker.process.returncode is None:
+                worker.process.terminate()
+
+    async def run(self) -> bool:
+        """Run until stopped or every worker has exited; False if any was given up on"""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows: fall back to KeyboardInterrupt
+                pass
+        try:
+            return all(await asyncio.gather(*(self._watch(worker) for worker in self.workers)))
+        finally:
+            self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the bot as several sharded worker processes")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--shards', type=int, default=None, help='total shard count (default: one per worker)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    supervisor = Supervisor(args.workers, args.shards or args.workers)
+    try:
+        return 0 if asyncio.run(supervisor.run()) else 1
+    except KeyboardInterrupt:
+        supervisor.stop()
+        return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,282 @@
+"""
+Scripted players for soak testing.
+teststart fills a game with MockUser bots. An AgentDriver gives each of them a policy
+that picks their day votes and night targets, and submits those through the same
+command coroutines a human triggers, at a configurable rate. Replies are recorded
+instead of sent, and the driver counts commands, errors and phases for the run.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import Counter, deque
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.game.roles import Team
+
+logger = logging.getLogger(__name__)
+
+# Night command each role uses; other roles with a night action pass
+NIGHT_COMMANDS = {
+    'Seer': 'see', 'Oracle': 'see', 'Augur': 'see',
+    'Detective': 'detect',
+    'Guardian Angel': 'protect', 'Bodyguard': 'protect',
+}
+
+
+def is_wolf(player) -> bool:
+    return player.role is not None and player.role.team == Team.WEREWOLF
+
+
+def night_command(player) -> Optional[str]:
+    """Command name this player's role acts with at night, or None if it has no night action"""
+    if player.role is None or not player.can_act("night"):
+        return None
+    if is_wolf(player):
+        return 'kill'
+    return NIGHT_COMMANDS.get(player.role.name, 'pass')
+
+
+def phase_clock(session):
+    """Whatever tracks the phase and day/night counts: the game manager when one runs the game"""
+    return getattr(session, 'game_manager', None) or session
+
+
+def vote_counts(session) -> Dict[int, int]:
+    """Current lynch votes per target, from wherever the vote command records them"""
+    manager = getattr(session, 'game_manager', None)
+    if manager is not None:
+        return manager.get_vote_status(session)['vote_counts']
+    return session.vote_counts
+
+
+def _others(session, player) -> List:
+    return [p for p in session.get_living_players() if p.user_id != player.user_id]
+
+
+class AgentPolicy:
+    """Picks targets for one or more scripted players; subclasses override the choices"""
+    name = 'idle'
+
+    def vote(self, session, player, rng: random.Random):
+        return None
+
+    def night_target(self, session, player, rng: random.Random):
+        return None
+
+
+class RandomPolicy(AgentPolicy):
+    """Votes and acts on random living players (wolves never pick other wolves at night)"""
+    name = 'random'
+
+    def vote(self, session, player, rng):
+        others = _others(session, player)
+        return rng.choice(others) if others else None
+
+    def night_target(self, session, player, rng):
+        others = _others(session, player)
+        if is_wolf(player):
+            others = [p for p in others if not is_wolf(p)]
+        return rng.choice(others) if others else None
+
+
+class MajorityPolicy(RandomPolicy):
+    """Joins the current lynch front-runner, or votes at random if nobody has votes yet"""
+    name = 'majority'
+
+    def vote(self, session, player, rng):
+        counts = {target: count for target, count in vote_counts(session).items()
+                  if target != player.user_id and target in session.players and session.players[target].alive}
+        if counts:
+            return session.players[max(counts, key=lambda target: (counts[target], -target))]
+        return super().vote(session, player, rng)
+
+
+class WolfPackPolicy(MajorityPolicy):
+    """Wolves all kill the same villager and never vote for each other; everyone else follows the majority"""
+    name = 'wolfpack'
+
+    def _pack_target(self, session):
+        # Every wolf works this out the same way, so the pack agrees without talking
+        prey = [p for p in session.get_living_players() if not is_wolf(p)]
+        if not prey:
+            return None
+        return random.Random(phase_clock(session).night_count).choice(sorted(prey, key=lambda p: p.user_id))
+
+    def vote(self, session, player, rng):
+        choice = super().vote(session, player, rng)
+        if is_wolf(player) and choice is not None and is_wolf(choice):
+            prey = [p for p in _others(session, player) if not is_wolf(p)]
+            choice = rng.choice(prey) if prey else None
+        return choice
+
+    def night_target(self, session, player, rng):
+        if is_wolf(player):
+            return self._pack_target(session)
+        return super().night_target(session, player, rng)
+
+
+class SeerPolicy(RandomPolicy):
+    """Seers check someone new every night and vote for the wolves they have seen"""
+    name = 'seer'
+
+    def __init__(self):
+        self.seen: Dict[int, Dict[int, bool]] = {}  # seer id -> {player id: is wolf}
+
+    def night_target(self, session, player, rng):
+        if night_command(player) != 'see':
+            return super().night_target(session, player, rng)
+        seen = self.seen.setdefault(player.user_id, {})
+        unseen = [p for p in _others(session, player) if p.user_id not in seen]
+        if not unseen:
+            return None
+        target = rng.choice(unseen)
+        seen[target.user_id] = is_wolf(target)
+        return target
+
+    def vote(self, session, player, rng):
+        wolves = [pid for pid, wolf in self.seen.get(player.user_id, {}).items()
+                  if wolf and pid in session.players and session.players[pid].alive]
+        if wolves:
+            return session.players[wolves[0]]
+        return super().vote(session, player, rng)
+
+
+POLICIES: Dict[str, Callable[[], AgentPolicy]] = {
+    policy.name: policy for policy in (AgentPolicy, RandomPolicy, MajorityPolicy, WolfPackPolicy, SeerPolicy)
+}
+
+
+def assign_policies(agent_ids: List[int], spec: str) -> Dict[int, AgentPolicy]:
+    """Policy per agent from a spec: one policy name for everyone, or names separated by commas dealt round-robin"""
+    names = [name.strip().lower() for name in spec.split(',') if name.strip()] or ['random']
+    unknown = [name for name in names if name not in POLICIES]
+    if unknown:
+        raise ValueError(f"Unknown policy {', '.join(unknown)}; choose from {', '.join(POLICIES)}")
+    # One instance per policy, so policies with memory share it across their agents
+    instances = {name: POLICIES[name]() for name in names}
+    return {agent_id: instances[names[i % len(names)]] for i, agent_id in enumerate(agent_ids)}
+
+
+class ScriptedContext:
+    """commands.Context stand-in for a scripted player; replies are kept, not sent"""
+
+    def __init__(self, author, bot=None):
+        self.author = author
+        self.bot = bot
+        self.guild = None
+        self.channel = None
+        self.message = None
+        self.replies = deque(maxlen=5)
+
+    async def send(self, content=None, **kwargs):
+        embed = kwargs.get('embed')
+        self.replies.append(content if content is not None else getattr(embed, 'title', None))
+
+
+class AgentDriver:
+    """Makes scripted players act through the real commands, actions_per_second at most"""
+
+    def __init__(self, session, agents: Dict[int, AgentPolicy], commands: Dict[str, Callable[..., Awaitable]],
+                 bot=None, actions_per_second: float = 2.0, seed: Optional[int] = None):
+        if actions_per_second <= 0:
+            raise ValueError("actions_per_second must be positive")
+        self.session = session
+        self.agents = agents
+        self.commands = commands
+        self.bot = bot
+        self.interval = 1 / actions_per_second
+        self.rng = random.Random(seed)
+        self._acted: Dict[int, tuple] = {}  # agent id -> phase key it last acted in
+        self._task: Optional[asyncio.Task] = None
+        self.started_at: Optional[float] = None
+        self.issued = Counter()
+        self.rejected = Counter()  # commands that answered with an error message
+        self.errors = 0
+        self.phases = 0
+        self._last_phase = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self.started_at = time.monotonic()
+            self._task = asyncio.create_task(self._run(), name='soak_agents')
+
+    def stop(self):
+        if self.running:
+            self._task.cancel()
+        self._task = None
+
+    def _phase_key(self) -> tuple:
+        clock = phase_clock(self.session)
+        return (clock.phase.value, clock.day_count, clock.night_count)
+
+    def _pending(self, key: tuple) -> List:
+        pending = []
+        for agent_id in self.agents:
+            player = self.session.players.get(agent_id)
+            if player is not None and player.alive and self._acted.get(agent_id) != key:
+                pending.append(player)
+        return pending
+
+    async def _run(self):
+        try:
+            while self.session.playing:
+                key = self._phase_key()
+                if key != self._last_phase:
+                    self._last_phase = key
+                    self.phases += 1
+                pending = self._pending(key)
+                if pending:
+                    await self.act(self.rng.choice(pending), key)
+                await asyncio.sleep(self.interval)
+        finally:
+            logger.info(f"Soak agents finished: {self.stats()}")
+
+    async def act(self, player, key: tuple):
+        """Have one scripted player take their turn for the current phase"""
+        self._acted[player.user_id] = key
+        policy = self.agents[player.user_id]
+        phase = key[0]
+        if phase == 'day':
+            name, target = 'vote', policy.vote(self.session, player, self.rng)
+        elif phase == 'night':
+            name, target = night_command(player), None
+            if name not in (None, 'pass'):
+                target = policy.night_target(self.session, player, self.rng)
+                if target is None:
+                    name = 'pass'
+        else:
+            return
+        command = self.commands.get(name)
+        if command is None or (name != 'pass' and target is None):
+            return
+        ctx = ScriptedContext(player.user, self.bot)
+        try:
+            if name == 'pass':
+                await command(ctx)
+            else:
+                await command(ctx, target.name)
+            self.issued[name] += 1
+            if any(str(reply).startswith("❌") for reply in ctx.replies):
+                self.rejected[name] += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Scripted {name} by {player.name} failed: {e}")
+
+    def stats(self) -> Dict:
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0.0
+        total = sum(self.issued.values())
+        return {
+            'agents': len(self.agents),
+            'commands': total,
+            'by_command': dict(self.issued),
+            'rejected': dict(self.rejected),
+            'errors': self.errors,
+            'phases': self.phases,
+            'elapsed_s': round(elapsed, 1),
+            'commands_per_s': round(total / elapsed, 2) if elapsed else 0.0,
+        }
@@ -0,0 +1,87 @@
+"""
+Death cascade resolution.
+A death can pull others down with it: a lover dies of heartbreak, an assassin's or a
+hunter's chosen target dies with them, a mad scientist takes both neighbours. The
+whole chain is worked out first from a worklist, without touching game state, so the
+caller can apply every death at once and announce them in a single message.
+"""
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.game.seating import SeatingRing
+
+LYNCH_WIN_ROLES = ('jester', 'fool')
+
+
+@dataclass
+class Death:
+    """One player dying; source is whoever's death caused it (None for the initial deaths)"""
+    player_id: int
+    cause: str
+    source: Optional[int] = None
+
+
+@dataclass
+class DeathCascade:
+    deaths: List[Death] = field(default_factory=list)
+    lynch_winner: Optional[int] = None  # jester/fool who won by being lynched
+
+    @property
+    def player_ids(self) -> List[int]:
+        return [death.player_id for death in self.deaths]
+
+    @property
+    def chained(self) -> List[Death]:
+        """Deaths caused by other deaths"""
+        return [death for death in self.deaths if death.source is not None]
+
+
+def _neighbours(seating: SeatingRing, player_id: int, dying: Set[int]) -> List[int]:
+    """Nearest player on each side who isn't already dead or dying"""
+    found = []
+    for side in (seating.left, seating.right):
+        candidate = side(player_id)
+        # Players dying in this cascade are still seated; step over them
+        while candidate is not None and candidate in dying and candidate != player_id:
+            candidate = side(candidate)
+        if candidate is not None and candidate != player_id and candidate not in found:
+            found.append(candidate)
+    return found
+
+
+def resolve_death_cascade(players: Dict[int, dict], initial: Iterable[Tuple[int, str]],
+                          seating: Optional[SeatingRing] = None) -> DeathCascade:
+    """Every death caused by initial (player_id, cause) deaths, in the order they happen"""
+    result = DeathCascade()
+    dying = set()
+
+    def is_alive(player_id: int) -> bool:
+        player = players.get(player_id)
+        return bool(player and player.get('alive')) and player_id not in dying
+
+    worklist = deque((player_id, cause, None) for player_id, cause in initial)
+    while worklist:
+        player_id, cause, source = worklist.popleft()
+        if not is_alive(player_id):
+            continue
+        dying.add(player_id)
+        result.deaths.append(Death(player_id, cause, source))
+        player = players[player_id]
+        role = player.get('role')
+
+        if cause == 'lynch' and role in LYNCH_WIN_ROLES and result.lynch_winner is None:
+            result.lynch_winner = player_id
+
+        lover = player.get('lover')
+        if lover is not None:
+            worklist.append((lover, 'heartbreak', player_id))
+        if player.get('template') == 'assassin' and player.get('assassin_target') is not None:
+            worklist.append((player['assassin_target'], 'assassin', player_id))
+        if role == 'hunter' and player.get('hunter_target') is not None:
+            worklist.append((player['hunter_target'], 'hunter', player_id))
+        if role == 'mad scientist' and seating is not None:
+            for neighbour in _neighbours(seating, player_id, dying):
+                worklist.append((neighbour, 'mad scientist', player_id))
+
+    return result
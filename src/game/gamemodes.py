@@ -0,0 +1,234 @@
+"""
+Gamemode role tables for the Werewolf bot.
+Tables live in data/gamemodes.json and are validated and compiled once at startup
+into per-player-count setups, so role assignment is a copy, a shuffle and a zip.
+"""
+import json
+import logging
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+Setup = Tuple[Tuple[str, ...], Tuple[Optional[str], ...]]
+
+
+def _parse_color(value) -> int:
+    """Accept colors as ints or '#RRGGBB' / '0xRRGGBB' strings"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text.startswith('#'):
+            text = text[1:]
+        elif text.startswith('0x'):
+            text = text[2:]
+        try:
+            return int(text, 16)
+        except ValueError:
+            pass
+    raise ValueError(f"invalid color {value!r}")
+
+
+def _check_names(where: str, names, known: Iterable[str], kind: str) -> List[str]:
+    """Ensure names is a list of known role/template names"""
+    if not isinstance(names, list):
+        raise ValueError(f"{where}: {kind}s must be a list")
+    known = set(known)
+    for name in names:
+        if name not in known:
+            raise ValueError(f"{where}: unknown {kind} {name!r}")
+    return list(names)
+
+
+def _fill(base: Sequence[str], num_players: int) -> List[str]:
+    """Pad a base role list with villagers up to num_players"""
+    return ['villager'] * (num_players - len(base)) + list(base)
+
+
+class GamemodeTable:
+    """Compiled role table for one fixed-setup gamemode"""
+
+    def __init__(self, name: str, description: str, color: int, rules: Optional[Dict[str, str]],
+                 setups: Dict[int, Tuple[List[str], List[str]]], fallback: List[Tuple[Optional[int], List[str], List[str]]],
+                 mismatch_fallback: Tuple[List[str], List[str]], max_players: int):
+        self.name = name
+        self.description = description
+        self.color = color
+        self.rules = rules
+        self._setups_source = setups
+        self._fallback = fallback
+        self._mismatch_fallback = mismatch_fallback
+        self.mismatched_rows = sorted(n for n, (roles, _) in setups.items() if len(roles) != n)
+        # Index = player count; anything above max_players is compiled on demand
+        self._compiled: List[Setup] = [self._compile(n) for n in range(max_players + 1)]
+
+    def _compile(self, num_players: int) -> Setup:
+        row = self._setups_source.get(num_players)
+        if row is not None and len(row[0]) == num_players:
+            roles, templates = row
+        elif row is not None:
+            base, templates = self._mismatch_fallback
+            roles = _fill(base, num_players)
+        else:
+            roles, templates = [], []
+            for below, base, base_templates in self._fallback:
+                if below is None or num_players < below:
+                    roles, templates = _fill(base, num_players), base_templates
+                    break
+        roles = list(roles) + ['villager'] * (num_players - len(roles))
+        templates = list(templates) + [None] * (num_players - len(templates))
+        return tuple(roles), tuple(templates)
+
+    def setup_for(self, num_players: int) -> Setup:
+        """Return the (roles, templates) setup for a player count"""
+        if 0 <= num_players < len(self._compiled):
+            return self._compiled[num_players]
+        return self._compile(num_players)
+
+    def roll(self, num_players: int, rng=random) -> Tuple[List[str], List[Optional[str]]]:
+        """Shuffled roles and templates, each at least num_players long"""
+        roles, templates = self.setup_for(num_players)
+        roles, templates = list(roles), list(templates)
+        rng.shuffle(roles)
+        rng.shuffle(templates)
+        return roles, templates
+
+
+class RandomGamemode:
+    """Gamemode that rolls a fresh balanced setup from role pools every game"""
+
+    def __init__(self, name: str, description: str, color: int, rules: Optional[Dict[str, str]],
+                 pools: Dict[str, List[str]], players_per_wolf: int, players_per_village: int):
+        self.name = name
+        self.description = description
+        self.color = color
+        self.rules = rules
+        self.village = tuple(pools['village'])
+        self.wolf = tuple(pools['wolf'])
+        self.neutral = tuple(pools['neutral'])
+        self.investigative = tuple(pools['investigative'])
+        self.templates = tuple(pools['templates'])
+        self.all_roles = self.village + self.wolf + self.neutral
+        self.players_per_wolf = players_per_wolf
+        self.players_per_village = players_per_village
+
+    def roll(self, num_players: int, rng=random) -> Tuple[List[str], List[Optional[str]]]:
+        """Roll a balanced random setup, each list at least num_players long"""
+        min_wolves = max(1, num_players // self.players_per_wolf)
+        min_village = max(2, num_players // self.players_per_village)
+
+        roles = [rng.choice(self.wolf) for _ in range(min_wolves)]
+        roles.append(rng.choice(self.investigative))
+        roles.extend(rng.choice(self.village) for _ in range(min_village - 1))
+        roles.extend(rng.choice(self.all_roles) for _ in range(num_players - len(roles)))
+        while len(roles) > num_players:
+            if 'villager' in roles:
+                roles.remove('villager')
+            else:
+                roles.pop()
+
+        num_templates = rng.randint(max(1, num_players // 6), max(2, num_players // 3))
+        templates: List[Optional[str]] = [rng.choice(self.templates) for _ in range(num_templates)]
+        templates.extend([None] * (num_players - len(templates)))
+
+        rng.shuffle(roles)
+        rng.shuffle(templates)
+        return roles, templates
+
+
+# Used for any gamemode name that has no table
+GENERIC_GAMEMODE = GamemodeTable('generic', '', 0x8B4513, None, {}, [(None, ['wolf'], [])], (['wolf'], []), 0)
+
+
+class GamemodeRegistry:
+    """All gamemodes loaded from the data file, in file order"""
+
+    def __init__(self, modes: Dict[str, object]):
+        self._modes = modes
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._modes
+
+    def names(self) -> List[str]:
+        return list(self._modes)
+
+    def get(self, name: str):
+        return self._modes.get(name)
+
+    def assign(self, player_ids: Sequence[int], gamemode: str, rng=random) -> List[Tuple[int, str, Optional[str]]]:
+        """Return (player_id, role, template) for every player"""
+        mode = self._modes.get(gamemode, GENERIC_GAMEMODE)
+        roles, templates = mode.roll(len(player_ids), rng)
+        return list(zip(player_ids, roles, templates))
+
+
+def _compile_mode(name: str, entry, known_roles, known_templates, max_players: int):
+    if not isinstance(entry, dict):
+        raise ValueError(f"gamemode {name!r} must be an object")
+    description = entry.get('description', '')
+    color = _parse_color(entry.get('color', 0x8B4513))
+    rules = entry.get('rules')
+    if rules is not None and not (isinstance(rules, dict) and 'name' in rules and 'value' in rules):
+        raise ValueError(f"gamemode {name!r}: rules must have 'name' and 'value'")
+
+    if 'random' in entry:
+        spec = entry['random']
+        pools = {}
+        for pool in ('village', 'wolf', 'neutral', 'investigative'):
+            pools[pool] = _check_names(f"{name}.random.{pool}", spec.get(pool), known_roles, 'role')
+            if not pools[pool]:
+                raise ValueError(f"{name}.random.{pool}: pool must not be empty")
+        pools['templates'] = _check_names(f"{name}.random.templates", spec.get('templates'), known_templates, 'template')
+        if not pools['templates']:
+            raise ValueError(f"{name}.random.templates: pool must not be empty")
+        return RandomGamemode(name, description, color, rules, pools,
+                              int(spec.get('players_per_wolf', 6)), int(spec.get('players_per_village', 3)))
+
+    def parse_setup(where, value):
+        if not isinstance(value, dict):
+            raise ValueError(f"{where}: setup must be an object")
+        roles = _check_names(where, value.get('roles'), known_roles, 'role')
+        templates = _check_names(where, value.get('templates', []), known_templates, 'template')
+        return roles, templates
+
+    setups = {}
+    for key, value in entry.get('setups', {}).items():
+        try:
+            count = int(key)
+        except ValueError:
+            raise ValueError(f"{name}.setups: player count {key!r} is not an integer")
+        setups[count] = parse_setup(f"{name}.setups.{key}", value)
+
+    fallback = []
+    for i, value in enumerate(entry.get('fallback', [])):
+        roles, templates = parse_setup(f"{name}.fallback[{i}]", value)
+        below = value.get('below')
+        fallback.append((int(below) if below is not None else None, roles, templates))
+    if not fallback or fallback[-1][0] is not None:
+        fallback.append((None, ['wolf'], []))
+
+    if 'mismatch_fallback' in entry:
+        mismatch_fallback = parse_setup(f"{name}.mismatch_fallback", entry['mismatch_fallback'])
+    else:
+        mismatch_fallback = (fallback[-1][1], fallback[-1][2])
+
+    table = GamemodeTable(name, description, color, rules, setups, fallback, mismatch_fallback, max_players)
+    if table.mismatched_rows:
+        logger.warning(f"Gamemode '{name}': setups for {table.mismatched_rows} players don't match their "
+                       f"player count, using fallback setup")
+    return table
+
+
+def load_gamemodes(path: str, known_roles: Iterable[str], known_templates: Iterable[str],
+                   max_players: int = 24) -> GamemodeRegistry:
+    """Load, validate and compile the gamemode tables at path"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not data:
+        raise ValueError(f"{path}: expected a non-empty object of gamemodes")
+    known_roles, known_templates = set(known_roles), set(known_templates)
+    modes = {name: _compile_mode(name, entry, known_roles, known_templates, max_players)
+             for name, entry in data.items()}
+    logger.info(f"Loaded {len(modes)} gamemodes from {path}")
+    return GamemodeRegistry(modes)
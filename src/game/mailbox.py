@@ -0,0 +1,101 @@
+"""
+Per-game command mailbox.
+Every command and timer-driven phase change for a game is queued here and applied by
+a single consumer task, strictly in arrival order, so a vote can never land halfway
+through end_night_phase and two phase transitions can never run at once. Each game
+owns its own mailbox, so games never wait on each other.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MailboxFull(Exception):
+    """Raised when a game's mailbox is at capacity"""
+
+
+class GameMailbox:
+    """Single-consumer queue applying one game's state mutations in order"""
+
+    def __init__(self, name: str = 'game', maxsize: int = 256, slow_threshold: float = 1.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.slow_threshold = slow_threshold
+        self._queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.max_depth = 0
+        self.last_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def in_consumer(self) -> bool:
+        """True when called from a handler the mailbox is currently running"""
+        return self._consumer is not None and asyncio.current_task() is self._consumer
+
+    def _ensure_consumer(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.get_running_loop().create_task(self._consume())
+
+    async def run(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) and wait for its result"""
+        # Handlers that trigger further game actions (a vote reaching majority ends the
+        # day) run them inline; queueing behind themselves would deadlock
+        if self.in_consumer():
+            return await func(*args, **kwargs)
+
+        self._ensure_consumer()
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((func, args, kwargs, future, time.monotonic()))
+        except asyncio.QueueFull:
+            raise MailboxFull(f"mailbox '{self.name}' is full ({self.maxsize} pending)")
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return await future
+
+    async def _consume(self):
+        while True:
+            func, args, kwargs, future, queued_at = await self._queue.get()
+            try:
+                # Caller gave up (e.g. its phase timer was cancelled) before we got to it
+                if future.cancelled():
+                    continue
+                started = time.monotonic()
+                self.last_wait = started - queued_at
+                self.max_wait = max(self.max_wait, self.last_wait)
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    if not future.done():
+                        future.cancel()
+                    raise
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                elapsed = time.monotonic() - started
+                if elapsed > self.slow_threshold:
+                    logger.warning(f"Mailbox '{self.name}': {getattr(func, '__name__', func)} took {elapsed:.2f}s "
+                                   f"with {self._queue.qsize()} queued behind it")
+                self.processed += 1
+            finally:
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'processed': self.processed,
+            'last_wait_ms': round(self.last_wait * 1000, 1),
+            'max_wait_ms': round(self.max_wait * 1000, 1),
+        }
@@ -0,0 +1,79 @@
+"""
+Night action table with a reverse visit index.
+NightActions is the player_id -> action dict the night commands already write to, and
+it also keeps target_id -> {player_id: action type} up to date as actions are recorded,
+replaced or cleared, so "who targeted X tonight" is a lookup instead of a scan.
+"""
+from typing import Dict, Iterable, Mapping, Optional, Union
+
+
+class NightActions(dict):
+    """player_id -> {'action': str, 'target': int, ...}, indexed by target"""
+
+    def __init__(self, actions: Optional[Mapping[int, dict]] = None):
+        super().__init__()
+        self._visitors: Dict[int, Dict[int, str]] = {}
+        if actions:
+            self.update(actions)
+
+    def _index(self, player_id: int, action: dict):
+        if not isinstance(action, dict):
+            return
+        target = action.get('target')
+        if target is not None:
+            self._visitors.setdefault(target, {})[player_id] = action.get('action')
+
+    def _unindex(self, player_id: int, action: dict):
+        if not isinstance(action, dict):
+            return
+        target = action.get('target')
+        visitors = self._visitors.get(target)
+        if visitors is not None:
+            visitors.pop(player_id, None)
+            if not visitors:
+                del self._visitors[target]
+
+    def __setitem__(self, player_id: int, action: dict):
+        previous = self.get(player_id)
+        if previous is not None:
+            self._unindex(player_id, previous)
+        super().__setitem__(player_id, action)
+        self._index(player_id, action)
+
+    def __delitem__(self, player_id: int):
+        self._unindex(player_id, self[player_id])
+        super().__delitem__(player_id)
+
+    def pop(self, player_id: int, *default):
+        if player_id in self:
+            self._unindex(player_id, self[player_id])
+        return super().pop(player_id, *default)
+
+    def popitem(self):
+        player_id, action = super().popitem()
+        self._unindex(player_id, action)
+        return player_id, action
+
+    def setdefault(self, player_id: int, default: dict = None):
+        if player_id not in self:
+            self[player_id] = default
+        return self[player_id]
+
+    def update(self, *args, **kwargs):
+        for player_id, action in dict(*args, **kwargs).items():
+            self[player_id] = action
+
+    def clear(self):
+        super().clear()
+        self._visitors.clear()
+
+    def visitors(self, target_id: int, action_types: Union[str, Iterable[str], None] = None) -> Dict[int, str]:
+        """{player_id: action type} of everyone targeting target_id, optionally only some action types"""
+        visitors = self._visitors.get(target_id)
+        if not visitors:
+            return {}
+        if action_types is None:
+            return dict(visitors)
+        if isinstance(action_types, str):
+            action_types = (action_types,)
+        return {pid: kind for pid, kind in visitors.items() if kind in action_types}
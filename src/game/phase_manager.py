@@ -137,14 +137,17 @@ class PhaseManager:
     
     async def _send_night_messages(self) -> None:
         """Send role-specific messages to players for night actions."""
-        for player in self.game_session.get_living_players():
+        living_players = self.game_session.get_living_players()
+        # One target list for the whole night, shared by every prompt
+        roster = "\n".join(f"{i+1}. {p.name}" for i, p in enumerate(living_players))
+        for player in living_players:
             if player.role and player.can_act("night"):
-                await self._send_night_action_prompt(player)
+                await self._send_night_action_prompt(player, roster)
         
         # Send wolf chat coordination
         await self._send_wolf_chat()
     
-    async def _send_night_action_prompt(self, player) -> None:
+    async def _send_night_action_prompt(self, player, roster: str) -> None:
         """Send night action prompt to a specific player."""
         role = player.role
         embed = create_embed(
@@ -154,13 +157,10 @@ class PhaseManager:
         )
         
         # Add available targets
-        living_players = self.game_session.get_living_players()
-        targets = [f"{i+1}. {p.name}" for i, p in enumerate(living_players) if p.user_id != player.user_id]
-        
-        if targets:
+        if roster:
             embed.add_field(
                 name="Available Targets",
-                value="\\n".join(targets),
+                value=roster[:1024],
                 inline=False
             )
         
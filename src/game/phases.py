@@ -57,6 +57,11 @@ class GameManager:
         self.day_warning_time = 60  # 1 minute warning
         self.night_warning_time = 30  # 30 second warning
     
+    def _cancel_timer(self) -> None:
+        """Cancel the phase timer, unless it is the task ending the phase right now"""
+        if self.phase_timer_task and self.phase_timer_task is not asyncio.current_task():
+            self.phase_timer_task.cancel()
+    
     def start_day_phase(self) -> None:
         """Start the day phase"""
         self.phase = GamePhase.DAY
@@ -69,8 +74,7 @@ class GameManager:
         self.abstain_votes.clear()
         
         # Start timer
-        if self.phase_timer_task:
-            self.phase_timer_task.cancel()
+        self._cancel_timer()
         self.phase_timer_task = asyncio.create_task(self._day_timer())
         
         logger.info(f"Day {self.day_count} started")
@@ -86,8 +90,7 @@ class GameManager:
         self.night_results.clear()
         
         # Start timer
-        if self.phase_timer_task:
-            self.phase_timer_task.cancel()
+        self._cancel_timer()
         self.phase_timer_task = asyncio.create_task(self._night_timer())
         
         logger.info(f"Night {self.night_count} started")
@@ -96,8 +99,7 @@ class GameManager:
         """End the game"""
         self.phase = GamePhase.ENDED
         
-        if self.phase_timer_task:
-            self.phase_timer_task.cancel()
+        self._cancel_timer()
         
         logger.info(f"Game ended: {win_reason}")
     
@@ -368,8 +370,7 @@ class GameManager:
         
         # If we lynched someone in this resolution, proceed immediately to night
         if 'lynched_id' in locals():
-            if self.phase_timer_task:
-                self.phase_timer_task.cancel()
+            self._cancel_timer()
             await asyncio.sleep(1)
             await self._start_night_phase_messages(session)
             return
@@ -390,8 +391,7 @@ class GameManager:
                 embed = create_embed("💀 Desperation Totem Activated", f"The following players failed to vote and have died: {names}")
                 await send_to_game_channel("", embed=embed)
                 # Proceed immediately to night after forced deaths
-                if self.phase_timer_task:
-                    self.phase_timer_task.cancel()
+                self._cancel_timer()
                 await asyncio.sleep(1)
                 await self._start_night_phase_messages(session)
                 return
@@ -435,8 +435,7 @@ class GameManager:
         
         # Start day phase immediately if anyone died or if night actions indicate immediate day
         if results["deaths"] or getattr(session, 'force_day', False):
-            if self.phase_timer_task:
-                self.phase_timer_task.cancel()
+            self._cancel_timer()
             await asyncio.sleep(1)
             await self._start_day_phase_messages(session)
             return
@@ -454,7 +453,7 @@ class GameManager:
                 "🃏 Fool Victory!",
                 f"**{lynched_player.name}** was a **{role.info.name}** and wins the game by being lynched!"
             )
-            await send_to_game_channel(self.bot, "", embed=embed)
+            await send_to_game_channel("", embed=embed)
             
             # End game with fool victory
             await self._end_game_with_winners({
@@ -481,7 +480,7 @@ class GameManager:
 
         # Collect wolf targets (unless wolves are sick from pestilence)
         wolf_targets: Dict[int, int] = {}
-        wolves = [p for p in session.players.values() if p.alive and p.role.info.team == Team.WOLF]
+        wolves = [p for p in session.players.values() if p.alive and p.role.info.team == Team.WEREWOLF]
 
         if getattr(session, 'wolves_sick', False):
             results["other_effects"].append("The wolves are sick this night and cannot perform a kill.")
@@ -604,7 +603,7 @@ class GameManager:
                 # Retribution: kill one wolf who targeted this player
                 if 'retribution' in templates:
                     offender_wolves = [wid for wid, act in self.night_actions.items() if act and (act.get('action') == 'kill' or 'target' in act or 'target_id' in act) and (act.get('target') == dead_id or act.get('target_id') == dead_id)]
-                    wolf_offenders = [w for w in offender_wolves if w in session.players and session.players[w].role.info.team == Team.WOLF]
+                    wolf_offenders = [w for w in offender_wolves if w in session.players and session.players[w].role.info.team == Team.WEREWOLF]
                     if wolf_offenders:
                         import random
                         victim_wolf = random.choice(wolf_offenders)
@@ -631,7 +630,7 @@ class GameManager:
             return {"winners": [], "reason": "No survivors", "team": "none"}
         
         # Count alive players by team
-        alive_wolves = [p for p in alive_players if p.role.info.team == Team.WOLF]
+        alive_wolves = [p for p in alive_players if p.role.info.team == Team.WEREWOLF]
         alive_village = [p for p in alive_players if p.role.info.team == Team.VILLAGE]
         alive_neutral = [p for p in alive_players if p.role.info.team == Team.NEUTRAL]
         
@@ -681,10 +680,10 @@ class GameManager:
         
         embed.add_field(name="All Players", value="\n".join(all_players), inline=False)
         
-        await send_to_game_channel(self.bot, "", embed=embed)
+        await send_to_game_channel("", embed=embed)
         
         # Reset game state
-        session.end_game()
+        session.end_game(winner_info["winners"], winner_info["reason"])
         
         # Update bot status
         activity = discord.Game(name=config.playing_message)
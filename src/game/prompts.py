@@ -0,0 +1,64 @@
+"""
+Night prompt templates.
+The fixed part of each role's night prompt (title, colour, power, command, example) is
+compiled once into an embed dict when the bot starts. The alive-player roster is
+rendered once per night, and each prompt is a shallow copy of its template with the
+roster and any per-player fields appended.
+"""
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import discord
+
+Field = Tuple[str, str]  # (name, value) of a non-inline embed field
+
+FIELD_LIMIT = 1024  # Discord's maximum embed field value length
+
+
+def _field(name: str, value: str) -> dict:
+    return {'name': name, 'value': value, 'inline': False}
+
+
+class PromptTemplates:
+    """role -> compiled embed dict"""
+
+    def __init__(self):
+        self._templates: Dict[str, dict] = {}
+
+    def __contains__(self, role: str) -> bool:
+        return role in self._templates
+
+    def register(self, roles: Iterable[str], title: str, description: str, color: int, fields: Sequence[Field]):
+        embed = discord.Embed(title=title, description=description, color=color)
+        for name, value in fields:
+            embed.add_field(name=name, value=value, inline=False)
+        compiled = embed.to_dict()
+        for role in roles:
+            self._templates[role] = compiled
+
+    def render(self, role: str, extra_fields: Iterable[Field] = ()) -> Optional[discord.Embed]:
+        """A fresh embed for role with extra_fields appended, or None if the role has no template"""
+        template = self._templates.get(role)
+        if template is None:
+            return None
+        data = dict(template)
+        # from_dict keeps the list it is given, so the template's own list is never appended to
+        data['fields'] = template.get('fields', []) + [_field(name, value) for name, value in extra_fields]
+        return discord.Embed.from_dict(data)
+
+
+class Roster:
+    """A numbered player list field, rendered again only when the players change"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._key: Optional[tuple] = None
+        self._field: Optional[Field] = None
+
+    def field(self, player_ids: Sequence[int], display_name: Callable[[int], str]) -> Field:
+        key = tuple(player_ids)
+        if key != self._key:
+            value = "\n".join(f"{number}. {display_name(pid)}" for number, pid in enumerate(key, 1))
+            if len(value) > FIELD_LIMIT:
+                value = value[:FIELD_LIMIT - 1] + "…"
+            self._key, self._field = key, (self.name, value or "-")
+        return self._field
@@ -0,0 +1,68 @@
+"""
+Seating order for adjacency effects.
+Players sit in a fixed circle, decided when the game starts. Living players form a
+doubly linked ring, so a death unlinks one seat and the nearest living neighbour on
+either side is always a single pointer away. A dead seat keeps its last pointers, so
+the neighbours of someone who just died can still be found.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class SeatingRing:
+    """Circle of player ids with O(1) living-neighbour lookups"""
+
+    def __init__(self, player_ids: Iterable[int] = (), dead: Iterable[int] = ()):
+        self.order: List[int] = list(player_ids)
+        dead = set(dead)
+        self._alive = {pid for pid in self.order if pid not in dead}
+        self._left: Dict[int, int] = {}
+        self._right: Dict[int, int] = {}
+        if not self._alive:
+            return
+        count = len(self.order)
+        # Link every seat (dead ones included) to the nearest living seat on each side
+        for step, links in ((-1, self._left), (1, self._right)):
+            start = next(i for i, pid in enumerate(self.order) if pid in self._alive)
+            nearest = self.order[start]
+            for offset in range(1, count + 1):
+                pid = self.order[(start + step * -offset) % count]
+                links[pid] = nearest
+                if pid in self._alive:
+                    nearest = pid
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def __contains__(self, player_id: int) -> bool:
+        return player_id in self._alive
+
+    def remove(self, player_id: int):
+        """Unlink a player who died"""
+        if player_id not in self._alive:
+            return
+        self._alive.discard(player_id)
+        left, right = self._left[player_id], self._right[player_id]
+        if left != player_id:
+            self._right[left] = right
+            self._left[right] = left
+
+    def _walk(self, player_id: int, links: Dict[int, int]) -> Optional[int]:
+        candidate = links.get(player_id)
+        # Only a dead seat can point at another dead seat; follow until someone is alive
+        for _ in range(len(self.order)):
+            if candidate is None or candidate == player_id:
+                return None
+            if candidate in self._alive:
+                return candidate
+            candidate = links.get(candidate)
+        return None
+
+    def left(self, player_id: int) -> Optional[int]:
+        return self._walk(player_id, self._left)
+
+    def right(self, player_id: int) -> Optional[int]:
+        return self._walk(player_id, self._right)
+
+    def neighbours(self, player_id: int) -> Tuple[Optional[int], Optional[int]]:
+        """Nearest living players to the left and right (the same player if only two are alive)"""
+        return self.left(player_id), self.right(player_id)
@@ -0,0 +1,136 @@
+"""
+Game snapshots for crash recovery.
+Game state is written to the shared state backend (src/core/storage.py) at every
+phase transition so a restarted worker, or another node, can pick the game up.
+Plain JSON loses int dict keys and sets, which the game state uses everywhere
+(keyed by user id), so those are tagged on the way out. Snapshots from older
+versions are brought up to date by the MIGRATIONS adapters, so a game survives a
+restart (or a hot reload) that changes the state layout.
+
+Each game has its own key, <prefix>:<guild id>:<channel id>, listed in the
+<prefix>:index set, so nodes sharing a backend never touch each other's games.
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+
+
+def _v1_to_v2(state: dict) -> dict:
+    # Players gained hunter_target (the player a hunter takes down with them)
+    for player in state.get('players', {}).values():
+        player.setdefault('hunter_target', None)
+    return state
+
+
+# Adapters from each older version to the next one
+MIGRATIONS: Dict[int, Callable[[dict], dict]] = {
+    1: _v1_to_v2,
+}
+
+
+def migrate(state: dict, version: int) -> dict:
+    """Bring a decoded snapshot written at version up to SNAPSHOT_VERSION"""
+    if version > SNAPSHOT_VERSION:
+        raise ValueError(f"snapshot version {version} is newer than {SNAPSHOT_VERSION}")
+    while version < SNAPSHOT_VERSION:
+        if version not in MIGRATIONS:
+            raise ValueError(f"no migration from snapshot version {version}")
+        state = MIGRATIONS[version](state)
+        version += 1
+    return state
+
+
+def encode(value: Any) -> Any:
+    """Convert game state into JSON-safe data, tagging sets and non-str dict keys"""
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value):
+            return {k: encode(v) for k, v in value.items()}
+        return {'__items__': [[encode(k), encode(v)] for k, v in value.items()]}
+    if isinstance(value, (set, frozenset)):
+        return {'__set__': [encode(v) for v in value]}
+    if isinstance(value, tuple):
+        return {'__tuple__': [encode(v) for v in value]}
+    if isinstance(value, list):
+        return [encode(v) for v in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"cannot snapshot value of type {type(value).__name__}")
+
+
+def decode(value: Any) -> Any:
+    """Inverse of encode"""
+    if isinstance(value, dict):
+        if '__items__' in value:
+            return {_hashable(decode(k)): decode(v) for k, v in value['__items__']}
+        if '__set__' in value:
+            return {_hashable(decode(v)) for v in value['__set__']}
+        if '__tuple__' in value:
+            return tuple(decode(v) for v in value['__tuple__'])
+        return {k: decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [decode(v) for v in value]
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def snapshot_key(prefix: str, guild_id: int, channel_id: int) -> str:
+    return f"{prefix}:{guild_id}:{channel_id}"
+
+
+def snapshot_ids(prefix: str, key: str) -> Optional[Tuple[int, int]]:
+    """(guild id, channel id) of a key made by snapshot_key, or None for any other key"""
+    parts = key.split(':')
+    if len(parts) != 3 or parts[0] != prefix or not (parts[1].isdigit() and parts[2].isdigit()):
+        return None
+    return int(parts[1]), int(parts[2])
+
+
+def list_snapshots(backend, prefix: str) -> List[str]:
+    """Keys of every saved game, on any node"""
+    return sorted(backend.smembers(f"{prefix}:index"))
+
+
+def pack(state: dict) -> dict:
+    """The stored form of a snapshot; encodes state, so call it before state changes again"""
+    return {'version': SNAPSHOT_VERSION, 'state': encode(state)}
+
+
+def write_snapshot(backend, key: str, data: dict):
+    """Store a packed snapshot under key and list it in its prefix's index"""
+    backend.set_json(key, data)
+    backend.sadd(f"{key.split(':', 1)[0]}:index", key)
+
+
+def save_snapshot(backend, key: str, state: dict):
+    """Store a snapshot under key in the shared state backend"""
+    write_snapshot(backend, key, pack(state))
+
+
+def load_snapshot(backend, key: str) -> Optional[dict]:
+    """Read a snapshot, or None if there is none or it can't be used"""
+    try:
+        data = backend.get_json(key)
+    except Exception as e:
+        logger.error(f"Failed to read game snapshot {key}: {e}")
+        return None
+    if data is None:
+        return None
+    try:
+        return migrate(decode(data['state']), data.get('version', 0))
+    except ValueError as e:
+        logger.warning(f"Ignoring game snapshot {key}: {e}")
+        return None
+
+
+def clear_snapshot(backend, key: str):
+    try:
+        backend.delete(key)
+        backend.srem(f"{key.split(':', 1)[0]}:index", key)
+    except Exception as e:
+        logger.error(f"Failed to remove game snapshot {key}: {e}")
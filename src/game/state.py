@@ -12,6 +12,7 @@ import random
 from enum import Enum
 
 from src.core import get_config, get_logger
+from src.core.storage import get_backend
 from src.utils.helpers import create_embed
 from src.game.roles import ROLE_REGISTRY, get_role_by_name, Team, WinCondition
 
@@ -105,30 +106,30 @@ class GameSession:
         self.vote_counts: Dict[int, int] = {}  # target_id -> vote_count
         self.abstain_votes: Set[int] = set()  # players who abstained
         
-    # Night actions
-    self.night_actions: Dict[int, Dict[str, Any]] = {}  # player_id -> action_data
-    self.night_results: List[str] = []
+        # Night actions
+        self.night_actions: Dict[int, Dict[str, Any]] = {}  # player_id -> action_data
+        self.night_results: List[str] = []
 
-    # Game configuration
-    self.gamemode = "default"
-    self.gamemode_votes: Dict[str, Set[int]] = {}  # gamemode -> voter_ids
+        # Game configuration
+        self.gamemode = "default"
+        self.gamemode_votes: Dict[str, Set[int]] = {}  # gamemode -> voter_ids
 
-    # Lobby start votes
-    self.start_votes: Set[int] = set()
+        # Lobby start votes
+        self.start_votes: Set[int] = set()
 
-    # Kill queue and protection
-    self.kills_tonight: Set[int] = set()  # Players to be killed
-    self.protections_tonight: Set[int] = set()  # Players protected
+        # Kill queue and protection
+        self.kills_tonight: Set[int] = set()  # Players to be killed
+        self.protections_tonight: Set[int] = set()  # Players protected
 
-    # Wolf team coordination
-    self.wolf_kill_votes: Dict[int, int] = {}  # wolf_id -> target_id
-    self.wolf_kill_target = None
+        # Wolf team coordination
+        self.wolf_kill_votes: Dict[int, int] = {}  # wolf_id -> target_id
+        self.wolf_kill_target = None
 
-    # Win tracking
-    self.winners: List[int] = []
-    self.win_reason = ""
-    # Totem / global flags
-    self.wolves_sick = False  # set by pestilence totem to block wolf kills next night
+        # Win tracking
+        self.winners: List[int] = []
+        self.win_reason = ""
+        # Totem / global flags
+        self.wolves_sick = False  # set by pestilence totem to block wolf kills next night
     
     # Player Management Methods
     
@@ -187,6 +188,10 @@ class GameSession:
         """Get all living players."""
         return [p for p in self.players.values() if p.alive]
     
+    def get_alive_players(self) -> List[Player]:
+        """Get all living players (the name the commands and GameManager use)."""
+        return self.get_living_players()
+    
     def get_dead_players(self) -> List[Player]:
         """Get all dead players."""
         return [p for p in self.players.values() if not p.alive]
@@ -533,95 +538,102 @@ class GameSession:
 game_session = GameSession()
 
 class PersistentData:
-    """Manages persistent data like stasis and notifications"""
+    """Manages persistent data like stasis and notifications, stored in the shared state backend"""
     
-    def __init__(self):
+    STASIS_KEY = 'stasis'
+    NOTIFY_KEY = 'notify'
+    
+    def __init__(self, backend=None):
+        self.backend = backend or get_backend()
         self.stasis: Dict[int, int] = {}
         self.notify_list: List[int] = []
         self.load_data()
     
     def load_data(self):
-        """Load persistent data from files"""
-        # Load stasis data
+        """Load persistent data from the backend, importing the legacy files once"""
+        self._import_legacy_files()
+        self.stasis = {int(k): int(v) for k, v in self.backend.hgetall(self.STASIS_KEY).items()}
+        self.notify_list = sorted(int(user_id) for user_id in self.backend.smembers(self.NOTIFY_KEY))
+    
+    def _import_legacy_files(self):
+        """Copy stasis.json / notify.txt into an empty backend"""
+        if config is None or self.backend.get('legacy_files_imported'):
+            return
         try:
             with open(config.stasis_file, 'r') as f:
-                data = json.load(f)
-                self.stasis = {int(k): v for k, v in data.items()}
+                for user_id, amount in json.load(f).items():
+                    self.backend.hset(self.STASIS_KEY, str(user_id), str(amount))
         except (FileNotFoundError, json.JSONDecodeError):
-            self.stasis = {}
-            
-        # Load notify list
+            pass
         try:
             with open(config.notify_file, 'r') as f:
-                content = f.read().strip()
-                if content:
-                    self.notify_list = [int(user_id) for user_id in content.split(',') if user_id.strip()]
-                else:
-                    self.notify_list = []
+                for user_id in f.read().strip().split(','):
+                    if user_id.strip():
+                        self.backend.sadd(self.NOTIFY_KEY, user_id.strip())
         except FileNotFoundError:
-            self.notify_list = []
-            # Create empty file
-            with open(config.notify_file, 'w') as f:
-                pass
+            pass
+        self.backend.set('legacy_files_imported', '1')
     
     def save_stasis(self):
-        """Save stasis data to file"""
+        """Write the local stasis table back to the backend"""
         try:
-            with open(config.stasis_file, 'w') as f:
-                json.dump(self.stasis, f, indent=2)
+            for user_id, amount in self.stasis.items():
+                if amount > 0:
+                    self.backend.hset(self.STASIS_KEY, str(user_id), str(amount))
+                else:
+                    self.backend.hdel(self.STASIS_KEY, str(user_id))
         except Exception as e:
-            logger.error(f"Failed to save stasis data: {e}")
+            if logger:
+                logger.error(f"Failed to save stasis data: {e}")
     
     def save_notify_list(self):
-        """Save notify list to file"""
+        """Write the local notify list back to the backend"""
         try:
-            with open(config.notify_file, 'w') as f:
-                f.write(','.join(str(user_id) for user_id in self.notify_list))
+            stored = self.backend.smembers(self.NOTIFY_KEY)
+            wanted = {str(user_id) for user_id in self.notify_list}
+            for user_id in stored - wanted:
+                self.backend.srem(self.NOTIFY_KEY, user_id)
+            for user_id in wanted - stored:
+                self.backend.sadd(self.NOTIFY_KEY, user_id)
         except Exception as e:
-            logger.error(f"Failed to save notify list: {e}")
+            if logger:
+                logger.error(f"Failed to save notify list: {e}")
     
     def add_stasis(self, user_id: int, amount: int = 1):
         """Add stasis to a user"""
-        if user_id in self.stasis:
-            self.stasis[user_id] += amount
-        else:
-            self.stasis[user_id] = amount
-        self.save_stasis()
+        self.stasis[user_id] = self.backend.hincrby(self.STASIS_KEY, str(user_id), amount)
     
     def remove_stasis(self, user_id: int, amount: int = 1) -> int:
         """Remove stasis from a user. Returns remaining stasis."""
-        if user_id not in self.stasis:
+        remaining = self.backend.hincrby(self.STASIS_KEY, str(user_id), -amount)
+        if remaining <= 0:
+            self.backend.hdel(self.STASIS_KEY, str(user_id))
+            self.stasis.pop(user_id, None)
             return 0
-            
-        self.stasis[user_id] = max(0, self.stasis[user_id] - amount)
-        if self.stasis[user_id] == 0:
-            del self.stasis[user_id]
-        
-        self.save_stasis()
-        return self.stasis.get(user_id, 0)
+        self.stasis[user_id] = remaining
+        return remaining
     
     def get_stasis(self, user_id: int) -> int:
         """Get stasis count for a user"""
-        return self.stasis.get(user_id, 0)
+        value = self.backend.hget(self.STASIS_KEY, str(user_id))
+        return int(value) if value else 0
     
     def add_to_notify(self, user_id: int) -> bool:
         """Add user to notify list. Returns True if added, False if already in list."""
-        if user_id not in self.notify_list:
+        added = self.backend.sadd(self.NOTIFY_KEY, str(user_id))
+        if added and user_id not in self.notify_list:
             self.notify_list.append(user_id)
-            self.save_notify_list()
-            return True
-        return False
+        return added
     
     def remove_from_notify(self, user_id: int) -> bool:
         """Remove user from notify list. Returns True if removed, False if not in list."""
+        removed = self.backend.srem(self.NOTIFY_KEY, str(user_id))
         if user_id in self.notify_list:
             self.notify_list.remove(user_id)
-            self.save_notify_list()
-            return True
-        return False
+        return removed
 
-# Global instances
-session = GameSession()
+# Global instances; one session, whichever name a module imports it by
+session = game_session
 persistent_data = PersistentData()
 
 def get_session() -> GameSession:
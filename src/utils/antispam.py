@@ -0,0 +1,140 @@
+"""
+Anti-spam for Discord Werewolf Bot.
+
+Every user gets a token bucket holding TOKENS_GIVEN tokens that refills completely
+over TOKEN_RESET seconds; each command costs one token. Commands sent with an empty
+bucket are dropped, and a user who keeps going until they have sent IGNORE_THRESHOLD
+commands in one burst is ignored for a while. Idle buckets are expired by a timing
+wheel, so memory tracks the number of recently active users, not everyone ever seen.
+"""
+
+import time
+from typing import Dict, Hashable, List, Optional, Set
+
+
+class TimingWheel:
+    """Hashed timing wheel: O(1) schedule, expiry cost proportional to what expires"""
+
+    def __init__(self, slots: int = 64, resolution: float = 1.0, clock=time.monotonic):
+        self.slots: List[Set[Hashable]] = [set() for _ in range(slots)]
+        self.resolution = resolution
+        self._clock = clock
+        self._tick = int(clock() / resolution)
+
+    def schedule(self, key: Hashable, deadline: float):
+        """Look at key again once deadline has passed (or one lap later if it is further out)"""
+        tick = max(int(deadline / self.resolution) + 1, self._tick + 1)
+        tick = min(tick, self._tick + len(self.slots))
+        self.slots[tick % len(self.slots)].add(key)
+
+    def advance(self, now: Optional[float] = None) -> Set[Hashable]:
+        """Move the wheel to now and return every key whose slot came due"""
+        now = self._clock() if now is None else now
+        target = int(now / self.resolution)
+        due: Set[Hashable] = set()
+        # After a long pause only one lap needs turning, every slot is due by then
+        steps = min(target - self._tick, len(self.slots))
+        for step in range(1, steps + 1):
+            slot = self.slots[(self._tick + step) % len(self.slots)]
+            if slot:
+                due |= slot
+                slot.clear()
+        self._tick = max(self._tick, target)
+        return due
+
+
+# Verdicts from TokenBucketLimiter.hit
+ALLOWED = 0
+THROTTLED = 1      # bucket empty, command dropped
+IGNORED = 2        # user is on the ignore list, command dropped
+NEWLY_IGNORED = 3  # this command pushed the user onto the ignore list
+
+
+class TokenBucketLimiter:
+    """Per-user token buckets with auto-ignore for repeat offenders"""
+
+    # Bucket layout, kept as a flat list per user to stay small
+    TOKENS, STAMP, BURST, IGNORED_UNTIL = range(4)
+
+    def __init__(self, tokens_given: int = 5, token_reset: float = 10, ignore_threshold: int = 7,
+                 ignore_seconds: Optional[float] = None, clock=time.monotonic):
+        if tokens_given <= 0 or token_reset <= 0:
+            raise ValueError("tokens_given and token_reset must be positive")
+        self.tokens_given = tokens_given
+        self.token_reset = token_reset
+        self.ignore_threshold = max(ignore_threshold, tokens_given + 1)
+        self.ignore_seconds = ignore_seconds if ignore_seconds is not None else token_reset * ignore_threshold
+        self.refill_rate = tokens_given / token_reset
+        self._clock = clock
+        self._buckets: Dict[Hashable, list] = {}
+        self._wheel = TimingWheel(slots=max(8, int(max(token_reset, self.ignore_seconds)) + 2), clock=clock)
+        self.dropped = 0
+        self.ignores = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _expire(self, now: float):
+        for key in self._wheel.advance(now):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+            deadline = self._idle_deadline(bucket)
+            if deadline <= now:
+                del self._buckets[key]
+            else:
+                self._wheel.schedule(key, deadline)
+
+    def _idle_deadline(self, bucket: list) -> float:
+        # A bucket that has refilled and isn't ignored is the same as no bucket
+        refilled_at = bucket[self.STAMP] + (self.tokens_given - bucket[self.TOKENS]) / self.refill_rate
+        return max(refilled_at, bucket[self.IGNORED_UNTIL])
+
+    def hit(self, key: Hashable) -> int:
+        """Spend a token for key; returns ALLOWED, THROTTLED, IGNORED or NEWLY_IGNORED"""
+        now = self._clock()
+        self._expire(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [float(self.tokens_given), now, 0, 0.0]
+            self._buckets[key] = bucket
+        elif bucket[self.IGNORED_UNTIL] > now:
+            self.dropped += 1
+            return IGNORED
+        else:
+            tokens = min(self.tokens_given, bucket[self.TOKENS] + (now - bucket[self.STAMP]) * self.refill_rate)
+            if tokens >= self.tokens_given:
+                bucket[self.BURST] = 0
+            bucket[self.TOKENS] = tokens
+            bucket[self.STAMP] = now
+
+        bucket[self.BURST] += 1
+        if bucket[self.TOKENS] >= 1:
+            bucket[self.TOKENS] -= 1
+            verdict = ALLOWED
+        elif bucket[self.BURST] >= self.ignore_threshold:
+            bucket[self.IGNORED_UNTIL] = now + self.ignore_seconds
+            bucket[self.BURST] = 0
+            self.ignores += 1
+            self.dropped += 1
+            verdict = NEWLY_IGNORED
+        else:
+            self.dropped += 1
+            verdict = THROTTLED
+
+        self._wheel.schedule(key, self._idle_deadline(bucket))
+        return verdict
+
+    def ignored_for(self, key: Hashable) -> float:
+        """Seconds left on key's ignore, 0 if not ignored"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return 0.0
+        return max(0.0, bucket[self.IGNORED_UNTIL] - self._clock())
+
+    def unignore(self, key: Hashable):
+        self._buckets.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {'tracked': len(self._buckets), 'dropped': self.dropped, 'ignores': self.ignores}
@@ -0,0 +1,66 @@
+"""
+Debounced callbacks for Discord Werewolf Bot.
+A burst of triggers (several wolves voting within a few seconds) runs the callback
+once, after things have been quiet for `delay` seconds, and never more than
+`max_delay` seconds after the first trigger, so a steady stream still updates.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Debouncer:
+    """Runs callback once per burst of trigger() calls"""
+
+    def __init__(self, callback: Callable[[], Awaitable], delay: float = 2.0, max_delay: float = 10.0,
+                 clock=time.monotonic):
+        if delay < 0 or max_delay < delay:
+            raise ValueError("need 0 <= delay <= max_delay")
+        self.callback = callback
+        self.delay = delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._first = self._last = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.triggers = 0
+        self.runs = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def trigger(self):
+        self.triggers += 1
+        self._last = self._clock()
+        if not self.pending:
+            self._first = self._last
+            self._task = asyncio.create_task(self._wait(), name='debounce')
+
+    def cancel(self):
+        """Drop a pending run (one already in progress finishes)"""
+        if self.pending:
+            self._task.cancel()
+        self._task = None
+
+    async def _wait(self):
+        while True:
+            due = min(self._last + self.delay, self._first + self.max_delay)
+            remaining = due - self._clock()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        # Triggers from here on start the next burst; runs never overlap
+        self._task = None
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            self.runs += 1
+            try:
+                await self.callback()
+            except Exception as e:
+                logger.error(f"Debounced {getattr(self.callback, '__name__', 'callback')} failed: {e}")
@@ -0,0 +1,58 @@
+"""
+Duplicate-send suppression for Discord Werewolf Bot.
+Recently sent messages are remembered by a 64-bit hash of (channel, content, embed)
+in a fixed-size cache whose entries expire after a short window.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def message_key(channel_id: int, content: Optional[str] = None, embed: Any = None) -> int:
+    """Stable 64-bit hash of a message; embeds are hashed by their canonical JSON form"""
+    embed_data = embed.to_dict() if hasattr(embed, 'to_dict') else embed
+    payload = json.dumps([channel_id, content or "", embed_data], sort_keys=True, default=str,
+                         separators=(',', ':'), ensure_ascii=False)
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+class TTLDedupeCache:
+    """Bounded cache of recently seen keys; every entry lives for the same ttl"""
+
+    def __init__(self, ttl: float = 2.0, maxsize: int = 1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        # key -> time first seen; with one ttl for all, insertion order is expiry order
+        self._entries: "OrderedDict[int, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float):
+        cutoff = now - self.ttl
+        entries = self._entries
+        while entries and next(iter(entries.values())) <= cutoff:
+            entries.popitem(last=False)
+
+    def seen(self, key: int) -> bool:
+        """True if key was recorded within the ttl; otherwise record it and return False"""
+        now = self._clock()
+        self._evict(now)
+        if key in self._entries:
+            self.hits += 1
+            return True
+        self.misses += 1
+        self._entries[key] = now
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
@@ -7,9 +7,13 @@ Enhanced version with comprehensive bot integration
 import discord
 from discord.ext import commands
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple
 from src.core import get_config, get_logger
+from src.utils.antispam import TimingWheel, TokenBucketLimiter
+from src.utils.dedupe import TTLDedupeCache, message_key
+from src.utils.outbound import Priority, get_scheduler
 
 # Global references set during initialization
 _bot: commands.Bot = None
@@ -20,9 +24,17 @@ _logger = None
 # Rate limiting
 _rate_limiters: Dict[int, datetime] = {}
 
-# Simple recent-send dedupe to avoid accidental duplicate messages
-_recent_sends: Dict[tuple, datetime] = {}
+# Recent-send dedupe to avoid accidental duplicate messages
 _DUPE_WINDOW_SECONDS = 2
+_recent_sends = TTLDedupeCache(ttl=_DUPE_WINDOW_SECONDS, maxsize=1024)
+
+def _is_duplicate_send(channel_id: int, content: str = "", embed: discord.Embed = None) -> bool:
+    """True if the same message went to the same channel within the dedupe window"""
+    try:
+        return _recent_sends.seen(message_key(channel_id, content, embed))
+    except Exception:
+        # Never block a send because its key couldn't be built
+        return False
 
 class PermissionLevel:
     """Permission levels for commands"""
@@ -149,20 +161,9 @@ async def send_to_game_channel(content: str = "", embed: discord.Embed = None) -
         channel = await get_channel_by_id(channel_id)
         if channel:
             # Dedupe identical messages sent very recently to avoid double-posts
-            # Make embed comparable deterministically
-            embed_key = None
-            if embed:
-                try:
-                    embed_key = tuple(sorted(embed.to_dict().items()))
-                except Exception:
-                    embed_key = str(embed)
-            key = (channel.id, (content or "")[:200], embed_key)
-            now = datetime.utcnow()
-            last = _recent_sends.get(key)
-            if last and (now - last).total_seconds() < _DUPE_WINDOW_SECONDS:
+            if _is_duplicate_send(channel.id, content, embed):
                 _logger.debug("Suppressed duplicate message to game channel")
                 return True
-            _recent_sends[key] = now
             await channel.send(content=content, embed=embed)
             return True
     except Exception as e:
@@ -172,7 +173,10 @@ async def send_to_game_channel(content: str = "", embed: discord.Embed = None) -
 
 
 async def relay_log_message(content: str = "") -> bool:
-    """Relay a log message to the configured logging channel (if set)."""
+    """Queue a log message for the configured logging channel (if set).
+
+    True means it was queued (or was a duplicate of one just queued), not that it was
+    sent: log relay is the lowest priority and is dropped first under load."""
     if not _config:
         return False
     # Support multiple possible config keys (logging_channel_id, debug_channel)
@@ -182,7 +186,10 @@ async def relay_log_message(content: str = "") -> bool:
     try:
         channel = await get_channel_by_id(channel_id)
         if channel:
-            await channel.send(content)
+            if _is_duplicate_send(channel.id, content):
+                return True
+            # Lowest priority: stale log lines are dropped before they can delay a game
+            get_scheduler().post(channel, content, priority=Priority.LOG_RELAY)
             return True
     except Exception as e:
         _logger.error(f"Error relaying log message: {e}")
@@ -216,6 +223,9 @@ async def send_to_werewolf_channel(content: str = "", embed: discord.Embed = Non
     try:
         channel = await get_channel_by_id(_config.werewolf_channel_id)
         if channel:
+            if _is_duplicate_send(channel.id, content, embed):
+                _logger.debug("Suppressed duplicate message to werewolf channel")
+                return True
             await channel.send(content=content, embed=embed)
             return True
     except Exception as e:
@@ -231,6 +241,9 @@ async def send_to_village_channel(content: str = "", embed: discord.Embed = None
     try:
         channel = await get_channel_by_id(_config.village_channel_id)
         if channel:
+            if _is_duplicate_send(channel.id, content, embed):
+                _logger.debug("Suppressed duplicate message to village channel")
+                return True
             await channel.send(content=content, embed=embed)
             return True
     except Exception as e:
@@ -452,38 +465,65 @@ def create_warning_embed(title: str, description: str = "") -> discord.Embed:
     return create_embed(title, description, color=0xFFFF00)
 
 class RateLimiter:
-    """Simple rate limiter for commands"""
+    """Per-command cooldowns keyed by (user_id, command), expired by a timing wheel"""
     
     def __init__(self):
-        self.cooldowns = {}
+        self.cooldowns: Dict[Tuple[int, str], float] = {}  # key -> monotonic time the cooldown ends
+        self._wheel = TimingWheel()
+    
+    def _expire(self, now: float):
+        for key in self._wheel.advance(now):
+            expires = self.cooldowns.get(key)
+            if expires is None:
+                continue
+            if expires <= now:
+                del self.cooldowns[key]
+            else:
+                self._wheel.schedule(key, expires)
     
     def is_on_cooldown(self, user_id: int, command: str, cooldown_seconds: int) -> bool:
         """Check if user is on cooldown for a command"""
-        key = f"{user_id}:{command}"
-        now = datetime.now()
+        now = time.monotonic()
+        self._expire(now)
+        key = (user_id, command)
         
-        if key in self.cooldowns:
-            if now - self.cooldowns[key] < timedelta(seconds=cooldown_seconds):
-                return True
+        expires = self.cooldowns.get(key)
+        if expires is not None and now < expires:
+            return True
         
-        self.cooldowns[key] = now
+        self.cooldowns[key] = now + cooldown_seconds
+        self._wheel.schedule(key, now + cooldown_seconds)
         return False
     
     def get_remaining_cooldown(self, user_id: int, command: str, cooldown_seconds: int) -> float:
         """Get remaining cooldown time in seconds"""
-        key = f"{user_id}:{command}"
-        now = datetime.now()
-        
-        if key in self.cooldowns:
-            elapsed = now - self.cooldowns[key]
-            remaining = cooldown_seconds - elapsed.total_seconds()
-            return max(0, remaining)
-        
-        return 0
+        expires = self.cooldowns.get((user_id, command))
+        if expires is None:
+            return 0
+        return max(0, expires - time.monotonic())
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
+# Anti-spam token buckets, built from TOKENS_GIVEN / TOKEN_RESET / IGNORE_THRESHOLD on first use
+_spam_limiter: Optional[TokenBucketLimiter] = None
+
+def get_spam_limiter() -> TokenBucketLimiter:
+    """Get the global anti-spam limiter"""
+    global _spam_limiter
+    if _spam_limiter is None:
+        from src.core import initialize_config
+        try:
+            config = _config or initialize_config()
+        except ValueError as e:
+            logging.getLogger(__name__).warning(f"Anti-spam using default limits: {e}")
+            config = None
+        if config is not None:
+            _spam_limiter = TokenBucketLimiter(config.tokens_given, config.token_reset, config.ignore_threshold)
+        else:
+            _spam_limiter = TokenBucketLimiter()
+    return _spam_limiter
+
 def get_rate_limiter() -> RateLimiter:
     """Get the global rate limiter"""
     return rate_limiter
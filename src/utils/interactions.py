@@ -0,0 +1,59 @@
+"""
+Interaction helpers for Discord Werewolf Bot.
+Lets the prefix command implementations answer slash commands and component clicks:
+InteractionContext quacks like commands.Context but replies ephemerally, so a night
+action can be used in the game channel without anyone else seeing it.
+"""
+
+from typing import Iterable, List
+
+import discord
+from discord import app_commands
+
+
+class InteractionContext:
+    """commands.Context stand-in whose send() answers an interaction ephemerally"""
+
+    ephemeral = True
+
+    def __init__(self, interaction: discord.Interaction, bot):
+        self.interaction = interaction
+        self.author = interaction.user
+        self.channel = interaction.channel
+        self.guild = interaction.guild
+        self.bot = bot
+        self.command = None
+        self.replied = False
+
+    async def defer(self):
+        """Acknowledge now, within Discord's 3 second limit; replies then go out as followups"""
+        if not self.interaction.response.is_done():
+            await self.interaction.response.defer(ephemeral=True, thinking=True)
+
+    async def send(self, content=None, **kwargs):
+        kwargs.setdefault('ephemeral', True)
+        self.replied = True
+        if self.interaction.response.is_done():
+            return await self.interaction.followup.send(content, **kwargs)
+        await self.interaction.response.send_message(content, **kwargs)
+
+    @property
+    def answered(self) -> bool:
+        return self.replied
+
+
+def is_private(ctx) -> bool:
+    """True when only the author will see the replies: a DM or an ephemeral interaction"""
+    return isinstance(ctx.channel, discord.DMChannel) or getattr(ctx, 'ephemeral', False)
+
+
+def player_choices(players: Iterable, current: str, limit: int = 25) -> List[app_commands.Choice[str]]:
+    """Autocomplete choices for (player_id, display_name) pairs; the value is the player id"""
+    current = current.lower()
+    choices = []
+    for player_id, name in players:
+        if current in name.lower():
+            choices.append(app_commands.Choice(name=name[:100], value=str(player_id)))
+            if len(choices) == limit:
+                break
+    return choices
@@ -0,0 +1,91 @@
+"""
+Log file helpers for Discord Werewolf Bot.
+A rotating file handler that rolls over on size or age and gzips the archives, and a
+reverse block reader that returns the last N (optionally filtered) lines of a log
+without reading the whole file.
+"""
+
+import asyncio
+import gzip
+import logging.handlers
+import os
+import re
+import shutil
+import time
+from collections import deque
+from typing import List, Optional
+
+
+class CompressingRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that also rotates by age and gzips rotated files"""
+
+    def __init__(self, filename: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 5,
+                 rotate_seconds: float = 0, encoding: str = 'utf-8'):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.rotate_seconds = rotate_seconds
+        self.rollover_at = self._next_rollover()
+        self.namer = lambda name: name + '.gz'
+        self.rotator = self._gzip_rotator
+
+    def _next_rollover(self) -> float:
+        return time.time() + self.rotate_seconds if self.rotate_seconds > 0 else float('inf')
+
+    @staticmethod
+    def _gzip_rotator(source: str, dest: str):
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+
+    def shouldRollover(self, record) -> int:
+        if time.time() >= self.rollover_at:
+            return 1
+        return super().shouldRollover(record)
+
+    def doRollover(self):
+        super().doRollover()
+        self.rollover_at = self._next_rollover()
+
+
+def tail_lines(path: str, count: int = 20, pattern: Optional[str] = None,
+               block_size: int = 64 * 1024) -> List[str]:
+    """Last count lines of path (matching pattern, if given), read backwards block by block"""
+    if count <= 0:
+        return []
+    regex = re.compile(pattern, re.IGNORECASE) if pattern else None
+    found = deque(maxlen=count)  # newest first
+
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = size = f.tell()
+        carry = b''
+        first_block = True
+        while position > 0 and len(found) < count:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + carry
+            lines = block.split(b'\n')
+            # The first piece may be the tail of a line that starts in an earlier block
+            carry = lines.pop(0)
+            if first_block and lines and lines[-1] == b'':
+                lines.pop()
+            first_block = False
+            for raw in reversed(lines):
+                line = raw.decode('utf-8', errors='replace').rstrip('\r')
+                if regex is None or regex.search(line):
+                    found.append(line)
+                    if len(found) == count:
+                        break
+        # Whatever is left is the file's first line, even if that line is empty
+        if position == 0 and size and len(found) < count:
+            line = carry.decode('utf-8', errors='replace').rstrip('\r')
+            if regex is None or regex.search(line):
+                found.append(line)
+
+    return list(reversed(found))
+
+
+async def tail_lines_async(path: str, count: int = 20, pattern: Optional[str] = None) -> List[str]:
+    """tail_lines in the default executor, off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, tail_lines, path, count, pattern)
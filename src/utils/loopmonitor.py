@@ -0,0 +1,135 @@
+"""
+Event loop health monitor for Discord Werewolf Bot.
+Measures how late the loop runs a sleeping task (scheduling lag), counts live tasks by
+coroutine, flags the bot's own tasks that have been running far longer than expected,
+and runs pluggable leak checks such as "phase timer still running after reset()".
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from collections import Counter, deque
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def task_name(task: asyncio.Task) -> str:
+    """Qualified name of the coroutine a task is running"""
+    coro = task.get_coro()
+    return getattr(coro, '__qualname__', None) or getattr(coro, '__name__', None) or type(coro).__name__
+
+
+def _is_project_task(task: asyncio.Task) -> bool:
+    code = getattr(task.get_coro(), 'cr_code', None)
+    return code is not None and code.co_filename.startswith(PROJECT_ROOT)
+
+
+class LoopMonitor:
+    """Background task sampling loop lag and auditing running tasks"""
+
+    def __init__(self, interval: float = 0.5, scan_every: float = 30.0, long_task_seconds: float = 600.0,
+                 long_lived: Iterable[str] = (), lag_warning: float = 0.25):
+        self.interval = interval
+        self.scan_every = scan_every
+        self.long_task_seconds = long_task_seconds
+        # Coroutines that are supposed to run for the bot's whole life
+        self.long_lived: Set[str] = {'LoopMonitor._run', 'GameMailbox._consume', 'OutboundScheduler._run',
+                                     'periodic_cleanup'} | set(long_lived)
+        self.lag_warning = lag_warning
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self._lag_window: Deque[float] = deque(maxlen=120)
+        self.task_counts: Counter = Counter()
+        self.long_running: Dict[str, float] = {}
+        self.leaks: Dict[str, int] = {}
+        self._first_seen: "weakref.WeakKeyDictionary[asyncio.Task, float]" = weakref.WeakKeyDictionary()
+        self._warned: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+        self._suspects: Dict[str, "weakref.WeakSet[asyncio.Task]"] = {}
+        self._checks: Dict[str, Callable[[], List[asyncio.Task]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_check(self, name: str, check: Callable[[], List[asyncio.Task]]):
+        """Register a leak check returning tasks that shouldn't be running anymore"""
+        self._checks[name] = check
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_scan = loop.time()
+        while True:
+            before = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - before - self.interval)
+            self.lag_last = lag
+            self.lag_max = max(self.lag_max, lag)
+            self._lag_window.append(lag)
+            if lag > self.lag_warning:
+                logger.warning(f"Event loop lag {lag * 1000:.0f}ms")
+            if loop.time() >= next_scan:
+                next_scan = loop.time() + self.scan_every
+                try:
+                    self.scan()
+                except Exception as e:
+                    logger.error(f"Task scan failed: {e}")
+
+    def scan(self):
+        """Count tasks, flag long runners and run leak checks"""
+        now = time.monotonic()
+        tasks = [t for t in asyncio.all_tasks() if not t.done()]
+        self.task_counts = Counter(task_name(t) for t in tasks)
+
+        long_running = {}
+        for task in tasks:
+            first_seen = self._first_seen.setdefault(task, now)
+            age = now - first_seen
+            name = task_name(task)
+            if age < self.long_task_seconds or name in self.long_lived or not _is_project_task(task):
+                continue
+            long_running[name] = max(long_running.get(name, 0.0), age)
+            if task not in self._warned:
+                self._warned.add(task)
+                logger.warning(f"Task {name} has been running for {age:.0f}s")
+        self.long_running = long_running
+
+        for check_name, check in self._checks.items():
+            flagged = [t for t in check() if not t.done()]
+            # Only report tasks flagged on two scans in a row, so a timer that is
+            # mid-cancellation isn't reported
+            previous = self._suspects.get(check_name, weakref.WeakSet())
+            confirmed = [t for t in flagged if t in previous]
+            self._suspects[check_name] = weakref.WeakSet(flagged)
+            self.leaks[check_name] = len(confirmed)
+            for task in confirmed:
+                if task not in self._warned:
+                    self._warned.add(task)
+                    logger.warning(f"Leak check '{check_name}': {task_name(task)} is still running")
+
+    def lag_p99(self) -> float:
+        if not self._lag_window:
+            return 0.0
+        ordered = sorted(self._lag_window)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+    def stats(self) -> Dict:
+        return {
+            'lag_ms': round(self.lag_last * 1000, 1),
+            'lag_p99_ms': round(self.lag_p99() * 1000, 1),
+            'lag_max_ms': round(self.lag_max * 1000, 1),
+            'tasks': sum(self.task_counts.values()),
+            'tasks_by_coroutine': dict(self.task_counts.most_common()),
+            'long_running': dict(self.long_running),
+            'leaks': dict(self.leaks),
+        }
@@ -0,0 +1,93 @@
+"""
+Member cache policy for the Werewolf bot.
+Guild member caching and startup chunking are turned off; instead the bot keeps
+strong references to the users it actually needs (game participants and admins)
+and fetches anyone else lazily from the API on a cache miss.
+"""
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class GameMemberCache:
+    """Pinned users for active games, with lazy fetch on miss"""
+
+    def __init__(self):
+        self._users: Dict[int, object] = {}
+        self._admins: Set[int] = set()
+        self._pending: Dict[int, asyncio.Task] = {}
+        self._unknown: Set[int] = set()  # ids the API couldn't resolve
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def pin(self, user, admin: bool = False):
+        """Keep a user cached until they are released"""
+        if user is None:
+            return
+        self._users[user.id] = user
+        if admin:
+            self._admins.add(user.id)
+
+    def release(self, user_id: int):
+        """Drop a non-admin user from the cache"""
+        if user_id not in self._admins:
+            self._users.pop(user_id, None)
+
+    def release_players(self, keep: Iterable[int] = ()):
+        """Drop every pinned player except admins and the ids in keep"""
+        keep = set(keep) | self._admins
+        for user_id in [uid for uid in self._users if uid not in keep]:
+            del self._users[user_id]
+        self._unknown.clear()
+
+    def get(self, user_id: int):
+        """Return a pinned user or None"""
+        user = self._users.get(user_id)
+        if user is not None:
+            self.hits += 1
+        return user
+
+    def schedule_fetch(self, bot, user_id: int):
+        """Fetch a missing user in the background so later lookups hit"""
+        if user_id in self._pending or user_id in self._users or user_id in self._unknown:
+            return
+        self.misses += 1
+        try:
+            task = asyncio.get_running_loop().create_task(self.fetch(bot, user_id))
+        except RuntimeError:
+            return
+        self._pending[user_id] = task
+        task.add_done_callback(lambda _t: self._pending.pop(user_id, None))
+
+    async def fetch(self, bot, user_id: int) -> Optional[object]:
+        """Return a user from the cache, fetching and pinning on miss"""
+        user = self._users.get(user_id)
+        if user is not None:
+            return user
+        try:
+            user = await bot.fetch_user(user_id)
+        except Exception as e:
+            logger.warning(f"Failed to fetch user {user_id}: {e}")
+            self._unknown.add(user_id)
+            return None
+        self.pin(user)
+        return user
+
+    async def ensure(self, bot, user_ids: Iterable[int]):
+        """Make sure every id is cached, fetching misses concurrently"""
+        missing = [uid for uid in user_ids if uid not in self._users and uid not in self._unknown]
+        if missing:
+            await asyncio.gather(*(self.fetch(bot, uid) for uid in missing))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'cached': len(self._users),
+            'admins': len(self._admins),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
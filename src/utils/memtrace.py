@@ -0,0 +1,103 @@
+"""
+Memory leak hunting for Discord Werewolf Bot.
+Wraps tracemalloc: each snapshot is diffed against the previous one and the allocation
+sites that grew the most are reported by file and line. Live instances of the game
+classes are counted through the garbage collector, so a reset() that leaves objects
+behind shows up as a count that keeps climbing between games.
+"""
+
+import gc
+import os
+import tracemalloc
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+# Allocations made by the tracing machinery itself aren't interesting
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+TRACKED_TYPES = ('GameState', 'GameSession', 'Player')
+
+
+def format_size(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def count_instances(type_names: Iterable[str] = TRACKED_TYPES) -> Dict[str, int]:
+    """Live objects per class name, found by walking the garbage collector's objects"""
+    wanted = set(type_names)
+    counts = Counter({name: 0 for name in wanted})
+    for obj in gc.get_objects():
+        name = type(obj).__name__
+        if name in wanted:
+            counts[name] += 1
+    return dict(counts)
+
+
+class MemoryTracer:
+    """tracemalloc snapshots, each diffed against the one before it"""
+
+    def __init__(self, frames: int = 1):
+        self.frames = frames
+        self.previous: Optional[tracemalloc.Snapshot] = None
+        self.snapshots_taken = 0
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: Optional[int] = None):
+        """Start tracing and take the baseline snapshot"""
+        if frames is not None:
+            self.frames = frames
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        tracemalloc.start(self.frames)
+        self.previous = self.snapshot()
+
+    def stop(self):
+        tracemalloc.stop()
+        self.previous = None
+
+    def snapshot(self) -> tracemalloc.Snapshot:
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        self.snapshots_taken += 1
+        return snapshot
+
+    def diff(self, limit: int = 15) -> List[str]:
+        """Top growth by file:line (by call stack when tracing several frames) since the last call"""
+        current = self.snapshot()
+        previous, self.previous = self.previous, current
+        key = 'traceback' if self.frames > 1 else 'lineno'
+        if previous is None:
+            stats = current.statistics(key)
+            lines = [f"{format_size(stat.size):>10} {stat.count:>7} blocks  {self._site(stat.traceback)}"
+                     for stat in stats[:limit]]
+            return ["Baseline (no previous snapshot), largest allocation sites:"] + lines
+
+        stats = current.compare_to(previous, key)
+        stats.sort(key=lambda stat: stat.size_diff, reverse=True)
+        lines = [f"{'+' if stat.size_diff >= 0 else '-'}{format_size(abs(stat.size_diff)):>10} "
+                 f"({stat.count_diff:+} blocks, now {format_size(stat.size)})  {self._site(stat.traceback)}"
+                 for stat in stats[:limit] if stat.size_diff]
+        total = sum(stat.size_diff for stat in stats)
+        return [f"Growth since previous snapshot: {'+' if total >= 0 else '-'}{format_size(abs(total))}"] + lines
+
+    @staticmethod
+    def _site(traceback: tracemalloc.Traceback) -> str:
+        """Allocating line first, then its callers: a.py:3 <- b.py:10"""
+        return " <- ".join(
+            f"{os.path.relpath(frame.filename) if os.path.isabs(frame.filename) else frame.filename}:{frame.lineno}"
+            for frame in reversed(traceback))
+
+    def traced_memory(self) -> Dict[str, int]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {'current': current, 'peak': peak}
@@ -0,0 +1,92 @@
+"""
+Metrics endpoint for Discord Werewolf Bot.
+Serves the bot's internal stats over HTTP: GET /metrics in Prometheus text format and
+GET /metrics.json as plain JSON. collect() returns {section: {name: value}}, where a
+value is a number, a {label: number} dict, or a {label: {name: number}} dict.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+Collector = Callable[[], Dict[str, Dict[str, Any]]]
+
+
+def _metric_name(*parts: str) -> str:
+    return re.sub(r'[^a-zA-Z0-9_]', '_', '_'.join(('werewolf',) + parts))
+
+
+def _label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def render_prometheus(metrics: Dict[str, Dict[str, Any]]) -> str:
+    """Flatten collected stats into Prometheus exposition lines"""
+    lines: List[str] = []
+    for section, values in metrics.items():
+        for name, value in values.items():
+            if _is_number(value):
+                lines.append(f"{_metric_name(section, name)} {value}")
+            elif isinstance(value, dict):
+                for label, inner in value.items():
+                    if _is_number(inner):
+                        lines.append(f'{_metric_name(section, name)}{{name="{_label(label)}"}} {inner}')
+                    elif isinstance(inner, dict):
+                        for field, number in inner.items():
+                            if _is_number(number):
+                                lines.append(f'{_metric_name(section, field)}{{{name}="{_label(label)}"}} {number}')
+    return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """Small aiohttp server exposing collect() on /metrics and /metrics.json"""
+
+    def __init__(self, collect: Collector, host: str = '127.0.0.1', port: int = 9100):
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self._runner: Optional["web.AppRunner"] = None
+
+    async def _prometheus(self, request):
+        return web.Response(text=render_prometheus(self.collect()), content_type='text/plain')
+
+    async def _json(self, request):
+        return web.Response(text=json.dumps(self.collect(), default=str), content_type='application/json')
+
+    async def start(self) -> bool:
+        if self._runner is not None:
+            return True
+        if web is None:
+            logger.warning("aiohttp is not installed, metrics endpoint disabled")
+            return False
+        app = web.Application()
+        app.router.add_get('/metrics', self._prometheus)
+        app.router.add_get('/metrics.json', self._json)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self.host, self.port).start()
+        except OSError as e:
+            logger.error(f"Could not start metrics endpoint on {self.host}:{self.port}: {e}")
+            await runner.cleanup()
+            return False
+        self._runner = runner
+        logger.info(f"Metrics endpoint listening on http://{self.host}:{self.port}/metrics")
+        return True
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,246 @@
+"""
+Outbound message scheduler for Discord Werewolf Bot.
+Messages are queued by priority class (phase announcements and results, then night
+prompts, then countdowns, then log relay) and sent by one dispatcher, so a burst of
+countdowns or log lines can never hold up a phase transition. Each channel has a token
+bucket matching Discord's per-channel send limit, so the bot waits its turn itself
+instead of queueing up behind 429s. A channel has at most one send in flight, so
+within a class its messages arrive in the order they were queued. Low priority
+messages that have gone stale by the time a channel frees up are dropped, not sent late.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    PHASE = 0       # phase transitions, deaths, results
+    PROMPT = 1      # night action prompts
+    COUNTDOWN = 2   # timer alerts
+    LOG_RELAY = 3   # log lines mirrored to the logging channel
+
+
+# Seconds a message may wait before it is not worth sending (None: never dropped)
+MAX_AGE = {Priority.PHASE: None, Priority.PROMPT: None, Priority.COUNTDOWN: 10.0, Priority.LOG_RELAY: 120.0}
+# Queue length above which the oldest messages of a class are dropped (None: unbounded)
+MAX_QUEUED = {Priority.PHASE: None, Priority.PROMPT: None, Priority.COUNTDOWN: 50, Priority.LOG_RELAY: 500}
+
+# Discord allows 5 messages per 5 seconds in a channel
+CHANNEL_MESSAGES = 5
+CHANNEL_PERIOD = 5.0
+
+
+def destination_key(destination) -> int:
+    """Rate-limit key for anything with send(): the channel of a context, else the channel or user"""
+    channel = getattr(destination, 'channel', None)
+    if channel is not None and hasattr(destination, 'author'):
+        destination = channel
+    return getattr(destination, 'id', None) or id(destination)
+
+
+class _Outgoing:
+    __slots__ = ('destination', 'key', 'args', 'kwargs', 'priority', 'queued_at', 'future', 'context')
+
+    def __init__(self, destination, args, kwargs, priority: Priority, queued_at: float, future: asyncio.Future):
+        self.destination = destination
+        self.key = destination_key(destination)
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.queued_at = queued_at
+        self.future = future
+        # The caller's context, so the send is traced under the span that queued it
+        self.context = contextvars.copy_context()
+
+
+class _ClassStats:
+    __slots__ = ('sent', 'dropped', 'failed', 'delay_total', 'delay_max')
+
+    def __init__(self):
+        self.sent = self.dropped = self.failed = 0
+        self.delay_total = self.delay_max = 0.0
+
+
+class OutboundScheduler:
+    """Priority queue of outgoing messages with per-channel token buckets"""
+
+    def __init__(self, concurrency: int = 8, channel_messages: int = CHANNEL_MESSAGES,
+                 channel_period: float = CHANNEL_PERIOD, clock=time.monotonic):
+        if concurrency <= 0 or channel_messages <= 0 or channel_period <= 0:
+            raise ValueError("concurrency, channel_messages and channel_period must be positive")
+        self.concurrency = concurrency
+        self.capacity = channel_messages
+        self.refill_rate = channel_messages / channel_period
+        self._clock = clock
+        self._queues: Dict[Priority, Deque[_Outgoing]] = {priority: deque() for priority in Priority}
+        self._buckets: Dict[int, list] = {}  # key -> [tokens, stamp]
+        self._in_flight: Set[int] = set()
+        self._sending: Set[asyncio.Task] = set()
+        self._stats: Dict[Priority, _ClassStats] = {priority: _ClassStats() for priority in Priority}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._slots = asyncio.Semaphore(self.concurrency)
+            self._task = asyncio.create_task(self._run(), name='outbound_scheduler')
+
+    def post(self, destination, *args, priority: Priority = Priority.PHASE, **kwargs) -> asyncio.Future:
+        """Queue destination.send(*args, **kwargs); the future gets the Message, or None if dropped"""
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_log_failure)
+        queue = self._queues[priority]
+        queue.append(_Outgoing(destination, args, kwargs, priority, self._clock(), future))
+        limit = MAX_QUEUED[priority]
+        if limit is not None and len(queue) > limit:
+            self._drop(queue.popleft())
+        self._wakeup.set()
+        return future
+
+    async def send(self, destination, *args, priority: Priority = Priority.PHASE, **kwargs):
+        """Queue a message and wait until it has been sent; raises whatever send() raised"""
+        return await self.post(destination, *args, priority=priority, **kwargs)
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for queue in self._queues.values():
+            while queue:
+                self._drop(queue.popleft())
+
+    # ---- dispatch ----
+
+    def _tokens(self, key: int, now: float) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return self.capacity
+        bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_rate)
+        bucket[1] = now
+        return bucket[0]
+
+    def _take_token(self, key: int, now: float):
+        tokens = self._tokens(key, now)
+        self._buckets[key] = [tokens - 1, now]
+
+    def _drop(self, item: _Outgoing):
+        self._stats[item.priority].dropped += 1
+        if not item.future.done():
+            item.future.set_result(None)
+
+    def _next_ready(self, now: float):
+        """Highest priority message whose channel has a token, and the wait until one might"""
+        wait = None
+        blocked = set()
+        for priority in Priority:
+            queue = self._queues[priority]
+            max_age = MAX_AGE[priority]
+            for item in list(queue):
+                if item.future.done():  # cancelled by the caller
+                    queue.remove(item)
+                    continue
+                if max_age is not None and now - item.queued_at > max_age:
+                    queue.remove(item)
+                    self._drop(item)
+                    continue
+                if item.key in blocked:
+                    continue
+                if item.key in self._in_flight:
+                    # Woken again when that send finishes
+                    blocked.add(item.key)
+                    continue
+                tokens = self._tokens(item.key, now)
+                if tokens >= 1:
+                    queue.remove(item)
+                    return item, None
+                blocked.add(item.key)
+                until = (1 - tokens) / self.refill_rate
+                wait = until if wait is None else min(wait, until)
+        # Forget buckets that have refilled and have nothing waiting on them
+        for key in [key for key, bucket in self._buckets.items()
+                    if key not in blocked and key not in self._in_flight
+                    and self._tokens(key, now) >= self.capacity]:
+            del self._buckets[key]
+        return None, wait
+
+    async def _run(self):
+        while True:
+            await self._slots.acquire()
+            item, wait = self._next_ready(self._clock())
+            if item is None:
+                self._slots.release()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self._take_token(item.key, self._clock())
+            self._in_flight.add(item.key)
+            task = item.context.run(asyncio.create_task, self._deliver(item), name='outbound_send')
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _deliver(self, item: _Outgoing):
+        stats = self._stats[item.priority]
+        delay = self._clock() - item.queued_at
+        try:
+            message = await item.destination.send(*item.args, **item.kwargs)
+        except Exception as e:
+            stats.failed += 1
+            if not item.future.done():
+                item.future.set_exception(e)
+        else:
+            stats.sent += 1
+            stats.delay_total += delay
+            stats.delay_max = max(stats.delay_max, delay)
+            if not item.future.done():
+                item.future.set_result(message)
+        finally:
+            self._in_flight.discard(item.key)
+            self._slots.release()
+            self._wakeup.set()
+
+    def stats(self) -> Dict:
+        classes = {}
+        for priority, stats in self._stats.items():
+            classes[priority.name.lower()] = {
+                'queued': len(self._queues[priority]),
+                'sent': stats.sent,
+                'dropped': stats.dropped,
+                'failed': stats.failed,
+                'delay_avg_ms': round(stats.delay_total / stats.sent * 1000, 1) if stats.sent else 0.0,
+                'delay_max_ms': round(stats.delay_max * 1000, 1),
+            }
+        return {'queued': len(self), 'channels': len(self._buckets), 'class': classes}
+
+
+def _log_failure(future: asyncio.Future):
+    # Fire-and-forget posts would otherwise leave "exception never retrieved" warnings
+    if not future.cancelled() and future.exception() is not None:
+        logger.debug(f"Queued message failed: {future.exception()}")
+
+
+_scheduler: Optional[OutboundScheduler] = None
+
+
+def get_scheduler() -> OutboundScheduler:
+    """Process-wide scheduler, OUTBOUND_CONCURRENCY sends in flight at once"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = OutboundScheduler(concurrency=int(os.getenv('OUTBOUND_CONCURRENCY', 8)))
+    return _scheduler
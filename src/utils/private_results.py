@@ -0,0 +1,67 @@
+"""
+Batched private results for Discord Werewolf Bot.
+Night resolution adds each player's private results (seer visions, detective reports,
+...) here instead of DMing them inline. Once the dawn announcement is out, everything
+is sent at once: one DM per player, several players in flight at the same time, each
+with its own timeout, and the outcome recorded per player.
+"""
+
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+import discord
+
+SENT = 'sent'
+
+
+class PrivateResults:
+    """Per-player private messages collected during resolution"""
+
+    def __init__(self):
+        self._content: Dict[int, List[str]] = {}
+        self._embeds: Dict[int, List[discord.Embed]] = {}
+        self.status: Dict[int, str] = {}
+
+    def add(self, player_id: int, content: Optional[str] = None, embed: Optional[discord.Embed] = None):
+        if content:
+            self._content.setdefault(player_id, []).append(content)
+        if embed is not None:
+            self._embeds.setdefault(player_id, []).append(embed)
+
+    def recipients(self) -> List[int]:
+        return list(dict.fromkeys(list(self._content) + list(self._embeds)))
+
+    def __len__(self) -> int:
+        return len(self.recipients())
+
+    async def _deliver(self, player_id: int, get_user: Callable, send: Callable, limit: asyncio.Semaphore,
+                       timeout: float):
+        user = get_user(player_id)
+        if user is None:
+            self.status[player_id] = 'unknown user'
+            return
+        kwargs = {}
+        if player_id in self._embeds:
+            kwargs['embeds'] = self._embeds[player_id][:10]
+        content = "\n".join(self._content.get(player_id, [])) or None
+        async with limit:
+            try:
+                await asyncio.wait_for(send(user, content, **kwargs), timeout)
+                self.status[player_id] = SENT
+            except discord.Forbidden:
+                self.status[player_id] = 'dms closed'
+            except asyncio.TimeoutError:
+                self.status[player_id] = 'timed out'
+            except discord.HTTPException as e:
+                self.status[player_id] = f'failed ({e.status})'
+
+    async def dispatch(self, get_user: Callable, concurrency: int = 10, timeout: float = 15.0,
+                       send: Optional[Callable] = None) -> Dict[int, str]:
+        """Send every player their messages concurrently; returns player_id -> delivery status
+
+        send(user, content, **kwargs) replaces user.send, e.g. to go through a scheduler.
+        """
+        send = send or (lambda user, *args, **kwargs: user.send(*args, **kwargs))
+        limit = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(self._deliver(pid, get_user, send, limit, timeout) for pid in self.recipients()))
+        return self.status
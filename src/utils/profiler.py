@@ -0,0 +1,113 @@
+"""
+On-demand sampling profiler for Discord Werewolf Bot.
+A background thread samples the event loop thread's Python stack at a fixed interval
+and counts identical stacks. Nothing is hooked or patched, so there is no cost at all
+while no profile is running. Output is collapsed stacks (one "a;b;c count" line per
+stack, the input format of flamegraph.pl / speedscope) plus a top-N function table.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class ProfilerBusy(Exception):
+    """Raised when a profile is already running"""
+
+
+class SamplingProfiler:
+    """Samples one thread's stack every interval seconds"""
+
+    _running_lock = threading.Lock()
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None, max_depth: int = 128):
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.started_at = 0.0
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if not SamplingProfiler._running_lock.acquire(blocking=False):
+            raise ProfilerBusy("a profile is already running")
+        self._stop.clear()
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='werewolf-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.duration = time.perf_counter() - self.started_at
+        SamplingProfiler._running_lock.release()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+            self.samples += 1
+            del frame
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, one "root;...;leaf count" line per distinct stack"""
+        lines = [f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common()]
+        return '\n'.join(lines) + '\n'
+
+    def top(self, n: int = 25) -> str:
+        """Table of the hottest functions by self and total samples"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            if not stack:
+                continue
+            self_counts[stack[-1]] += count
+            for label in set(stack):
+                total_counts[label] += count
+
+        samples = max(self.samples, 1)
+        rows = [f"{self.samples} samples over {self.duration:.1f}s every {self.interval * 1000:.1f}ms",
+                "",
+                f"{'self%':>7} {'total%':>7}  function"]
+        for label, count in self_counts.most_common(n):
+            rows.append(f"{100 * count / samples:6.1f}% {100 * total_counts[label] / samples:6.1f}%  {label}")
+        rows.append("")
+        rows.append(f"{'total%':>7}  function (by inclusive time)")
+        for label, count in total_counts.most_common(n):
+            rows.append(f"{100 * count / samples:6.1f}%  {label}")
+        return '\n'.join(rows) + '\n'
+
+
+async def profile_event_loop(seconds: float, interval: float = 0.005) -> SamplingProfiler:
+    """Sample the running event loop's thread for seconds, then return the profiler"""
+    profiler = SamplingProfiler(interval=interval, thread_id=threading.get_ident())
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.stop()
+    return profiler
@@ -0,0 +1,169 @@
+"""
+Startup diagnostics for Discord Werewolf Bot.
+The import report runs `python -X importtime` on a module and ranks everything it
+imports by self and cumulative time. The benchmark starts the bot with STARTUP_REPORT
+set; the bot writes its timings there on its first on_ready and logs off. The median
+time to on_ready is compared with data/startup_baseline.json and the run fails if it
+regressed, or if there is no baseline to compare with.
+
+    python -m src.utils.startup imports [--module bot] [--top 25] [--sort self]
+    python -m src.utils.startup bench [--import-only] [--runs 3] [--tolerance 0.25] [--update]
+
+--import-only times `import bot` instead, which needs no token or network.
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[2]
+BASELINE_FILE = ROOT / 'data' / 'startup_baseline.json'
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int  # nesting level; 0 for modules imported directly by the target
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """ImportTiming per line of -X importtime output, in the order Python printed them"""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(ImportTiming(stripped, int(fields[0]), int(fields[1]), (len(name) - len(stripped) - 1) // 2))
+    return timings
+
+
+def measure_imports(module: str = 'bot', python: str = sys.executable) -> List[ImportTiming]:
+    """Import module in a fresh interpreter with -X importtime; raises RuntimeError if the import fails"""
+    result = subprocess.run([python, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        raise RuntimeError(f"import {module} failed: {error[-1] if error else result.returncode}")
+    return parse_importtime(result.stderr)
+
+
+def format_report(timings: List[ImportTiming], top: int = 25, sort: str = 'cumulative') -> str:
+    if sort not in ('self', 'cumulative'):
+        raise ValueError("sort must be 'self' or 'cumulative'")
+    total = sum(timing.cumulative_us for timing in timings if timing.depth == 0)
+    key = (lambda t: t.self_us) if sort == 'self' else (lambda t: t.cumulative_us)
+    lines = [f"{len(timings)} modules, {total / 1000:.1f}ms total",
+             f"{'self ms':>9} {'cumul ms':>9} {'share':>6}  module"]
+    for timing in sorted(timings, key=key, reverse=True)[:top]:
+        share = timing.cumulative_us / total if total else 0.0
+        lines.append(f"{timing.self_us / 1000:9.1f} {timing.cumulative_us / 1000:9.1f} {share:6.1%}  {timing.module}")
+    return "\n".join(lines)
+
+
+# ---- benchmark ----
+
+def _time_import(python: str) -> Dict[str, float]:
+    code = "import json, bot; print(json.dumps(bot.startup_timings))"
+    result = subprocess.run([python, '-c', code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import bot failed: {result.stderr.strip().splitlines()[-1:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _time_ready(python: str, timeout: float) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        report = Path(directory) / 'startup.json'
+        # A benchmark run must not register slash commands or touch a saved game
+        env = dict(os.environ, STARTUP_REPORT=str(report), SYNC_SLASH_COMMANDS='false')
+        try:
+            subprocess.run([python, 'bot.py'], cwd=ROOT, env=env, timeout=timeout,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"bot was not ready within {timeout:.0f}s")
+        if not report.exists():
+            raise RuntimeError("bot exited without reaching on_ready (is DISCORD_TOKEN set?)")
+        return json.loads(report.read_text())
+
+
+def run_benchmark(runs: int = 3, import_only: bool = False, timeout: float = 120.0,
+                  python: str = sys.executable) -> Dict[str, float]:
+    """Median of each startup timing over runs fresh processes"""
+    if runs <= 0:
+        raise ValueError("runs must be positive")
+    samples = [_time_import(python) if import_only else _time_ready(python, timeout) for _ in range(runs)]
+    return {key: round(statistics.median(sample[key] for sample in samples), 3) for key in samples[0]}
+
+
+def compare(result: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Regressions of result against baseline, as messages; empty if within tolerance"""
+    regressions = []
+    for key, value in result.items():
+        allowed = baseline.get(key)
+        if allowed is not None and value > allowed * (1 + tolerance):
+            regressions.append(f"{key}: {value:.3f}s, baseline {allowed:.3f}s (+{value / allowed - 1:.0%})")
+    return regressions
+
+
+def _load_baseline(path: Path) -> Optional[Dict[str, float]]:
+    try:
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.utils.startup', description="Startup time diagnostics")
+    subcommands = parser.add_subparsers(dest='action', required=True)
+    imports = subcommands.add_parser('imports', help="Per-module import time report")
+    imports.add_argument('--module', default='bot')
+    imports.add_argument('--top', type=int, default=25)
+    imports.add_argument('--sort', choices=('cumulative', 'self'), default='cumulative')
+    bench = subcommands.add_parser('bench', help="Time to on_ready against the saved baseline")
+    bench.add_argument('--import-only', action='store_true', help="Time `import bot` instead (no token needed)")
+    bench.add_argument('--runs', type=int, default=3)
+    bench.add_argument('--tolerance', type=float, default=0.25, help="Allowed slowdown, as a fraction")
+    bench.add_argument('--timeout', type=float, default=120.0)
+    bench.add_argument('--baseline', type=Path, default=BASELINE_FILE)
+    bench.add_argument('--update', action='store_true', help="Save this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.action == 'imports':
+            print(format_report(measure_imports(args.module), args.top, args.sort))
+            return 0
+        result = run_benchmark(args.runs, args.import_only, args.timeout)
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(result))
+    baseline = _load_baseline(args.baseline) or {}
+    if args.update:
+        args.baseline.write_text(json.dumps({**baseline, **result}, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"error: no baseline at {args.baseline}; run with --update to save one", file=sys.stderr)
+        return 2
+    regressions = compare(result, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
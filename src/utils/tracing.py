@@ -0,0 +1,209 @@
+"""
+Per-game span tracing for Discord Werewolf Bot.
+
+A sampled game gets a trace; code wrapped in tracer.span() (or @tracer.traced) records
+a span with its wall time, the Discord REST calls awaited while it was open (count and
+time, via instrument_http) and the players it affected. Spans nest through a context
+variable. Finished spans are buffered and appended to <TRACE_DIR>/<game_id>.jsonl each
+time a top-level span closes, one JSON object per line.
+"""
+
+import contextvars
+import functools
+import json
+import logging
+import os
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    """Stand-in returned when the game isn't being traced"""
+
+    def add_players(self, player_ids: Iterable[int]):
+        pass
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar('werewolf_span', default=None)
+
+
+class GameTrace:
+    """Buffered span records for one game"""
+
+    def __init__(self, game_id: str, path: str):
+        self.game_id = game_id
+        self.path = path
+        self.next_span_id = 0
+        self.pending: List[Dict[str, Any]] = []
+        self.spans_written = 0
+
+    def new_span_id(self) -> int:
+        self.next_span_id += 1
+        return self.next_span_id
+
+    def record(self, entry: Dict[str, Any]):
+        self.pending.append(entry)
+
+    def flush(self):
+        if not self.pending:
+            return
+        lines = ''.join(json.dumps(entry, default=str, separators=(',', ':')) + '\n' for entry in self.pending)
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(lines)
+            self.spans_written += len(self.pending)
+        except OSError as e:
+            logger.error(f"Failed to write trace {self.path}: {e}")
+        self.pending.clear()
+
+
+class Span:
+    """One timed stage of a traced game"""
+
+    def __init__(self, trace: GameTrace, name: str, attrs: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+        self.span_id = trace.new_span_id()
+        parent = _current_span.get()
+        # A span left over in an inherited context (e.g. a timer task created inside it)
+        # has already finished and mustn't adopt new children
+        self.parent = parent if parent is not None and not parent.closed and parent.trace is trace else None
+        self.players: set = set()
+        self.discord_calls = 0
+        self.discord_seconds = 0.0
+        self.closed = False
+        self._token = None
+        self._started = 0.0
+        self._started_wall = 0.0
+
+    def add_players(self, player_ids: Iterable[int]):
+        self.players.update(player_ids)
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def record_discord_call(self, seconds: float):
+        span = self
+        while span is not None:
+            span.discord_calls += 1
+            span.discord_seconds += seconds
+            span = span.parent
+
+    def __enter__(self):
+        self._started_wall = time.time()
+        self._started = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._started
+        self.closed = True
+        _current_span.reset(self._token)
+        entry = {
+            'game': self.trace.game_id,
+            'span': self.span_id,
+            'parent': self.parent.span_id if self.parent else None,
+            'name': self.name,
+            'start': round(self._started_wall, 6),
+            'ms': round(duration * 1000, 3),
+            'discord_calls': self.discord_calls,
+            'discord_ms': round(self.discord_seconds * 1000, 3),
+            'players': sorted(self.players),
+        }
+        if exc_type is not None:
+            entry['error'] = f"{exc_type.__name__}: {exc}"
+        if self.attrs:
+            entry['attrs'] = self.attrs
+        self.trace.record(entry)
+        if self.parent is None:
+            self.trace.flush()
+        return False
+
+
+class GameTracer:
+    """Starts a trace for a sampled fraction of games and hands out spans"""
+
+    def __init__(self, directory: str = 'traces', sample_rate: float = 0.0, rng: Optional[random.Random] = None):
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"Trace sample rate must be between 0 and 1, got {sample_rate}")
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.rng = rng or random.Random()
+        self.trace: Optional[GameTrace] = None
+
+    def begin_game(self, game_id: str, **attrs) -> bool:
+        """Start tracing a new game if it is sampled; returns whether it is"""
+        self.end_game()
+        if self.sample_rate <= 0 or self.rng.random() >= self.sample_rate:
+            return False
+        self.trace = GameTrace(game_id, os.path.join(self.directory, f"{game_id}.jsonl"))
+        with self.span('game_begin', **attrs):
+            pass
+        return True
+
+    def end_game(self, **attrs):
+        trace, self.trace = self.trace, None
+        if trace is None:
+            return
+        trace.record({'game': trace.game_id, 'name': 'game_end', 'start': round(time.time(), 6),
+                      'spans': trace.next_span_id, **attrs})
+        trace.flush()
+
+    def span(self, name: str, **attrs):
+        if self.trace is None:
+            return NULL_SPAN
+        return Span(self.trace, name, attrs)
+
+    def traced(self, name: Optional[str] = None):
+        """Decorator running a coroutine function inside a span"""
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return await func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+def current_span():
+    """The innermost open span of this task, or a no-op span"""
+    span = _current_span.get()
+    return span if span is not None and not span.closed else NULL_SPAN
+
+
+def instrument_http(http_client):
+    """Attribute every Discord REST request to the span that awaited it"""
+    original = http_client.request
+    if getattr(original, '_werewolf_traced', False):
+        return
+
+    @functools.wraps(original)
+    async def request(*args, **kwargs):
+        span = _current_span.get()
+        if span is None or span.closed:
+            return await original(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return await original(*args, **kwargs)
+        finally:
+            span.record_discord_call(time.perf_counter() - started)
+
+    request._werewolf_traced = True
+    http_client.request = request